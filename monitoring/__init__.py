@@ -32,35 +32,59 @@ Decorators:
         pass
 """
 
-from .error_handler import (
+import importlib
+import threading
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .error_handler import KaspaPipelineErrorHandler, KaspaPipelineLogger
+
+# Public names and the submodule that defines them. They are imported on first
+# attribute access (PEP 562) so `import monitoring` stays cheap for callers
+# that only need part of the package.
+_LAZY_IMPORTS = {
     # Main classes
-    KaspaPipelineLogger,
-    KaspaPipelineErrorHandler,
-    NotificationService,
-    PipelineValidator,
+    "KaspaPipelineLogger": ".error_handler",
+    "KaspaPipelineErrorHandler": ".error_handler",
+    "NotificationService": ".error_handler",
+    "PipelineValidator": ".error_handler",
     # Data classes
-    ErrorDetails,
-    ErrorSeverity,
-    ErrorCategory,
-    ValidationResult,
-    PipelineHealth,
-    PerformanceMetrics,
-    NotificationConfig,
-    NotificationChannel,
+    "ErrorDetails": ".error_handler",
+    "ErrorSeverity": ".error_handler",
+    "ErrorCategory": ".error_handler",
+    "ValidationResult": ".error_handler",
+    "PipelineHealth": ".error_handler",
+    "PerformanceMetrics": ".error_handler",
+    "NotificationConfig": ".error_handler",
+    "NotificationChannel": ".error_handler",
     # Utility functions
-    retry_on_failure,
-    run_with_monitoring,
-    setup_monitoring_from_env,
-    create_pipeline_logger,
-    create_error_handler,
-    create_validator,
-)
-
-from .config import (
-    MonitoringConfig,
-    load_monitoring_config,
-    create_example_env_file,
-)
+    "retry_on_failure": ".error_handler",
+    "run_with_monitoring": ".error_handler",
+    "setup_monitoring_from_env": ".error_handler",
+    "create_pipeline_logger": ".error_handler",
+    "create_error_handler": ".error_handler",
+    "create_validator": ".error_handler",
+    # Configuration
+    "MonitoringConfig": ".config",
+    "load_monitoring_config": ".config",
+    "create_example_env_file": ".config",
+}
+
+
+def __getattr__(name: str):
+    """Import public names from their submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Version and metadata
 __version__ = "1.0.0"
@@ -93,6 +117,8 @@ __all__ = [
     "create_validator",
     "load_monitoring_config",
     "create_example_env_file",
+    "get_or_create_monitoring",
+    "reset_monitoring",
     # Metadata
     "__version__",
     "__author__",
@@ -100,6 +126,47 @@ __all__ = [
 ]
 
 
+# Shared (logger, error_handler) pair for the convenience helpers below
+_MONITORING_SINGLETON: Optional[
+    Tuple["KaspaPipelineLogger", "KaspaPipelineErrorHandler"]
+] = None
+_SINGLETON_LOCK = threading.Lock()
+
+
+def get_or_create_monitoring() -> (
+    Tuple["KaspaPipelineLogger", "KaspaPipelineErrorHandler"]
+):
+    """
+    Get the process-wide monitoring pair, creating it from the environment once.
+
+    Returns:
+        Tuple of (logger, error_handler)
+    """
+    global _MONITORING_SINGLETON
+
+    if _MONITORING_SINGLETON is None:
+        with _SINGLETON_LOCK:
+            if _MONITORING_SINGLETON is None:
+                from .error_handler import setup_monitoring_from_env
+
+                _MONITORING_SINGLETON = setup_monitoring_from_env()
+    return _MONITORING_SINGLETON
+
+
+def reset_monitoring() -> None:
+    """Close and drop the shared monitoring pair so the next call rebuilds it."""
+    global _MONITORING_SINGLETON
+
+    with _SINGLETON_LOCK:
+        if _MONITORING_SINGLETON is not None:
+            # Stop the old pair's log listener, handlers and notification
+            # sender so they don't keep writing alongside the new pair
+            logger, error_handler = _MONITORING_SINGLETON
+            error_handler.close()
+            logger.close()
+        _MONITORING_SINGLETON = None
+
+
 # Module-level convenience functions
 def quick_setup(log_level: str = "INFO", enable_notifications: bool = False):
     """
@@ -119,7 +186,9 @@ def quick_setup(log_level: str = "INFO", enable_notifications: bool = False):
     if enable_notifications:
         os.environ["KASPA_NOTIFICATIONS_ENABLED"] = "true"
 
-    return setup_monitoring_from_env()
+    # The environment changed, so rebuild the shared pair
+    reset_monitoring()
+    return get_or_create_monitoring()
 
 
 def create_component_logger(component_name: str, log_level: str = "INFO"):
@@ -133,6 +202,8 @@ def create_component_logger(component_name: str, log_level: str = "INFO"):
     Returns:
         KaspaPipelineLogger instance
     """
+    from .error_handler import create_pipeline_logger
+
     return create_pipeline_logger(log_level=log_level, component=component_name)
 
 
@@ -141,24 +212,22 @@ def get_health_dashboard():
     Get a simple health dashboard for the pipeline.
 
     Returns:
-        Dictionary with health information
+        Read-only mapping with health information
     """
-    # This would need to be implemented with a global error handler
-    # or persistent storage to be truly useful
-    logger, error_handler = setup_monitoring_from_env()
+    # Reports on the shared error handler, so health recorded through
+    # quick_setup()/get_or_create_monitoring() is visible here
+    logger, error_handler = get_or_create_monitoring()
     return error_handler.get_health_report()
 
 
-# Initialize monitoring directories
+# Monitoring directories are created lazily by the writers that need them
+# (log file handler, file notifications), so importing the package does not
+# touch the filesystem. Call this to create the full layout up front.
 def _ensure_monitoring_directories():
     """Ensure monitoring directories exist."""
-    from pathlib import Path
+    from .error_handler import _ensure_dir
 
     directories = ["monitoring/logs", "monitoring/reports", "monitoring/alerts"]
 
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-
-
-# Initialize on import
-_ensure_monitoring_directories()
+        _ensure_dir(directory)
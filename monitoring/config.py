@@ -5,105 +5,242 @@ This module provides configuration management for the monitoring, logging,
 and alerting systems with environment variable support and sensible defaults.
 """
 
+import logging
 import os
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from pathlib import Path
 
-from .error_handler import NotificationConfig, NotificationChannel, ErrorSeverity
+from .error_handler import (
+    NotificationConfig,
+    NotificationChannel,
+    ErrorSeverity,
+    make_log_formatter,
+    DEFAULT_LOG_FORMAT,
+)
+
+logger = logging.getLogger(__name__)
+
+# Lookup tables used while parsing and validating the environment
+_SEVERITY_MAP = {
+    "critical": ErrorSeverity.CRITICAL,
+    "high": ErrorSeverity.HIGH,
+    "medium": ErrorSeverity.MEDIUM,
+    "low": ErrorSeverity.LOW,
+    "info": ErrorSeverity.INFO,
+}
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+# Numeric bounds checked by validate_config(): (attribute, min, max, message)
+_RANGE_CHECKS = (
+    (
+        "health_check_interval",
+        60,
+        float("inf"),
+        "Health check interval should be at least 60 seconds",
+    ),
+    (
+        "performance_sampling_rate",
+        0.0,
+        1.0,
+        "Performance sampling rate must be between 0.0 and 1.0",
+    ),
+)
+
+# Log file used when file logging is on but KASPA_LOG_FILE is unset
+_DEFAULT_LOG_DIR = Path("monitoring/logs")
+_DEFAULT_LOG_FILE = str(_DEFAULT_LOG_DIR / "kaspa_pipeline.log")
+
+
+def _env_str(env: Mapping[str, str], key: str, default: str = "") -> str:
+    """Read a string setting from an environment snapshot."""
+    return env.get(key, default)
+
+
+def _env_bool(env: Mapping[str, str], key: str, default: bool = False) -> bool:
+    """Read a boolean setting (true/1/yes/on) from an environment snapshot."""
+    value = env.get(key)
+    if value is None:
+        return default
+    return value.lower() in _TRUTHY
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an integer setting from an environment snapshot."""
+    value = env.get(key)
+    return default if value is None else int(value)
+
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    """Read a float setting from an environment snapshot."""
+    value = env.get(key)
+    return default if value is None else float(value)
 
 
 class MonitoringConfig:
     """Configuration for the entire monitoring system."""
 
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access
+    __slots__ = (
+        # Logging
+        "log_level",
+        "log_file",
+        "enable_console_logging",
+        "enable_file_logging",
+        "log_queue_size",
+        "log_format",
+        "log_formatter",
+        # Health and performance monitoring
+        "health_check_interval",
+        "component_timeout",
+        "max_error_history",
+        "heap_stats_every_n",
+        "health_log_flush_ms",
+        "enable_performance_tracking",
+        "performance_sampling_rate",
+        # Notifications
+        "notification_queue_size",
+        "notification_config",
+        # Retry and validation
+        "default_max_retries",
+        "default_backoff_factor",
+        "retry_timeout",
+        "strict_validation",
+        "validation_timeout",
+        # Internal state and caches
+        "_env",
+        "_channel_values",
+        "_severity_values",
+        "_component_cache",
+        "_config_dict",
+        "_validation_issues",
+    )
+
     def __init__(self):
         """Initialize configuration from environment variables."""
+        # Snapshot the environment once; every setting below reads from it
+        self._env: Dict[str, str] = dict(os.environ)
+        env = self._env
+
         # Logging configuration
-        self.log_level = os.getenv("KASPA_LOG_LEVEL", "INFO").upper()
-        self.log_file = os.getenv("KASPA_LOG_FILE")
-        self.enable_console_logging = (
-            os.getenv("KASPA_CONSOLE_LOGGING", "true").lower() == "true"
-        )
-        self.enable_file_logging = (
-            os.getenv("KASPA_FILE_LOGGING", "true").lower() == "true"
-        )
+        self.log_level = _env_str(env, "KASPA_LOG_LEVEL", "INFO").upper()
+        self.log_file = env.get("KASPA_LOG_FILE")
+        self.enable_console_logging = _env_bool(env, "KASPA_CONSOLE_LOGGING", True)
+        self.enable_file_logging = _env_bool(env, "KASPA_FILE_LOGGING", True)
+        self.log_queue_size = _env_int(env, "KASPA_LOG_QUEUE_SIZE", 65536)
+        self.log_format = _env_str(env, "KASPA_LOG_FORMAT", DEFAULT_LOG_FORMAT)
+        self.log_formatter = make_log_formatter(self.log_format)
 
         # Default log file if file logging is enabled but no file specified
         if self.enable_file_logging and not self.log_file:
-            log_dir = Path("monitoring/logs")
-            log_dir.mkdir(exist_ok=True)
-            self.log_file = str(log_dir / "kaspa_pipeline.log")
+            # The directory is created by the file handler when it opens the log
+            self.log_file = _DEFAULT_LOG_FILE
 
         # Health monitoring configuration
-        self.health_check_interval = int(
-            os.getenv("KASPA_HEALTH_CHECK_INTERVAL", "300")
+        self.health_check_interval = _env_int(
+            env, "KASPA_HEALTH_CHECK_INTERVAL", 300
         )  # 5 minutes
-        self.component_timeout = int(
-            os.getenv("KASPA_COMPONENT_TIMEOUT", "1800")
+        self.component_timeout = _env_int(
+            env, "KASPA_COMPONENT_TIMEOUT", 1800
         )  # 30 minutes
-        self.max_error_history = int(os.getenv("KASPA_MAX_ERROR_HISTORY", "1000"))
+        self.max_error_history = _env_int(env, "KASPA_MAX_ERROR_HISTORY", 1000)
+        self.heap_stats_every_n = _env_int(env, "KASPA_HEAP_STATS_EVERY_N", 60)
+        self.health_log_flush_ms = _env_int(env, "KASPA_HEALTH_LOG_FLUSH_MS", 100)
 
         # Performance monitoring
-        self.enable_performance_tracking = (
-            os.getenv("KASPA_PERFORMANCE_TRACKING", "true").lower() == "true"
+        self.enable_performance_tracking = _env_bool(
+            env, "KASPA_PERFORMANCE_TRACKING", True
         )
-        self.performance_sampling_rate = float(
-            os.getenv("KASPA_PERFORMANCE_SAMPLING", "1.0")
+        self.performance_sampling_rate = _env_float(
+            env, "KASPA_PERFORMANCE_SAMPLING", 1.0
         )  # 100% by default
 
-        # Notification configuration
-        self.notification_config = self._create_notification_config()
+        # Pending notifications buffered for background delivery (0 = inline)
+        self.notification_queue_size = _env_int(
+            env, "KASPA_NOTIFICATION_QUEUE_SIZE", 4096
+        )
+
+        # Notification configuration (also fills the display tuples below)
+        self._channel_values: Tuple[str, ...] = ()
+        self._severity_values: Tuple[str, ...] = ()
+        self.notification_config = self._create_notification_config(env)
 
         # Retry configuration
-        self.default_max_retries = int(os.getenv("KASPA_MAX_RETRIES", "3"))
-        self.default_backoff_factor = float(os.getenv("KASPA_BACKOFF_FACTOR", "2.0"))
-        self.retry_timeout = int(
-            os.getenv("KASPA_RETRY_TIMEOUT", "300")
+        self.default_max_retries = _env_int(env, "KASPA_MAX_RETRIES", 3)
+        self.default_backoff_factor = _env_float(env, "KASPA_BACKOFF_FACTOR", 2.0)
+        self.retry_timeout = _env_int(
+            env, "KASPA_RETRY_TIMEOUT", 300
         )  # 5 minutes total retry time
 
         # Validation configuration
-        self.strict_validation = (
-            os.getenv("KASPA_STRICT_VALIDATION", "false").lower() == "true"
-        )
-        self.validation_timeout = int(
-            os.getenv("KASPA_VALIDATION_TIMEOUT", "60")
+        self.strict_validation = _env_bool(env, "KASPA_STRICT_VALIDATION", False)
+        self.validation_timeout = _env_int(
+            env, "KASPA_VALIDATION_TIMEOUT", 60
         )  # 1 minute
 
-    def _create_notification_config(self) -> Optional[NotificationConfig]:
+        # Per-component overrides, resolved on first request
+        self._component_cache: Dict[str, Mapping[str, Any]] = {}
+
+        # Built by to_dict() and validate_config() on first use
+        self._config_dict: Optional[Mapping[str, Any]] = None
+        self._validation_issues: Optional[List[str]] = None
+
+    def reload_config(self) -> None:
+        """Re-read all settings from the current environment."""
+        self.__init__()
+
+    def _create_notification_config(
+        self, env: Mapping[str, str]
+    ) -> Optional[NotificationConfig]:
         """Create notification configuration from environment variables."""
-        if not self._is_notifications_enabled():
+        if not self._is_notifications_enabled(env):
             return None
 
-        channels = self._get_notification_channels()
+        channels = self._get_notification_channels(env)
+        severities = self._get_notification_severities(env)
+        self._channel_values = tuple(c.value for c in channels)
+        self._severity_values = tuple(s.value for s in severities)
 
         config = NotificationConfig(
             enabled=True,
             channels=channels,
-            # Email configuration
-            email_smtp_host=os.getenv("KASPA_SMTP_HOST", "smtp.gmail.com"),
-            email_smtp_port=int(os.getenv("KASPA_SMTP_PORT", "587")),
-            email_username=os.getenv("KASPA_EMAIL_USERNAME", ""),
-            email_password=os.getenv("KASPA_EMAIL_PASSWORD", ""),
-            email_from=os.getenv("KASPA_EMAIL_FROM", ""),
-            email_to=self._parse_email_list(os.getenv("KASPA_EMAIL_TO", "")),
-            # Webhook configuration
-            webhook_url=os.getenv("KASPA_WEBHOOK_URL", ""),
-            webhook_headers=self._parse_webhook_headers(),
             # Notification thresholds
-            notify_on_severities=self._get_notification_severities(),
+            notify_on_severities=severities,
             # Rate limiting
-            max_notifications_per_hour=int(
-                os.getenv("KASPA_MAX_NOTIFICATIONS_HOUR", "10")
+            max_notifications_per_hour=_env_int(
+                env, "KASPA_MAX_NOTIFICATIONS_HOUR", 10
             ),
-            cooldown_period_minutes=int(os.getenv("KASPA_NOTIFICATION_COOLDOWN", "15")),
+            cooldown_period_minutes=_env_int(env, "KASPA_NOTIFICATION_COOLDOWN", 15),
+            # Background delivery
+            queue_size=self.notification_queue_size,
         )
 
+        # Only parse settings for channels that are actually enabled
+        if NotificationChannel.EMAIL in channels:
+            config.email_smtp_host = _env_str(env, "KASPA_SMTP_HOST", "smtp.gmail.com")
+            config.email_smtp_port = _env_int(env, "KASPA_SMTP_PORT", 587)
+            config.email_username = _env_str(env, "KASPA_EMAIL_USERNAME")
+            config.email_password = _env_str(env, "KASPA_EMAIL_PASSWORD")
+            config.email_from = _env_str(env, "KASPA_EMAIL_FROM")
+            config.email_to = self._parse_email_list(_env_str(env, "KASPA_EMAIL_TO"))
+
+        if NotificationChannel.WEBHOOK in channels:
+            config.webhook_url = _env_str(env, "KASPA_WEBHOOK_URL")
+            config.webhook_headers = self._parse_webhook_headers(env)
+            config.webhook_batch = _env_bool(env, "KASPA_WEBHOOK_BATCH", True)
+            config.webhook_flush_ms = _env_int(env, "KASPA_WEBHOOK_FLUSH_MS", 2000)
+
         return config
 
-    def _is_notifications_enabled(self) -> bool:
+    def _is_notifications_enabled(self, env: Mapping[str, str]) -> bool:
         """Check if notifications are enabled."""
-        return os.getenv("KASPA_NOTIFICATIONS_ENABLED", "false").lower() == "true"
+        return _env_bool(env, "KASPA_NOTIFICATIONS_ENABLED", False)
 
-    def _get_notification_channels(self) -> List[NotificationChannel]:
+    def _get_notification_channels(
+        self, env: Mapping[str, str]
+    ) -> List[NotificationChannel]:
         """Get configured notification channels."""
         channels = []
 
@@ -115,16 +252,15 @@ class MonitoringConfig:
 
         # Email notifications (if configured)
         if (
-            os.getenv("KASPA_EMAIL_USERNAME")
-            and os.getenv("KASPA_EMAIL_TO")
-            and os.getenv("KASPA_EMAIL_ENABLED", "false").lower() == "true"
+            env.get("KASPA_EMAIL_USERNAME")
+            and env.get("KASPA_EMAIL_TO")
+            and _env_bool(env, "KASPA_EMAIL_ENABLED", False)
         ):
             channels.append(NotificationChannel.EMAIL)
 
         # Webhook notifications (if configured)
-        if (
-            os.getenv("KASPA_WEBHOOK_URL")
-            and os.getenv("KASPA_WEBHOOK_ENABLED", "false").lower() == "true"
+        if env.get("KASPA_WEBHOOK_URL") and _env_bool(
+            env, "KASPA_WEBHOOK_ENABLED", False
         ):
             channels.append(NotificationChannel.WEBHOOK)
 
@@ -134,43 +270,38 @@ class MonitoringConfig:
         """Parse comma-separated email list."""
         if not email_string:
             return []
-        return [email.strip() for email in email_string.split(",") if email.strip()]
+        return [email for email in map(str.strip, email_string.split(",")) if email]
 
-    def _parse_webhook_headers(self) -> dict:
+    def _parse_webhook_headers(self, env: Mapping[str, str]) -> dict:
         """Parse webhook headers from environment."""
         headers = {}
 
         # Parse KASPA_WEBHOOK_HEADERS in format "key1:value1,key2:value2"
-        headers_string = os.getenv("KASPA_WEBHOOK_HEADERS", "")
+        headers_string = _env_str(env, "KASPA_WEBHOOK_HEADERS")
         if headers_string:
             for header_pair in headers_string.split(","):
-                if ":" in header_pair:
-                    key, value = header_pair.split(":", 1)
+                key, sep, value = header_pair.partition(":")
+                if sep:
                     headers[key.strip()] = value.strip()
 
         # Add content type if not specified
-        if "Content-Type" not in headers:
-            headers["Content-Type"] = "application/json"
+        headers.setdefault("Content-Type", "application/json")
 
         return headers
 
-    def _get_notification_severities(self) -> List[ErrorSeverity]:
+    def _get_notification_severities(
+        self, env: Mapping[str, str]
+    ) -> List[ErrorSeverity]:
         """Get severities that should trigger notifications."""
-        severity_string = os.getenv("KASPA_NOTIFICATION_SEVERITIES", "critical,high")
-        severities = []
-
-        severity_map = {
-            "critical": ErrorSeverity.CRITICAL,
-            "high": ErrorSeverity.HIGH,
-            "medium": ErrorSeverity.MEDIUM,
-            "low": ErrorSeverity.LOW,
-            "info": ErrorSeverity.INFO,
-        }
+        severity_string = _env_str(
+            env, "KASPA_NOTIFICATION_SEVERITIES", "critical,high"
+        )
+        requested = set(map(str.strip, severity_string.lower().split(",")))
 
-        for severity_name in severity_string.lower().split(","):
-            severity_name = severity_name.strip()
-            if severity_name in severity_map:
-                severities.append(severity_map[severity_name])
+        # Walk the fixed map so the result is ordered by severity and deduplicated
+        severities = [
+            severity for name, severity in _SEVERITY_MAP.items() if name in requested
+        ]
 
         # Default to critical and high if nothing configured
         if not severities:
@@ -178,32 +309,45 @@ class MonitoringConfig:
 
         return severities
 
-    def get_component_config(self, component_name: str) -> dict:
-        """Get component-specific configuration."""
+    def get_component_config(self, component_name: str) -> Mapping[str, Any]:
+        """Get component-specific configuration as a read-only mapping."""
+        cached = self._component_cache.get(component_name)
+        if cached is not None:
+            return cached
+
         # Component-specific overrides
         prefix = f"KASPA_{component_name.upper()}_"
+        env = self._env
 
-        return {
-            "max_retries": int(
-                os.getenv(f"{prefix}MAX_RETRIES", str(self.default_max_retries))
-            ),
-            "backoff_factor": float(
-                os.getenv(f"{prefix}BACKOFF_FACTOR", str(self.default_backoff_factor))
-            ),
-            "timeout": int(os.getenv(f"{prefix}TIMEOUT", str(self.component_timeout))),
-            "log_level": os.getenv(f"{prefix}LOG_LEVEL", self.log_level),
-            "enabled": os.getenv(f"{prefix}ENABLED", "true").lower() == "true",
-        }
+        component_config = MappingProxyType(
+            {
+                "max_retries": _env_int(
+                    env, f"{prefix}MAX_RETRIES", self.default_max_retries
+                ),
+                "backoff_factor": _env_float(
+                    env, f"{prefix}BACKOFF_FACTOR", self.default_backoff_factor
+                ),
+                "timeout": _env_int(env, f"{prefix}TIMEOUT", self.component_timeout),
+                "log_level": _env_str(env, f"{prefix}LOG_LEVEL", self.log_level),
+                "enabled": _env_bool(env, f"{prefix}ENABLED", True),
+            }
+        )
+        self._component_cache[component_name] = component_config
+        return component_config
 
     def validate_config(self) -> List[str]:
         """Validate configuration and return list of issues."""
+        # Settings are fixed until reload_config(), so validate only once
+        if self._validation_issues is not None:
+            return list(self._validation_issues)
+
         issues = []
 
         # Validate log level
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level not in valid_log_levels:
+        if self.log_level not in _VALID_LOG_LEVELS:
             issues.append(
-                f"Invalid log level: {self.log_level}. Must be one of {valid_log_levels}"
+                f"Invalid log level: {self.log_level}. "
+                f"Must be one of {list(_LOG_LEVELS)}"
             )
 
         # Validate log file path if specified
@@ -233,42 +377,48 @@ class MonitoringConfig:
                     )
 
         # Validate numeric ranges
-        if self.health_check_interval < 60:
-            issues.append("Health check interval should be at least 60 seconds")
-
-        if self.performance_sampling_rate < 0 or self.performance_sampling_rate > 1:
-            issues.append("Performance sampling rate must be between 0.0 and 1.0")
-
-        return issues
-
-    def to_dict(self) -> dict:
-        """Convert configuration to dictionary for logging/debugging."""
-        return {
+        for attribute, low, high, message in _RANGE_CHECKS:
+            value = getattr(self, attribute)
+            if value < low or value > high:
+                issues.append(message)
+
+        self._validation_issues = issues
+        return list(issues)
+
+    def to_dict(self) -> Mapping[str, Any]:
+        """
+        Convert configuration to a read-only mapping for logging/debugging.
+
+        The mapping is built once and shared between calls; reload_config()
+        discards it. Use dict(...) or json.dumps(..., default=dict) when a
+        plain dictionary is needed.
+        """
+        if self._config_dict is not None:
+            return self._config_dict
+
+        sections = {
             "logging": {
                 "log_level": self.log_level,
                 "log_file": self.log_file,
                 "console_logging": self.enable_console_logging,
                 "file_logging": self.enable_file_logging,
+                "log_queue_size": self.log_queue_size,
+                "log_format": self.log_format,
             },
             "monitoring": {
                 "health_check_interval": self.health_check_interval,
                 "component_timeout": self.component_timeout,
                 "max_error_history": self.max_error_history,
+                "heap_stats_every_n": self.heap_stats_every_n,
+                "health_log_flush_ms": self.health_log_flush_ms,
                 "performance_tracking": self.enable_performance_tracking,
                 "performance_sampling_rate": self.performance_sampling_rate,
             },
             "notifications": {
                 "enabled": self.notification_config is not None,
-                "channels": (
-                    [c.value for c in self.notification_config.channels]
-                    if self.notification_config
-                    else []
-                ),
-                "severities": (
-                    [s.value for s in self.notification_config.notify_on_severities]
-                    if self.notification_config
-                    else []
-                ),
+                "channels": self._channel_values,
+                "severities": self._severity_values,
+                "queue_size": self.notification_queue_size,
             },
             "retry": {
                 "max_retries": self.default_max_retries,
@@ -280,6 +430,10 @@ class MonitoringConfig:
                 "validation_timeout": self.validation_timeout,
             },
         }
+        self._config_dict = MappingProxyType(
+            {name: MappingProxyType(values) for name, values in sections.items()}
+        )
+        return self._config_dict
 
 
 def load_monitoring_config() -> MonitoringConfig:
@@ -289,16 +443,16 @@ def load_monitoring_config() -> MonitoringConfig:
     # Validate configuration
     issues = config.validate_config()
     if issues:
-        print("Configuration warnings:")
-        for issue in issues:
-            print(f"  - {issue}")
+        logger.warning(
+            "Configuration warnings:\n%s",
+            "\n".join(f"  - {issue}" for issue in issues),
+        )
 
     return config
 
 
-def create_example_env_file(filename: str = "monitoring/.env.example") -> None:
-    """Create an example environment file with all monitoring configuration options."""
-    example_content = """# Kaspa Pipeline Monitoring Configuration
+# Contents written by create_example_env_file()
+_EXAMPLE_ENV_CONTENT = """# Kaspa Pipeline Monitoring Configuration
 
 # === LOGGING CONFIGURATION ===
 # Log level: DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -311,6 +465,13 @@ KASPA_LOG_FILE=monitoring/logs/kaspa_pipeline.log
 KASPA_CONSOLE_LOGGING=true
 KASPA_FILE_LOGGING=true
 
+# Log records buffered for the background log writer (0 = write inline)
+KASPA_LOG_QUEUE_SIZE=65536
+
+# Log record layout (str.format fields from logging.LogRecord),
+# or "json" for one JSON object per line
+# KASPA_LOG_FORMAT={asctime} - {name} - {levelname} - {message}
+
 # === HEALTH MONITORING ===
 # Health check interval in seconds
 KASPA_HEALTH_CHECK_INTERVAL=300
@@ -321,6 +482,12 @@ KASPA_COMPONENT_TIMEOUT=1800
 # Maximum error history to keep
 KASPA_MAX_ERROR_HISTORY=1000
 
+# Refresh memory/disk stats in the health report every N reports
+KASPA_HEAP_STATS_EVERY_N=60
+
+# Log component health at most once per window in milliseconds (0 = every update)
+KASPA_HEALTH_LOG_FLUSH_MS=100
+
 # === PERFORMANCE MONITORING ===
 # Enable performance tracking
 KASPA_PERFORMANCE_TRACKING=true
@@ -339,6 +506,9 @@ KASPA_NOTIFICATION_SEVERITIES=critical,high
 KASPA_MAX_NOTIFICATIONS_HOUR=10
 KASPA_NOTIFICATION_COOLDOWN=15
 
+# Pending notifications buffered for background delivery (0 = send inline)
+KASPA_NOTIFICATION_QUEUE_SIZE=4096
+
 # === EMAIL NOTIFICATIONS ===
 KASPA_EMAIL_ENABLED=false
 KASPA_SMTP_HOST=smtp.gmail.com
@@ -353,6 +523,10 @@ KASPA_WEBHOOK_ENABLED=false
 KASPA_WEBHOOK_URL=https://hooks.slack.com/services/YOUR/WEBHOOK/URL
 KASPA_WEBHOOK_HEADERS=Authorization:Bearer token,X-Custom-Header:value
 
+# Send queued webhook notifications as one {"events": [...]} POST per window
+KASPA_WEBHOOK_BATCH=true
+KASPA_WEBHOOK_FLUSH_MS=2000
+
 # === RETRY CONFIGURATION ===
 # Default retry settings
 KASPA_MAX_RETRIES=3
@@ -373,11 +547,26 @@ KASPA_VALIDATION_TIMEOUT=60
 # KASPA_DATA_LOADER_LOG_LEVEL=DEBUG
 """
 
+
+def create_example_env_file(filename: str = "monitoring/.env.example") -> None:
+    """Create an example environment file with all monitoring configuration options."""
+    target = Path(filename)
+    payload = _EXAMPLE_ENV_CONTENT.encode("utf-8")
+
+    # Leave the file (and its mtime) alone if it is already up to date
+    try:
+        if target.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+
     # Create the monitoring directory if it doesn't exist
-    Path(filename).parent.mkdir(exist_ok=True)
+    target.parent.mkdir(exist_ok=True)
 
-    with open(filename, "w") as f:
-        f.write(example_content)
+    # Write to a temporary file and swap it in so readers never see a partial file
+    tmp_path = target.with_name(target.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, target)
 
 
 if __name__ == "__main__":
@@ -390,4 +579,4 @@ if __name__ == "__main__":
     print("\nCurrent Configuration:")
     import json
 
-    print(json.dumps(config.to_dict(), indent=2))
+    print(json.dumps(config.to_dict(), indent=2, default=dict))
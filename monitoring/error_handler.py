@@ -6,27 +6,238 @@ for the entire Kaspa Knowledge Pipeline, including retry mechanisms, structured
 error reporting, pipeline health monitoring, performance tracking, and alerting.
 """
 
+import atexit
+import array
+import codecs
 import logging
+import queue
+import shutil
+import string
 import sys
+import threading
 import traceback
-import smtplib
 import json
 import time
 import os
+from collections import Counter, deque
+from itertools import islice
+from operator import attrgetter
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import (
+    Dict,
+    Deque,
+    List,
+    Mapping,
+    Optional,
+    Any,
+    Callable,
+    TextIO,
+    Tuple,
+    Union,
+)
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from functools import wraps
+from types import MappingProxyType
 try:
-    from email.mime.text import MimeText
-    from email.mime.multipart import MimeMultipart
+    from email.mime.text import MIMEText as MimeText
+    from email.mime.multipart import MIMEMultipart as MimeMultipart
 except ImportError:
     # Python 3.13+ compatibility
     from email.message import EmailMessage as MimeText
     from email.message import EmailMessage as MimeMultipart
 
+try:
+    import orjson
+except ImportError:
+    # Optional faster encoder; fall back to the standard library
+    orjson = None
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, default=str, indent=2 if indent else None).encode("utf-8")
+
+
+# Directories already created (or confirmed to exist) by this process
+_CREATED_DIRS = set()
+
+
+# Default record layout for pipeline loggers (str.format fields)
+DEFAULT_LOG_FORMAT = "{asctime} - {name} - {levelname} - {message}"
+
+
+class FastFormatter(logging.Formatter):
+    """
+    Log formatter for str.format-style templates that is parsed once.
+
+    The template's field names are extracted up front, so formatting a record
+    is a single format_map() over just those attributes.
+    """
+
+    def __init__(self, fmt: str = DEFAULT_LOG_FORMAT, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt, style="{")
+        self._template = fmt
+        self._fields = tuple(
+            {
+                field_name.split(".")[0].split("[")[0]
+                for _, field_name, _, _ in string.Formatter().parse(fmt)
+                if field_name
+            }
+        )
+        self._needs_asctime = "asctime" in self._fields
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record using the pre-parsed template."""
+        record.message = record.getMessage()
+        if self._needs_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
+        values = record.__dict__
+        text = self._template.format_map(
+            {name: values.get(name) for name in self._fields}
+        )
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            text = f"{text}\n{record.exc_text}"
+        if record.stack_info:
+            text = f"{text}\n{self.formatStack(record.stack_info)}"
+        return text
+
+
+# log_format value that selects JSON lines instead of a text template
+JSON_LOG_FORMAT = "json"
+
+# Structured fields passed via extra= that JSON records carry
+_JSON_EXTRA_FIELDS = (
+    "component",
+    "error_id",
+    "severity",
+    "category",
+    "event",
+    "stage",
+    "status",
+    "return_code",
+    "duration",
+    "command",
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Log formatter that writes one JSON object per record.
+
+    Structured fields supplied through extra= (component, error_id, severity,
+    category, and the stage event fields) are emitted as keys, so log files
+    can be parsed without scraping the message text.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the record and its structured extras in one pass."""
+        data = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        values = record.__dict__
+        for name in _JSON_EXTRA_FIELDS:
+            value = values.get(name)
+            if value is not None:
+                data[name] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return _dumps(data).decode("utf-8")
+
+
+def make_log_formatter(log_format: str = DEFAULT_LOG_FORMAT) -> logging.Formatter:
+    """Return the formatter for a log_format setting ("json" or a template)."""
+    if log_format.strip().lower() == JSON_LOG_FORMAT:
+        return JsonFormatter()
+    return FastFormatter(log_format)
+
+
+# Background log writers started by KaspaPipelineLogger, keyed by logger name
+_LOG_LISTENERS: Dict[str, QueueListener] = {}
+_LOG_LISTENERS_LOCK = threading.Lock()
+
+
+def _start_log_listener(name: str, listener: QueueListener) -> None:
+    """Start a log listener, replacing (and stopping) any previous one for name."""
+    with _LOG_LISTENERS_LOCK:
+        if not _LOG_LISTENERS:
+            atexit.register(_stop_log_listeners)
+        previous = _LOG_LISTENERS.pop(name, None)
+        if previous is not None:
+            previous.stop()
+        listener.start()
+        _LOG_LISTENERS[name] = listener
+
+
+def _stop_log_listener(name: str, listener: QueueListener) -> None:
+    """Stop listener and forget it, unless name has since been given a new one."""
+    with _LOG_LISTENERS_LOCK:
+        if _LOG_LISTENERS.get(name) is listener:
+            del _LOG_LISTENERS[name]
+            listener.stop()
+
+
+def _stop_log_listeners() -> None:
+    """Flush and stop all background log writers."""
+    with _LOG_LISTENERS_LOCK:
+        for listener in _LOG_LISTENERS.values():
+            listener.stop()
+        _LOG_LISTENERS.clear()
+
+
+def _collect_resource_stats() -> Dict[str, Any]:
+    """Sample process memory and disk usage for the health report."""
+    stats: Dict[str, Any] = {"collected_at": datetime.now().isoformat()}
+
+    try:
+        import resource
+
+        # ru_maxrss is reported in KiB on Linux and in bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        stats["peak_memory_mb"] = round(max_rss / divisor, 1)
+    except (ImportError, OSError):
+        stats["peak_memory_mb"] = None
+
+    try:
+        usage = shutil.disk_usage(".")
+        stats["disk_free_gb"] = round(usage.free / 1024**3, 2)
+        stats["disk_used_percent"] = round(usage.used / usage.total * 100, 1)
+    except OSError:
+        stats["disk_free_gb"] = None
+        stats["disk_used_percent"] = None
+
+    return stats
+
+
+def _ensure_dir(directory) -> None:
+    """Create a monitoring directory on first use, at most once per process."""
+    key = str(directory)
+    if key in _CREATED_DIRS:
+        return
+    # A single stat is cheaper than a mkdir that fails with EEXIST
+    if not os.path.isdir(key):
+        os.makedirs(key, exist_ok=True)
+    _CREATED_DIRS.add(key)
+
 
 class ErrorSeverity(Enum):
     """Error severity levels for the pipeline."""
@@ -37,6 +248,29 @@ class ErrorSeverity(Enum):
     LOW = "low"  # Minor issues, no significant impact
     INFO = "info"  # Informational messages
 
+    @property
+    def bit(self) -> int:
+        """Bit flag for this severity, used in notification severity masks."""
+        return _SEVERITY_BITS[self]
+
+
+# One bit per severity: CRITICAL=1, HIGH=2, MEDIUM=4, LOW=8, INFO=16
+_SEVERITY_BITS = {severity: 1 << i for i, severity in enumerate(ErrorSeverity)}
+
+# Upper-case severity names used in alert headings and subjects
+_SEVERITY_LABELS = {severity: severity.value.upper() for severity in ErrorSeverity}
+
+# Severities that count as warnings against a component's health
+_HIGH_SEVERITIES = frozenset({ErrorSeverity.HIGH, ErrorSeverity.CRITICAL})
+
+
+def severity_mask(severities) -> int:
+    """Combine severities into a bitmask for O(1) membership checks."""
+    mask = 0
+    for severity in severities:
+        mask |= severity.bit
+    return mask
+
 
 class ErrorCategory(Enum):
     """Error category types for the entire pipeline."""
@@ -69,6 +303,38 @@ class ErrorCategory(Enum):
     AUTHENTICATION = "authentication"
 
 
+# Baseline fix-time estimates by severity
+_SEVERITY_FIX_TIMES = {
+    ErrorSeverity.CRITICAL: "1-2 hours",
+    ErrorSeverity.HIGH: "2-4 hours",
+    ErrorSeverity.MEDIUM: "4-8 hours",
+    ErrorSeverity.LOW: "1-2 days",
+    ErrorSeverity.INFO: "As needed",
+}
+
+# Categories whose fixes depend on systems outside the pipeline
+_COMPLEX_CATEGORIES = frozenset(
+    {
+        ErrorCategory.AI_PROCESSING,
+        ErrorCategory.GITHUB_API,
+        ErrorCategory.EXTERNAL_DEPENDENCY,
+    }
+)
+
+# Fix-time estimate for every (severity, category) pair, built once
+_FIX_TIMES = MappingProxyType(
+    {
+        (severity, category): (
+            f"{base_time} (potentially longer due to external dependencies)"
+            if category in _COMPLEX_CATEGORIES
+            else base_time
+        )
+        for severity, base_time in _SEVERITY_FIX_TIMES.items()
+        for category in ErrorCategory
+    }
+)
+
+
 class NotificationChannel(Enum):
     """Available notification channels."""
 
@@ -78,6 +344,57 @@ class NotificationChannel(Enum):
     WEBHOOK = "webhook"
 
 
+class _LazyTraceback:
+    """
+    Descriptor for ErrorDetails.traceback_info that renders on first read.
+
+    Assigning None defers formatting to the first access, which renders the
+    traceback of ErrorDetails.exception (or "" when there is none).
+    exception may be the exception itself or a TracebackException captured
+    from it.
+    """
+
+    def __set_name__(self, owner, name):
+        self._attr = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return ""  # dataclass default
+        value = instance.__dict__.get(self._attr)
+        if value is None:
+            source = instance.exception
+            if source is None:
+                value = ""
+            else:
+                if isinstance(source, BaseException):
+                    source = traceback.TracebackException.from_exception(source)
+                value = "".join(source.format())
+            instance.__dict__[self._attr] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._attr] = value
+
+
+# Human-readable alert shared by the console, file, email and webhook channels
+_ALERT_TEMPLATE = """\
+🚨 KASPA PIPELINE ALERT - {severity}
+
+Error ID: {error_id}
+Component: {component}
+Category: {category}
+Time: {time}
+
+Message: {message}
+
+Impact: {impact}
+Recovery: {recovery}
+
+Context: {context}"""
+
+_ERROR_DETAILS_CACHES = frozenset({"_dict_cache", "_alert_cache", "_error_key"})
+
+
 @dataclass
 class ErrorDetails:
     """Comprehensive error information for the pipeline."""
@@ -88,7 +405,7 @@ class ErrorDetails:
     category: ErrorCategory
     message: str
     exception_type: str
-    traceback_info: str
+    traceback_info: str = _LazyTraceback()  # type: ignore[assignment]
     context: Dict[str, Any] = field(default_factory=dict)
     component: str = "unknown"
     file_path: Optional[str] = None
@@ -98,8 +415,55 @@ class ErrorDetails:
     user_impact: str = "unknown"
     estimated_fix_time: Optional[str] = None
 
+    # Source exception (or a TracebackException captured from it), kept so
+    # traceback_info can be rendered on demand
+    exception: Optional[Union[BaseException, traceback.TracebackException]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    # Rendered outputs, shared by every notification channel
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _alert_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _error_key: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Intern the short, highly repetitive string fields."""
+        # error_history holds many errors sharing a few components and types
+        self.component = sys.intern(self.component)
+        self.exception_type = sys.intern(self.exception_type)
+        self.user_impact = sys.intern(self.user_impact)
+        if self.file_path is not None:
+            self.file_path = sys.intern(self.file_path)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning a field (e.g. retry_count) invalidates the rendered outputs.
+        # In-place changes to context are not tracked; treat it as read-only.
+        object.__setattr__(self, name, value)
+        if name not in _ERROR_DETAILS_CACHES:
+            object.__setattr__(self, "_dict_cache", None)
+            object.__setattr__(self, "_alert_cache", None)
+            object.__setattr__(self, "_error_key", None)
+
+    @property
+    def error_key(self) -> str:
+        """Rate-limiting key shared by errors of one component and category."""
+        if self._error_key is None:
+            self._error_key = f"{self.component}:{self.category.value}"
+        return self._error_key
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert error details to dictionary for logging."""
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "error_id": self.error_id,
             "timestamp": self.timestamp.isoformat(),
@@ -120,21 +484,24 @@ class ErrorDetails:
 
     def to_alert_message(self) -> str:
         """Convert error to human-readable alert message."""
-        return f"""
-🚨 KASPA PIPELINE ALERT - {self.severity.value.upper()}
-
-Error ID: {self.error_id}
-Component: {self.component}
-Category: {self.category.value}
-Time: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-
-Message: {self.message}
-
-Impact: {self.user_impact}
-Recovery: {self.recovery_action or 'No recovery action specified'}
-
-Context: {json.dumps(self.context, indent=2)}
-        """.strip()
+        if self._alert_cache is None:
+            self._alert_cache = self._build_alert_message()
+        return self._alert_cache
+
+    def _build_alert_message(self) -> str:
+        return _ALERT_TEMPLATE.format_map(
+            {
+                "severity": _SEVERITY_LABELS[self.severity],
+                "error_id": self.error_id,
+                "component": self.component,
+                "category": self.category.value,
+                "time": self.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                "message": self.message,
+                "impact": self.user_impact,
+                "recovery": self.recovery_action or "No recovery action specified",
+                "context": _dumps(self.context, indent=True).decode("utf-8"),
+            }
+        )
 
 
 @dataclass
@@ -149,9 +516,25 @@ class ValidationResult:
     checked_items: int = 0
     passed_checks: int = 0
 
+    # Maintained by add_error so severity checks do not rescan errors
+    critical_error_count: int = field(default=0, init=False)
+    high_error_count: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        """Count the severities of any errors passed to the constructor."""
+        for error in self.errors:
+            self._count_severity(error)
+
+    def _count_severity(self, error: ErrorDetails) -> None:
+        if error.severity is ErrorSeverity.CRITICAL:
+            self.critical_error_count += 1
+        elif error.severity is ErrorSeverity.HIGH:
+            self.high_error_count += 1
+
     def add_error(self, error: ErrorDetails) -> None:
         """Add an error to the validation result."""
         self.errors.append(error)
+        self._count_severity(error)
         self.is_valid = False
 
     def add_warning(self, warning: ErrorDetails) -> None:
@@ -160,7 +543,7 @@ class ValidationResult:
 
     def has_critical_errors(self) -> bool:
         """Check if there are any critical errors."""
-        return any(error.severity == ErrorSeverity.CRITICAL for error in self.errors)
+        return self.critical_error_count > 0
 
     def get_success_rate(self) -> float:
         """Calculate validation success rate."""
@@ -169,6 +552,10 @@ class ValidationResult:
         return self.passed_checks / self.checked_items
 
 
+# Execution times retained per component for latency percentiles
+SAMPLE_WINDOW = 4096
+
+
 @dataclass
 class PerformanceMetrics:
     """Performance monitoring metrics for pipeline components."""
@@ -191,6 +578,14 @@ class PerformanceMetrics:
     total_items_processed: int = 0
     items_per_second: float = 0.0
 
+    # Most recent execution times, kept in a fixed-size ring for percentiles
+    _samples: array.array = field(
+        default_factory=lambda: array.array("d", bytes(8 * SAMPLE_WINDOW)),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
     def update_metrics(
         self,
         execution_time: float,
@@ -199,6 +594,7 @@ class PerformanceMetrics:
         memory_usage: float = 0.0,
     ):
         """Update performance metrics with new execution data."""
+        self._samples[self.total_executions % SAMPLE_WINDOW] = execution_time
         self.total_executions += 1
         self.last_execution_time = execution_time
         self.total_execution_time += execution_time
@@ -211,7 +607,10 @@ class PerformanceMetrics:
         # Update time statistics
         self.min_execution_time = min(self.min_execution_time, execution_time)
         self.max_execution_time = max(self.max_execution_time, execution_time)
-        self.average_execution_time = self.total_execution_time / self.total_executions
+        # Incremental mean; avoids dividing two ever-growing sums
+        self.average_execution_time += (
+            execution_time - self.average_execution_time
+        ) / self.total_executions
 
         # Update resource usage
         if memory_usage > 0:
@@ -235,6 +634,16 @@ class PerformanceMetrics:
             return 0.0
         return (self.successful_executions / self.total_executions) * 100
 
+    def percentiles(self) -> Tuple[float, float, float]:
+        """Return p50/p95/p99 execution times over the recent sample window."""
+        count = min(self.total_executions, SAMPLE_WINDOW)
+        if count == 0:
+            return (0.0, 0.0, 0.0)
+        ordered = sorted(self._samples[:count])
+        return tuple(
+            ordered[min(count - 1, int(count * q))] for q in (0.50, 0.95, 0.99)
+        )
+
     def is_performing_well(self) -> bool:
         """Determine if component is performing within acceptable parameters."""
         success_rate = self.get_success_rate()
@@ -271,6 +680,14 @@ class PipelineHealth:
     # Performance tracking
     performance_metrics: Optional[PerformanceMetrics] = None
 
+    # Serialized health-check entry and the state it was rendered from
+    _snapshot_key: Optional[Tuple[datetime, bool, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _snapshot_bytes: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Initialize performance metrics if not provided."""
         if self.performance_metrics is None:
@@ -285,7 +702,8 @@ class PipelineHealth:
         memory_usage: float = 0.0,
     ):
         """Update comprehensive health metrics."""
-        self.last_check = datetime.now()
+        self.last_check = datetime.now()  # also the reference time for scoring
+        self._snapshot_bytes = None
 
         # Update performance metrics
         self.performance_metrics.update_metrics(
@@ -295,7 +713,7 @@ class PipelineHealth:
         # Update basic health indicators
         if is_success:
             self.consecutive_failures = 0
-            self.last_successful_run = datetime.now()
+            self.last_successful_run = self.last_check
             self.success_rate = min(1.0, self.success_rate + 0.1)
         else:
             self.consecutive_failures += 1
@@ -303,7 +721,7 @@ class PipelineHealth:
             self.error_count += 1
             if error:
                 self.last_error = error
-                if error.severity in [ErrorSeverity.HIGH, ErrorSeverity.CRITICAL]:
+                if error.severity in _HIGH_SEVERITIES:
                     self.warning_count += 1
 
         # Update average execution time
@@ -341,7 +759,7 @@ class PipelineHealth:
         recency_score = 10.0
         if self.last_successful_run:
             hours_since_success = (
-                datetime.now() - self.last_successful_run
+                self.last_check - self.last_successful_run
             ).total_seconds() / 3600
             if hours_since_success > 24:  # More than 24 hours
                 recency_score = max(0, 10 - (hours_since_success - 24) * 0.5)
@@ -359,6 +777,31 @@ class PipelineHealth:
             and self.error_count < 10
         )
 
+    def health_check_entry(self) -> Dict[str, Any]:
+        """Get this component's status and open issues for a health check."""
+        issues = []
+        if self.consecutive_failures >= 3:
+            issues.append(f"High consecutive failures: {self.consecutive_failures}")
+        if self.success_rate < 0.8:
+            issues.append(f"Low success rate: {self.success_rate:.1%}")
+        if self.average_execution_time > 300:  # 5 minutes
+            issues.append(f"High execution time: {self.average_execution_time:.1f}s")
+
+        return {
+            "status": "HEALTHY" if self.is_healthy else "UNHEALTHY",
+            "health_score": self.health_score,
+            "last_check": self.last_check.isoformat(),
+            "issues": issues,
+        }
+
+    def health_check_snapshot(self) -> bytes:
+        """Get health_check_entry() as JSON bytes, re-serialized only on change."""
+        key = (self.last_check, self.is_healthy, self.health_score)
+        if self._snapshot_bytes is None or self._snapshot_key != key:
+            self._snapshot_bytes = _dumps(self.health_check_entry())
+            self._snapshot_key = key
+        return self._snapshot_bytes
+
     def get_health_summary(self) -> Dict[str, Any]:
         """Get comprehensive health summary."""
         return {
@@ -385,6 +828,9 @@ class PipelineHealth:
                     "avg_execution_time": round(
                         self.performance_metrics.average_execution_time, 2
                     ),
+                    "p95_execution_time": round(
+                        self.performance_metrics.percentiles()[1], 2
+                    ),
                     "items_per_second": round(
                         self.performance_metrics.items_per_second, 2
                     ),
@@ -428,120 +874,385 @@ class NotificationConfig:
         15  # Minimum time between same error type notifications
     )
 
+    # Pending notifications held for the background sender (0 = send inline)
+    queue_size: int = 4096
+
+    # Coalesce queued webhook notifications into one POST per flush window
+    webhook_batch: bool = True
+    webhook_flush_ms: int = 2000
+
+    # Bitmask of notify_on_severities, derived in __post_init__
+    notify_on_severities_mask: int = field(init=False, repr=False, default=0)
+
+    def __post_init__(self):
+        """Derive the severity bitmask used by the notification filter."""
+        self.notify_on_severities_mask = severity_mask(self.notify_on_severities)
+
+
+# Window behind the recent_errors_1h / error_rate_1h health report figures
+_RECENT_ERROR_WINDOW = timedelta(hours=1)
+_RECENT_ERROR_WINDOW_HOURS = _RECENT_ERROR_WINDOW / timedelta(hours=1)
+_NS_PER_MINUTE = 60 * 1_000_000_000
+_NS_PER_HOUR = 60 * _NS_PER_MINUTE
+
 
 class NotificationService:
     """Service for sending alerts and notifications."""
 
+    # Maximum notifications the background sender handles per wake-up
+    MAX_BATCH_SIZE = 100
+
     def __init__(self, config: NotificationConfig):
         """Initialize notification service with configuration."""
         self.config = config
-        self.notification_history: Dict[str, List[datetime]] = {}
-        self.last_notification_time: Dict[str, datetime] = {}
+        # Send times are time.monotonic_ns() values, only compared to each other
+        self.notification_history: Dict[str, Deque[int]] = {}
+        self.last_notification_time: Dict[str, int] = {}
+        self._next_history_sweep = time.monotonic_ns() + _NS_PER_HOUR
+        self._cooldown_ns = config.cooldown_period_minutes * _NS_PER_MINUTE
+
+        # Errors held back by the cooldown or hourly limit, per error_key; the
+        # count is reported with the next alert for that key
+        self._suppressed: Dict[str, int] = {}
+
+        # Bounded buffer drained by a background sender thread
+        self._pending: deque = deque(maxlen=max(config.queue_size, 1))
+        self._pending_lock = threading.Lock()
+        self._pending_ready = threading.Event()
+        self._dispatch_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._stop_worker = False
+
+        # Authenticated SMTP session reused across email notifications
+        self._smtp: Optional[Any] = None
+        self._smtp_lock = threading.Lock()
+        self._smtp_atexit_registered = False
+
+        # HTTP session whose connection pool is reused across webhook requests
+        self._http_session: Optional[Any] = None
+        self._http_session_lock = threading.Lock()
+
+        # Append handle for the file channel, flushed once per delivered batch
+        self._alert_fh: Optional[TextIO] = None
+        self._alert_fh_lock = threading.Lock()
 
     def should_send_notification(self, error: ErrorDetails) -> bool:
         """Determine if a notification should be sent for this error."""
-        if not self.config.enabled:
-            return False
+        return self._wants_notification(error) and self._within_rate_limit(error)
 
-        # Check severity threshold
-        if error.severity not in self.config.notify_on_severities:
-            return False
+    def _wants_notification(self, error: ErrorDetails) -> bool:
+        """Whether notifications are enabled for this error's severity."""
+        config = self.config
+        return bool(
+            config.enabled and config.notify_on_severities_mask & error.severity.bit
+        )
 
-        # Check rate limiting
-        now = datetime.now()
-        error_key = f"{error.component}:{error.category.value}"
+    def _within_rate_limit(self, error: ErrorDetails) -> bool:
+        """Whether the cooldown and hourly limit allow another alert for the key."""
+        config = self.config
+
+        # Nothing sent yet for this key means no cooldown or rate limit applies
+        error_key = error.error_key
+        last_sent = self.last_notification_time.get(error_key)
+        if last_sent is None:
+            return True
 
         # Check cooldown period
-        if error_key in self.last_notification_time:
-            time_since_last = now - self.last_notification_time[error_key]
-            if (
-                time_since_last.total_seconds()
-                < self.config.cooldown_period_minutes * 60
-            ):
-                return False
+        now = time.monotonic_ns()
+        if now - last_sent < self._cooldown_ns:
+            return False
 
         # Check hourly rate limit
-        if error_key not in self.notification_history:
-            self.notification_history[error_key] = []
+        history = self.notification_history.get(error_key)
+        if history is None:
+            return True
 
-        # Clean old notifications (older than 1 hour)
-        cutoff_time = now - timedelta(hours=1)
-        self.notification_history[error_key] = [
-            time for time in self.notification_history[error_key] if time > cutoff_time
-        ]
+        # Clean old notifications (older than 1 hour); history is oldest first
+        cutoff_time = now - _NS_PER_HOUR
+        while history and history[0] <= cutoff_time:
+            history.popleft()
 
         # Check if we're under the rate limit
-        if (
-            len(self.notification_history[error_key])
-            >= self.config.max_notifications_per_hour
-        ):
+        return len(history) < config.max_notifications_per_hour
+
+    def send_notification(self, error: ErrorDetails) -> bool:
+        """
+        Send notification for the given error.
+
+        When queue_size is positive the notification is handed to the background
+        sender and True means it was queued; otherwise it is delivered inline and
+        True means at least one channel succeeded.
+        """
+        if not self._wants_notification(error):
+            return False
+        if not self._within_rate_limit(error):
+            with self._pending_lock:
+                key = error.error_key
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
             return False
 
+        self._sweep_history()
+
+        if self.config.queue_size <= 0:
+            success = self._dispatch(error, similar=self._take_suppressed(error))
+            self._flush_alert_file()
+            if success:
+                self._record_notification(error)
+            return success
+
+        # Count queued notifications against the rate limit straight away
+        self._record_notification(error)
+        with self._pending_lock:
+            if len(self._pending) == self._pending.maxlen:
+                logging.warning(
+                    "Notification queue full; dropping oldest pending notification"
+                )
+            self._pending.append(error)
+        self._start_worker()
+        self._pending_ready.set()
         return True
 
-    def send_notification(self, error: ErrorDetails) -> bool:
-        """Send notification for the given error."""
-        if not self.should_send_notification(error):
-            return False
+    def flush(self) -> None:
+        """Deliver every queued notification in the calling thread."""
+        with self._dispatch_lock:
+            while True:
+                batch = self._take_pending(self.MAX_BATCH_SIZE)
+                if not batch:
+                    break
+                self._dispatch_batch(batch)
+
+    def _record_notification(self, error: ErrorDetails) -> None:
+        """Record a notification for cooldown and hourly rate limiting."""
+        error_key = error.error_key
+        now = time.monotonic_ns()
+        history = self.notification_history.get(error_key)
+        if history is None:
+            # Twice the hourly limit leaves room for entries not yet pruned
+            history = deque(maxlen=self.config.max_notifications_per_hour * 2)
+            self.notification_history[error_key] = history
+        history.append(now)
+        self.last_notification_time[error_key] = now
+
+    def _sweep_history(self) -> None:
+        """Forget rate-limit state for keys that have been quiet for a while."""
+        now = time.monotonic_ns()
+        if now < self._next_history_sweep:
+            return
+        self._next_history_sweep = now + _NS_PER_HOUR
+
+        # Keep keys still inside their cooldown or hourly window
+        idle_after = max(2 * _NS_PER_HOUR, self._cooldown_ns)
+        stale = [
+            key
+            for key, last_sent in self.last_notification_time.items()
+            if now - last_sent > idle_after
+        ]
+        for key in stale:
+            del self.last_notification_time[key]
+            self.notification_history.pop(key, None)
+            self._suppressed.pop(key, None)
+
+    def _take_suppressed(self, error: ErrorDetails) -> int:
+        """Return and reset the count of held-back errors for error's key."""
+        with self._pending_lock:
+            return self._suppressed.pop(error.error_key, 0)
+
+    def _take_pending(self, max_items: int) -> List[ErrorDetails]:
+        """Remove up to max_items queued notifications, oldest first."""
+        with self._pending_lock:
+            count = min(max_items, len(self._pending))
+            return [self._pending.popleft() for _ in range(count)]
+
+    def _start_worker(self) -> None:
+        """Start the background sender on first use."""
+        if self._worker is not None:
+            return
+        with self._pending_lock:
+            if self._worker is not None:
+                return
+            self._stop_worker = False
+            self._worker = threading.Thread(
+                target=self._run_worker, name="kaspa-notifications", daemon=True
+            )
+            self._worker.start()
+            # Deliver anything still queued when the interpreter exits
+            atexit.register(self.flush)
+
+    def close(self) -> None:
+        """
+        Deliver queued notifications, stop the sender thread and release the
+        SMTP, HTTP and alert-file connections.
+        """
+        with self._pending_lock:
+            worker, self._worker = self._worker, None
+            self._stop_worker = True
+        if worker is not None:
+            self._pending_ready.set()
+            worker.join(timeout=5)
+            atexit.unregister(self.flush)
+        self.flush()
+
+        self._close_smtp()
+        if self._smtp_atexit_registered:
+            atexit.unregister(self._close_smtp)
+            self._smtp_atexit_registered = False
+        with self._http_session_lock:
+            session, self._http_session = self._http_session, None
+        if session is not None:
+            atexit.unregister(session.close)
+            session.close()
+        self._close_alert_file()
+        atexit.unregister(self._close_alert_file)
+
+    def _run_worker(self) -> None:
+        """Background loop: wait for queued notifications and deliver them."""
+        while True:
+            self._pending_ready.wait()
+            self._pending_ready.clear()
+            if self._stop_worker:
+                return
+            if self._batches_webhooks():
+                # Let a burst of errors accumulate so it goes out as one request
+                time.sleep(self.config.webhook_flush_ms / 1000)
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error(f"Notification sender failed: {e}")
 
+    def _batches_webhooks(self) -> bool:
+        """Whether queued webhook notifications are sent as a single request."""
+        return (
+            self.config.webhook_batch
+            and NotificationChannel.WEBHOOK in self.config.channels
+        )
+
+    def _dispatch_batch(self, errors: List[ErrorDetails]) -> None:
+        """Deliver a batch of queued notifications."""
+        # Coalesce errors sharing a key into one alert carrying a similar count
+        groups: Dict[str, List[Any]] = {}
+        for error in errors:
+            group = groups.get(error.error_key)
+            if group is None:
+                groups[error.error_key] = [error, self._take_suppressed(error)]
+            else:
+                group[1] += 1
+        digests = [(error, similar) for error, similar in groups.values()]
+
+        skip_webhook = len(digests) > 1 and self._batches_webhooks()
+        for error, similar in digests:
+            self._dispatch(error, skip_webhook=skip_webhook, similar=similar)
+        self._flush_alert_file()
+
+        if skip_webhook:
+            try:
+                self._send_webhook_batch(digests)
+            except Exception as e:
+                logging.error(f"Failed to send notification via webhook: {e}")
+
+    def _dispatch(
+        self, error: ErrorDetails, skip_webhook: bool = False, similar: int = 0
+    ) -> bool:
+        """
+        Deliver one notification to all configured channels.
+
+        similar is the number of further errors with the same key that this
+        alert stands in for.
+        """
         success = False
 
         # Send to all configured channels
         for channel in self.config.channels:
+            if skip_webhook and channel == NotificationChannel.WEBHOOK:
+                continue
             try:
                 if channel == NotificationChannel.EMAIL:
-                    success |= self._send_email_notification(error)
+                    success |= self._send_email_notification(error, similar)
                 elif channel == NotificationChannel.CONSOLE:
-                    success |= self._send_console_notification(error)
+                    success |= self._send_console_notification(error, similar)
                 elif channel == NotificationChannel.FILE:
-                    success |= self._send_file_notification(error)
+                    success |= self._send_file_notification(error, similar)
                 elif channel == NotificationChannel.WEBHOOK:
-                    success |= self._send_webhook_notification(error)
+                    success |= self._send_webhook_notification(error, similar)
             except Exception as e:
                 logging.error(f"Failed to send notification via {channel.value}: {e}")
 
-        # Update notification history
-        if success:
-            error_key = f"{error.component}:{error.category.value}"
-            now = datetime.now()
-            self.notification_history[error_key].append(now)
-            self.last_notification_time[error_key] = now
-
         return success
 
-    def _send_email_notification(self, error: ErrorDetails) -> bool:
+    def _send_email_notification(self, error: ErrorDetails, similar: int = 0) -> bool:
         """Send email notification."""
         if not self.config.email_to or not self.config.email_username:
             return False
 
         try:
+            import smtplib
+
             msg = MimeMultipart()
             msg["From"] = self.config.email_from or self.config.email_username
             msg["To"] = ", ".join(self.config.email_to)
-            msg["Subject"] = (
-                f"Kaspa Pipeline Alert - {error.severity.value.upper()}: {error.component}"
+            subject = (
+                f"Kaspa Pipeline Alert - {_SEVERITY_LABELS[error.severity]}: "
+                f"{error.component}"
             )
+            if similar:
+                subject = f"{similar + 1}x {subject}"
+            msg["Subject"] = subject
 
-            body = error.to_alert_message()
+            body = self._alert_message(error, similar)
             msg.attach(MimeText(body, "plain"))
 
-            server = smtplib.SMTP(
-                self.config.email_smtp_host, self.config.email_smtp_port
-            )
-            server.starttls()
-            server.login(self.config.email_username, self.config.email_password)
-            server.send_message(msg)
-            server.quit()
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPException):
+                    # The pooled session went stale; reconnect and retry once
+                    self._close_smtp()
+                    self._get_smtp().send_message(msg)
 
             return True
         except Exception as e:
             logging.error(f"Failed to send email notification: {e}")
             return False
 
-    def _send_console_notification(self, error: ErrorDetails) -> bool:
+    def _get_smtp(self):
+        """Return the pooled SMTP session, connecting and logging in if needed."""
+        import smtplib
+
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._close_smtp()
+
+        server = smtplib.SMTP(self.config.email_smtp_host, self.config.email_smtp_port)
+        server.ehlo()
+        server.starttls()
+        server.ehlo()
+        server.login(self.config.email_username, self.config.email_password)
+
+        if not self._smtp_atexit_registered:
+            atexit.register(self._close_smtp)
+            self._smtp_atexit_registered = True
+        self._smtp = server
+        return server
+
+    def _close_smtp(self) -> None:
+        """Close the pooled SMTP session, ignoring errors from a dead connection."""
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    def _send_console_notification(self, error: ErrorDetails, similar: int = 0) -> bool:
         """Send console notification."""
         try:
-            alert_message = error.to_alert_message()
+            alert_message = self._alert_message(error, similar)
             print(f"\n{'='*80}")
             print(alert_message)
             print(f"{'='*80}\n")
@@ -550,48 +1261,129 @@ class NotificationService:
             logging.error(f"Failed to send console notification: {e}")
             return False
 
-    def _send_file_notification(self, error: ErrorDetails) -> bool:
+    def _send_file_notification(self, error: ErrorDetails, similar: int = 0) -> bool:
         """Send file notification."""
         try:
-            alert_file = Path("monitoring/alerts.log")
-            alert_file.parent.mkdir(exist_ok=True)
-
-            alert_message = error.to_alert_message()
-            with open(alert_file, "a", encoding="utf-8") as f:
-                f.write(f"\n{alert_message}\n")
-                f.write(f"{'='*80}\n")
+            alert_message = self._alert_message(error, similar)
+            with self._alert_fh_lock:
+                if self._alert_fh is None:
+                    alert_file = Path("monitoring/alerts.log")
+                    _ensure_dir(alert_file.parent)
+                    self._alert_fh = open(
+                        alert_file, "a", encoding="utf-8", buffering=8192
+                    )
+                    atexit.register(self._close_alert_file)
+                self._alert_fh.write(f"\n{alert_message}\n{'='*80}\n")
 
             return True
         except Exception as e:
             logging.error(f"Failed to send file notification: {e}")
             return False
 
-    def _send_webhook_notification(self, error: ErrorDetails) -> bool:
+    def _flush_alert_file(self) -> None:
+        """Push buffered file-channel alerts to the OS."""
+        with self._alert_fh_lock:
+            if self._alert_fh is None:
+                return
+            try:
+                self._alert_fh.flush()
+            except Exception as e:
+                logging.error(f"Failed to flush alerts file: {e}")
+
+    def _close_alert_file(self) -> None:
+        """Flush and close the file-channel handle."""
+        with self._alert_fh_lock:
+            alert_fh, self._alert_fh = self._alert_fh, None
+            if alert_fh is not None:
+                try:
+                    alert_fh.close()
+                except Exception:
+                    pass
+
+    def _send_webhook_notification(self, error: ErrorDetails, similar: int = 0) -> bool:
         """Send webhook notification."""
         if not self.config.webhook_url:
             return False
 
         try:
-            import requests
+            response = self._get_http_session().post(
+                self.config.webhook_url,
+                data=_dumps(self._webhook_event(error, similar)),
+                headers=self._webhook_headers(),
+                timeout=30,
+            )
 
-            payload = {
-                "error": error.to_dict(),
-                "alert_message": error.to_alert_message(),
-                "timestamp": error.timestamp.isoformat(),
-            }
+            return response.status_code == 200
+        except Exception as e:
+            logging.error(f"Failed to send webhook notification: {e}")
+            return False
 
-            response = requests.post(
+    def _get_http_session(self):
+        """Return the shared requests session, creating it on first use."""
+        with self._http_session_lock:
+            if self._http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                atexit.register(session.close)
+                self._http_session = session
+            return self._http_session
+
+    def _send_webhook_batch(self, digests: List[Tuple[ErrorDetails, int]]) -> bool:
+        """Send several notifications to the webhook in one request."""
+        if not self.config.webhook_url:
+            return False
+
+        try:
+            response = self._get_http_session().post(
                 self.config.webhook_url,
-                json=payload,
-                headers=self.config.webhook_headers,
+                data=_dumps(
+                    {
+                        "events": [
+                            self._webhook_event(error, similar)
+                            for error, similar in digests
+                        ]
+                    }
+                ),
+                headers=self._webhook_headers(),
                 timeout=30,
             )
 
             return response.status_code == 200
         except Exception as e:
-            logging.error(f"Failed to send webhook notification: {e}")
+            logging.error(f"Failed to send batched webhook notification: {e}")
             return False
 
+    def _webhook_headers(self) -> Dict[str, str]:
+        """Headers for webhook requests; the body is pre-encoded JSON."""
+        return {"Content-Type": "application/json", **self.config.webhook_headers}
+
+    @classmethod
+    def _webhook_event(cls, error: ErrorDetails, similar: int = 0) -> Dict[str, Any]:
+        """Build the webhook payload for a single error."""
+        return {
+            "error": error.to_dict(),
+            "alert_message": cls._alert_message(error, similar),
+            "timestamp": error.timestamp.isoformat(),
+            "similar_count": similar,
+        }
+
+    @staticmethod
+    def _alert_message(error: ErrorDetails, similar: int = 0) -> str:
+        """Alert text for error, noting how many similar errors it covers."""
+        message = error.to_alert_message()
+        if similar:
+            message = (
+                f"{message}\n\n"
+                f"Similar errors: {similar} more for {error.error_key} "
+                f"since the last alert"
+            )
+        return message
+
 
 class KaspaPipelineLogger:
     """Enhanced logging system for the entire Kaspa Knowledge Pipeline."""
@@ -601,6 +1393,8 @@ class KaspaPipelineLogger:
         log_level: str = "INFO",
         log_file: Optional[str] = None,
         component: str = "kaspa_pipeline",
+        queue_size: int = 65536,
+        log_format: str = DEFAULT_LOG_FORMAT,
     ):
         """
         Initialize the pipeline logger.
@@ -609,6 +1403,10 @@ class KaspaPipelineLogger:
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             log_file: Optional log file path
             component: Component name for the logger
+            queue_size: Records buffered for the background writer
+                (0 writes to the console/file on the calling thread)
+            log_format: str.format-style record template, or "json" for one
+                JSON object per record
         """
         self.component = component
         self.logger = logging.getLogger(f"kaspa_pipeline.{component}")
@@ -618,35 +1416,56 @@ class KaspaPipelineLogger:
         self.logger.handlers.clear()
 
         # Create detailed formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+        formatter = make_log_formatter(log_format)
 
         # Console handler with color support
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers: List[logging.Handler] = [console_handler]
 
         # File handler with rotation (if specified)
         if log_file:
-            from logging.handlers import RotatingFileHandler
-
+            _ensure_dir(Path(log_file).parent)
             file_handler = RotatingFileHandler(
                 log_file,
                 maxBytes=10 * 1024 * 1024,
                 backupCount=5,  # 10MB max, 5 backups
             )
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        self._handlers = handlers
+        self._listener: Optional[QueueListener] = None
+        if queue_size > 0:
+            # Callers only enqueue records; a listener thread does the I/O
+            log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+            self.logger.addHandler(QueueHandler(log_queue))
+            self._listener = QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            _start_log_listener(self.logger.name, self._listener)
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+        # Records logged through the adapter are tagged with this component
+        self.adapter = logging.LoggerAdapter(self.logger, {"component": component})
 
         # Performance tracking
         self.operation_times: Dict[str, List[float]] = {}
 
     def log_error(self, error: ErrorDetails) -> None:
         """Log an error with structured information."""
-        error_dict = error.to_dict()
-        extra_data = {k: v for k, v in error_dict.items() if k != "message"}
-        extra_data["component"] = error.component
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
+        # Only the identifying fields; the full record is available via to_dict()
+        extra_data = {
+            "component": error.component,
+            "error_id": error.error_id,
+            "severity": error.severity.value,
+            "category": error.category.value,
+        }
 
         self.logger.error(f"Error {error.error_id}: {error.message}", extra=extra_data)
 
@@ -655,6 +1474,8 @@ class KaspaPipelineLogger:
         extra_data = {"component": result.component}
 
         if result.is_valid:
+            if not self.logger.isEnabledFor(logging.INFO):
+                return
             success_rate = result.get_success_rate()
             self.logger.info(
                 f"Validation passed for {result.component} "
@@ -674,6 +1495,9 @@ class KaspaPipelineLogger:
 
     def log_pipeline_health(self, health: PipelineHealth) -> None:
         """Log comprehensive pipeline health information."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         status = "HEALTHY" if health.is_healthy else "UNHEALTHY"
         extra_data = {"component": health.component}
 
@@ -688,6 +1512,9 @@ class KaspaPipelineLogger:
 
     def log_performance_metrics(self, metrics: PerformanceMetrics) -> None:
         """Log performance metrics for a component."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         extra_data = {"component": metrics.component}
 
         self.logger.info(
@@ -699,6 +1526,32 @@ class KaspaPipelineLogger:
             extra=extra_data,
         )
 
+    def log_stage_event(
+        self, event: str, stage: str, level: int = logging.INFO, **fields: Any
+    ) -> None:
+        """
+        Log one pipeline stage lifecycle record (stage_start or stage_end).
+
+        Args:
+            event: Event name, e.g. "stage_start" or "stage_end"
+            stage: Human-readable stage description
+            level: Logging level for the record
+            **fields: Structured fields such as status, return_code, duration
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+
+        fields = {name: value for name, value in fields.items() if value is not None}
+        details = ", ".join(f"{name}={value}" for name, value in fields.items())
+        message = f"{event}: {stage}" + (f" ({details})" if details else "")
+        extra_data = {
+            "component": self.component,
+            "event": event,
+            "stage": stage,
+            **fields,
+        }
+        self.logger.log(level, message, extra=extra_data)
+
     def time_operation(self, operation_name: str):
         """Context manager for timing operations."""
         return self._OperationTimer(self, operation_name)
@@ -706,18 +1559,20 @@ class KaspaPipelineLogger:
     class _OperationTimer:
         """Context manager for timing operations."""
 
+        __slots__ = ("logger", "operation_name", "start_time")
+
         def __init__(self, logger: "KaspaPipelineLogger", operation_name: str):
             self.logger = logger
             self.operation_name = operation_name
             self.start_time = None
 
         def __enter__(self):
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
             return self
 
         def __exit__(self, exc_type, exc_val, exc_tb):
-            if self.start_time:
-                execution_time = time.time() - self.start_time
+            if self.start_time is not None:
+                execution_time = time.perf_counter() - self.start_time
 
                 # Track operation times
                 if self.operation_name not in self.logger.operation_times:
@@ -725,9 +1580,8 @@ class KaspaPipelineLogger:
                 self.logger.operation_times[self.operation_name].append(execution_time)
 
                 # Log operation completion
-                self.logger.logger.info(
-                    f"Operation '{self.operation_name}' completed in {execution_time:.2f}s",
-                    extra={"component": self.logger.component},
+                self.logger.adapter.info(
+                    f"Operation '{self.operation_name}' completed in {execution_time:.2f}s"
                 )
 
     def get_operation_stats(self) -> Dict[str, Dict[str, float]]:
@@ -744,6 +1598,22 @@ class KaspaPipelineLogger:
                 }
         return stats
 
+    def close(self) -> None:
+        """
+        Write out queued records and release the console/file handlers.
+
+        Background writers are also stopped at interpreter exit; call this to
+        release the log file earlier. Later records go to the parent loggers.
+        """
+        if self._listener is not None:
+            _stop_log_listener(self.logger.name, self._listener)
+            self._listener = None
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        for handler in self._handlers:
+            handler.close()
+        self._handlers = []
+
 
 class KaspaPipelineErrorHandler:
     """Comprehensive error handling system for the entire Kaspa Knowledge Pipeline."""
@@ -752,6 +1622,9 @@ class KaspaPipelineErrorHandler:
         self,
         logger: Optional[KaspaPipelineLogger] = None,
         notification_config: Optional[NotificationConfig] = None,
+        heap_stats_every_n: int = 60,
+        max_error_history: int = 1000,
+        health_log_flush_ms: int = 100,
     ):
         """
         Initialize the error handler.
@@ -759,21 +1632,46 @@ class KaspaPipelineErrorHandler:
         Args:
             logger: Optional logger instance
             notification_config: Optional notification configuration
+            heap_stats_every_n: Refresh memory/disk stats every N health reports
+            max_error_history: Number of most recent errors kept in error_history
+            health_log_flush_ms: Minimum gap between component health log
+                batches (0 logs every update immediately)
         """
         self.logger = logger or KaspaPipelineLogger()
         self.error_counter = 0
         self.health_metrics: Dict[str, PipelineHealth] = {}
-        self.error_history: List[ErrorDetails] = []
+        self.error_history: Deque[ErrorDetails] = deque(maxlen=max_error_history)
+        # CRITICAL errors currently in error_history, kept in step with evictions
+        self._critical_in_history = 0
+
+        # Resource stats are sampled on the first report and every N after that
+        self.heap_stats_every_n = max(1, heap_stats_every_n)
+        self._heap_cache: Optional[Dict[str, Any]] = None
+        self._heap_call_count = 0
+
+        # Health updates inside one flush window are logged together, once per
+        # component with its latest state; a timer writes out deferred updates
+        self.health_log_flush_ms = max(0, health_log_flush_ms)
+        self._pending_health_logs: Dict[str, None] = {}
+        self._health_log_lock = threading.Lock()
+        self._health_log_timer: Optional[threading.Timer] = None
+        self._health_log_atexit_registered = False
+        self._next_health_log = 0.0
+
+        # Read-only health report sections, rebuilt only after an error or a
+        # health update marks them dirty
+        self._report_cache: Optional[Mapping[str, Any]] = None
+        self._report_dirty = True
 
         # Initialize notification service
         self.notification_service = None
         if notification_config:
             self.notification_service = NotificationService(notification_config)
 
-    def generate_error_id(self) -> str:
-        """Generate unique error ID with timestamp."""
+    def generate_error_id(self, now: Optional[datetime] = None) -> str:
+        """Generate unique error ID with timestamp (now, or the current time)."""
         self.error_counter += 1
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
         return f"KASPA_ERROR_{timestamp}_{self.error_counter:04d}"
 
     def create_error(
@@ -803,32 +1701,38 @@ class KaspaPipelineErrorHandler:
         Returns:
             ErrorDetails object
         """
-        error_id = self.generate_error_id()
+        # One clock read for both the error ID and the timestamp
+        now = datetime.now()
+        error_id = self.generate_error_id(now)
 
         # Extract exception information
         exception_type = type(exception).__name__ if exception else "UnknownError"
-        traceback_info = traceback.format_exc() if exception else ""
 
-        # Extract file path and line number from traceback
+        # Snapshot the stack so error_history does not keep frames and their
+        # locals alive; source lines are read only if traceback_info is used
+        captured = None
         file_path = None
         line_number = None
-        if exception:
-            tb = traceback.extract_tb(exception.__traceback__)
-            if tb:
-                file_path = tb[-1].filename
-                line_number = tb[-1].lineno
+        if exception is not None:
+            captured = traceback.TracebackException.from_exception(
+                exception, lookup_lines=False
+            )
+            if captured.stack:
+                # File path and line number of the innermost traceback frame
+                file_path = captured.stack[-1].filename
+                line_number = captured.stack[-1].lineno
 
         # Estimate fix time based on severity and category
         estimated_fix_time = self._estimate_fix_time(severity, category)
 
         error = ErrorDetails(
             error_id=error_id,
-            timestamp=datetime.now(),
+            timestamp=now,
             severity=severity,
             category=category,
             message=message,
             exception_type=exception_type,
-            traceback_info=traceback_info,
+            traceback_info=None,  # rendered from exception on first access
             context=context or {},
             component=component,
             file_path=file_path,
@@ -836,9 +1740,11 @@ class KaspaPipelineErrorHandler:
             recovery_action=recovery_action,
             user_impact=user_impact,
             estimated_fix_time=estimated_fix_time,
+            exception=captured,
         )
 
-        self.error_history.append(error)
+        self._remember_error(error)
+        self._report_dirty = True
         self.logger.log_error(error)
 
         # Send notification if configured
@@ -851,25 +1757,7 @@ class KaspaPipelineErrorHandler:
         self, severity: ErrorSeverity, category: ErrorCategory
     ) -> str:
         """Estimate fix time based on error characteristics."""
-        severity_times = {
-            ErrorSeverity.CRITICAL: "1-2 hours",
-            ErrorSeverity.HIGH: "2-4 hours",
-            ErrorSeverity.MEDIUM: "4-8 hours",
-            ErrorSeverity.LOW: "1-2 days",
-            ErrorSeverity.INFO: "As needed",
-        }
-
-        # Adjust based on category complexity
-        complex_categories = [
-            ErrorCategory.AI_PROCESSING,
-            ErrorCategory.GITHUB_API,
-            ErrorCategory.EXTERNAL_DEPENDENCY,
-        ]
-
-        base_time = severity_times.get(severity, "Unknown")
-        if category in complex_categories:
-            return f"{base_time} (potentially longer due to external dependencies)"
-        return base_time
+        return _FIX_TIMES.get((severity, category), "Unknown")
 
     def handle_exception(
         self,
@@ -926,26 +1814,115 @@ class KaspaPipelineErrorHandler:
         self.health_metrics[component].update_health(
             is_success, execution_time, error, items_processed, memory_usage
         )
-        self.logger.log_pipeline_health(self.health_metrics[component])
+        self._report_dirty = True
+
+        with self._health_log_lock:
+            self._pending_health_logs[component] = None
+            if self._health_log_timer is not None:
+                return  # already scheduled
+            delay = self._next_health_log - time.monotonic()
+            if delay > 0:
+                # A daemon timer never holds up interpreter exit; the deferred
+                # updates are written by close() or at exit instead
+                timer = threading.Timer(delay, self._flush_health_logs)
+                timer.daemon = True
+                if not self._health_log_atexit_registered:
+                    atexit.register(self._flush_health_logs)
+                    self._health_log_atexit_registered = True
+                self._health_log_timer = timer
+                timer.start()
+                return
+        self._flush_health_logs()
+
+    def _flush_health_logs(self) -> None:
+        """Log the latest health of every component updated since the last flush."""
+        with self._health_log_lock:
+            if self._health_log_timer is not None:
+                self._health_log_timer.cancel()
+                self._health_log_timer = None
+            components = list(self._pending_health_logs)
+            self._pending_health_logs.clear()
+            self._next_health_log = time.monotonic() + self.health_log_flush_ms / 1000.0
+
+        for component in components:
+            self.logger.log_pipeline_health(self.health_metrics[component])
+
+    def close(self) -> None:
+        """
+        Write out coalesced health updates, cancel the pending flush timer and
+        close the notification service. The logger is left open.
+        """
+        self._flush_health_logs()
+        if self._health_log_atexit_registered:
+            atexit.unregister(self._flush_health_logs)
+            self._health_log_atexit_registered = False
+        if self.notification_service is not None:
+            self.notification_service.close()
 
     def get_component_health(self, component: str) -> Optional[PipelineHealth]:
         """Get health information for a specific component."""
         return self.health_metrics.get(component)
 
-    def get_health_report(self) -> Dict[str, Any]:
-        """Get comprehensive health report for the entire pipeline."""
-        total_errors = len(self.error_history)
-        recent_errors = len(
-            [
-                e
-                for e in self.error_history
-                if (datetime.now() - e.timestamp).seconds < 3600
-            ]
-        )
-        critical_errors = len(
-            [e for e in self.error_history if e.severity == ErrorSeverity.CRITICAL]
+    def _remember_error(self, error: ErrorDetails) -> None:
+        """Append error to error_history, keeping the critical count current."""
+        history = self.error_history
+        if len(history) == history.maxlen and history:
+            if history[0].severity is ErrorSeverity.CRITICAL:
+                self._critical_in_history -= 1
+        history.append(error)
+        if error.severity is ErrorSeverity.CRITICAL and history.maxlen != 0:
+            self._critical_in_history += 1
+
+    def _errors_since(self, cutoff_time: datetime) -> List[ErrorDetails]:
+        """Errors newer than cutoff_time, oldest first."""
+        # error_history is in creation order, so only the recent tail is read
+        recent = []
+        for error in reversed(self.error_history):
+            if error.timestamp <= cutoff_time:
+                break
+            recent.append(error)
+        recent.reverse()
+        return recent
+
+    def get_health_report(self) -> Mapping[str, Any]:
+        """
+        Get comprehensive health report for the entire pipeline.
+
+        The report is a read-only view. Component and error sections are
+        cached until the next error or health update; the timestamp, recent
+        error counts and resource usage are refreshed on every call. Use
+        ``json.dumps(report, default=dict)`` to serialize it.
+        """
+        self._flush_health_logs()
+        now = datetime.now()
+        recent_errors = len(self._errors_since(now - _RECENT_ERROR_WINDOW))
+
+        if self._report_dirty or self._report_cache is None:
+            self._report_dirty = False
+            self._report_cache = self._build_report_sections()
+        sections = self._report_cache
+
+        return MappingProxyType(
+            {
+                "timestamp": now.isoformat(),
+                "overall_health": sections["overall_health"],
+                "error_summary": MappingProxyType(
+                    {
+                        "total_errors": sections["total_errors"],
+                        "recent_errors_1h": recent_errors,
+                        "critical_errors": sections["critical_errors"],
+                        # Errors per hour over the recent-error window
+                        "error_rate_1h": recent_errors / _RECENT_ERROR_WINDOW_HOURS,
+                    }
+                ),
+                "component_health": sections["component_health"],
+                "recent_critical_errors": sections["recent_critical_errors"],
+                "resource_usage": self._get_resource_stats(),
+            }
         )
 
+    def _build_report_sections(self) -> Mapping[str, Any]:
+        """Build the health report sections that only change with errors or health."""
         # Calculate overall pipeline health
         healthy_components = sum(
             1 for h in self.health_metrics.values() if h.is_healthy
@@ -955,60 +1932,64 @@ class KaspaPipelineErrorHandler:
             (healthy_components / total_components * 100) if total_components > 0 else 0
         )
 
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "overall_health": {
-                "score": round(overall_health_score, 1),
-                "is_healthy": overall_health_score >= 80,
-                "healthy_components": healthy_components,
-                "total_components": total_components,
-            },
-            "error_summary": {
-                "total_errors": total_errors,
-                "recent_errors_1h": recent_errors,
-                "critical_errors": critical_errors,
-                "error_rate_1h": round(
-                    recent_errors / 1 if recent_errors > 0 else 0, 2
+        return MappingProxyType(
+            {
+                "overall_health": MappingProxyType(
+                    {
+                        "score": round(overall_health_score, 1),
+                        "is_healthy": overall_health_score >= 80,
+                        "healthy_components": healthy_components,
+                        "total_components": total_components,
+                    }
                 ),
-            },
-            "component_health": {
-                name: health.get_health_summary()
-                for name, health in self.health_metrics.items()
-            },
-            "recent_critical_errors": [
-                error.to_dict()
-                for error in self.error_history[-5:]
-                if error.severity == ErrorSeverity.CRITICAL
-            ],
-        }
+                "total_errors": len(self.error_history),
+                "critical_errors": self._critical_in_history,
+                "component_health": MappingProxyType(
+                    {
+                        name: MappingProxyType(health.get_health_summary())
+                        for name, health in self.health_metrics.items()
+                    }
+                ),
+                "recent_critical_errors": tuple(
+                    MappingProxyType(error.to_dict())
+                    for error in islice(
+                        self.error_history, max(len(self.error_history) - 5, 0), None
+                    )
+                    if error.severity == ErrorSeverity.CRITICAL
+                ),
+            }
+        )
+
+    def _get_resource_stats(self) -> Dict[str, Any]:
+        """Return cached resource stats, resampling every heap_stats_every_n calls."""
+        if (
+            self._heap_cache is None
+            or self._heap_call_count % self.heap_stats_every_n == 0
+        ):
+            self._heap_cache = _collect_resource_stats()
+        self._heap_call_count += 1
+        return self._heap_cache
 
     def get_error_trends(self, hours: int = 24) -> Dict[str, Any]:
         """Analyze error trends over specified time period."""
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        recent_errors = [e for e in self.error_history if e.timestamp > cutoff_time]
-
-        # Group errors by component
-        component_errors = {}
-        category_errors = {}
-        severity_errors = {}
-
-        for error in recent_errors:
-            # By component
-            if error.component not in component_errors:
-                component_errors[error.component] = 0
-            component_errors[error.component] += 1
-
-            # By category
-            cat_name = error.category.value
-            if cat_name not in category_errors:
-                category_errors[cat_name] = 0
-            category_errors[cat_name] += 1
-
-            # By severity
-            sev_name = error.severity.value
-            if sev_name not in severity_errors:
-                severity_errors[sev_name] = 0
-            severity_errors[sev_name] += 1
+        recent_errors = self._errors_since(cutoff_time)
+
+        # Group errors by component, category and severity. Categories and
+        # severities are counted by enum member; .value is read once per member
+        component_errors = Counter(map(attrgetter("component"), recent_errors))
+        category_errors = {
+            category.value: count
+            for category, count in Counter(
+                map(attrgetter("category"), recent_errors)
+            ).items()
+        }
+        severity_errors = {
+            severity.value: count
+            for severity, count in Counter(
+                map(attrgetter("severity"), recent_errors)
+            ).items()
+        }
 
         return {
             "time_period_hours": hours,
@@ -1017,44 +1998,55 @@ class KaspaPipelineErrorHandler:
             "errors_by_category": category_errors,
             "errors_by_severity": severity_errors,
             "most_problematic_component": (
-                max(component_errors.items(), key=lambda x: x[1])[0]
-                if component_errors
-                else None
+                component_errors.most_common(1)[0][0] if component_errors else None
             ),
         }
 
     def run_health_check(self) -> Dict[str, Any]:
         """Run comprehensive health check across all components."""
-        health_check_results = {}
-
-        for component_name, health in self.health_metrics.items():
-            health_check_results[component_name] = {
-                "status": "HEALTHY" if health.is_healthy else "UNHEALTHY",
-                "health_score": health.health_score,
-                "last_check": health.last_check.isoformat(),
-                "issues": [],
-            }
+        self._flush_health_logs()
+        return {
+            "health_check_timestamp": datetime.now().isoformat(),
+            "components": {
+                name: health.health_check_entry()
+                for name, health in self.health_metrics.items()
+            },
+        }
 
-            # Check for specific issues
-            if health.consecutive_failures >= 3:
-                health_check_results[component_name]["issues"].append(
-                    f"High consecutive failures: {health.consecutive_failures}"
-                )
+    def run_health_check_json(self) -> bytes:
+        """
+        Run the health check and return it as newline-terminated JSON bytes.
 
-            if health.success_rate < 0.8:
-                health_check_results[component_name]["issues"].append(
-                    f"Low success rate: {health.success_rate:.1%}"
-                )
+        Each component's entry is serialized once and reused until its health
+        changes, so repeated polls mostly concatenate cached bytes.
+        """
+        self._flush_health_logs()
+        components = b",".join(
+            _dumps(name) + b":" + health.health_check_snapshot()
+            for name, health in self.health_metrics.items()
+        )
+        return (
+            b'{"health_check_timestamp":'
+            + _dumps(datetime.now().isoformat())
+            + b',"components":{'
+            + components
+            + b"}}\n"
+        )
 
-            if health.average_execution_time > 300:  # 5 minutes
-                health_check_results[component_name]["issues"].append(
-                    f"High execution time: {health.average_execution_time:.1f}s"
-                )
 
-        return {
-            "health_check_timestamp": datetime.now().isoformat(),
-            "components": health_check_results,
-        }
+# Shared handler for retry_on_failure when no handler is passed in
+_DEFAULT_ERROR_HANDLER: Optional[KaspaPipelineErrorHandler] = None
+_DEFAULT_ERROR_HANDLER_LOCK = threading.Lock()
+
+
+def _default_error_handler() -> KaspaPipelineErrorHandler:
+    """Return the process-wide default error handler, creating it on first use."""
+    global _DEFAULT_ERROR_HANDLER
+    if _DEFAULT_ERROR_HANDLER is None:
+        with _DEFAULT_ERROR_HANDLER_LOCK:
+            if _DEFAULT_ERROR_HANDLER is None:
+                _DEFAULT_ERROR_HANDLER = KaspaPipelineErrorHandler()
+    return _DEFAULT_ERROR_HANDLER
 
 
 def retry_on_failure(
@@ -1062,6 +2054,7 @@ def retry_on_failure(
     backoff_factor: float = 2.0,
     exceptions: Tuple[Exception, ...] = (Exception,),
     component: str = "unknown",
+    error_handler: Optional[KaspaPipelineErrorHandler] = None,
 ):
     """
     Decorator for retrying functions on failure with exponential backoff.
@@ -1071,31 +2064,31 @@ def retry_on_failure(
         backoff_factor: Exponential backoff factor
         exceptions: Tuple of exceptions to catch and retry
         component: Component name for logging and health tracking
+        error_handler: Handler that records errors and health; defaults to a
+            shared handler, so metrics accumulate across calls
     """
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            error_handler = KaspaPipelineErrorHandler()
+            handler = error_handler or _default_error_handler()
 
             for attempt in range(max_retries + 1):
                 try:
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     result = func(*args, **kwargs)
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
 
                     # Update health metrics on success
-                    error_handler.update_component_health(
-                        component, True, execution_time
-                    )
+                    handler.update_component_health(component, True, execution_time)
 
                     return result
 
                 except exceptions as e:
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
 
                     # Create error details
-                    error = error_handler.handle_exception(
+                    error = handler.handle_exception(
                         e,
                         component,
                         context={"attempt": attempt + 1, "max_retries": max_retries},
@@ -1108,7 +2101,7 @@ def retry_on_failure(
                     error.retry_count = attempt + 1
 
                     # Update health metrics on failure
-                    error_handler.update_component_health(
+                    handler.update_component_health(
                         component, False, execution_time, error
                     )
 
@@ -1120,7 +2113,7 @@ def retry_on_failure(
                     wait_time = backoff_factor**attempt
                     time.sleep(wait_time)
 
-                    error_handler.logger.logger.warning(
+                    handler.logger.logger.warning(
                         f"Retry attempt {attempt + 1}/{max_retries} for {component} "
                         f"after {wait_time:.1f}s delay"
                     )
@@ -1130,6 +2123,10 @@ def retry_on_failure(
     return decorator
 
 
+# Subdirectories every pipeline data directory must contain
+_REQUIRED_DATA_SUBDIRS = ("aggregated", "briefings", "facts")
+
+
 class PipelineValidator:
     """Enhanced validation system for pipeline components."""
 
@@ -1146,25 +2143,34 @@ class PipelineValidator:
         self, data_dir: Path, component: str = "data_loader"
     ) -> ValidationResult:
         """Validate data directory structure with enhanced checks."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = ValidationResult(is_valid=True, component=component)
 
-        required_subdirs = ["aggregated", "briefings", "facts"]
-        result.checked_items = len(required_subdirs)
+        result.checked_items = len(_REQUIRED_DATA_SUBDIRS)
+        parent_dir = str(data_dir)
 
-        for subdir in required_subdirs:
+        # One directory listing replaces an exists()/is_dir() stat pair per
+        # subdir; DirEntry carries the file type from the listing itself.
+        try:
+            with os.scandir(data_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            entries = {}
+
+        for subdir in _REQUIRED_DATA_SUBDIRS:
             path = data_dir / subdir
-            if not path.exists():
+            entry = entries.get(subdir)
+            if entry is None:
                 error = self.error_handler.create_error(
                     f"Required directory '{subdir}' not found at {path}",
                     ErrorSeverity.HIGH,
                     ErrorCategory.DATA_VALIDATION,
                     component=component,
-                    context={"directory": str(path), "parent_dir": str(data_dir)},
+                    context={"directory": str(path), "parent_dir": parent_dir},
                     recovery_action=f"Create directory: mkdir -p {path}",
                 )
                 result.add_error(error)
-            elif not path.is_dir():
+            elif not entry.is_dir():
                 error = self.error_handler.create_error(
                     f"Path '{path}' exists but is not a directory",
                     ErrorSeverity.HIGH,
@@ -1177,7 +2183,7 @@ class PipelineValidator:
             else:
                 result.passed_checks += 1
 
-        result.validation_time = time.time() - start_time
+        result.validation_time = time.perf_counter() - start_time
         return result
 
     def validate_json_structure(
@@ -1187,13 +2193,20 @@ class PipelineValidator:
         component: str = "data_validator",
     ) -> ValidationResult:
         """Validate JSON data structure with enhanced field checking."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = ValidationResult(is_valid=True, component=component)
 
         result.checked_items = len(required_fields)
 
-        for field_name in required_fields:
-            if field_name not in data:
+        missing_fields = [name for name in required_fields if name not in data]
+        result.passed_checks += len(required_fields) - len(missing_fields)
+
+        if missing_fields:
+            # Context shared by every missing-field error
+            available_fields = list(data.keys())
+            data_size = len(data) if isinstance(data, dict) else 0
+
+            for field_name in missing_fields:
                 error = self.error_handler.create_error(
                     f"Required field '{field_name}' missing from JSON data",
                     ErrorSeverity.MEDIUM,
@@ -1201,28 +2214,31 @@ class PipelineValidator:
                     component=component,
                     context={
                         "missing_field": field_name,
-                        "available_fields": list(data.keys()),
-                        "data_size": len(data) if isinstance(data, dict) else 0,
+                        "available_fields": available_fields,
+                        "data_size": data_size,
                     },
                     recovery_action=f"Add required field '{field_name}' to JSON structure",
                 )
                 result.add_error(error)
-            else:
-                result.passed_checks += 1
 
-        result.validation_time = time.time() - start_time
+        result.validation_time = time.perf_counter() - start_time
         return result
 
     def validate_output_file(
         self, file_path: Path, min_size: int = 1, component: str = "output_validator"
     ) -> ValidationResult:
         """Validate output file with enhanced size and content checks."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = ValidationResult(is_valid=True, component=component)
         result.checked_items = 3  # existence, size, readability
 
-        # Check file existence
-        if not file_path.exists():
+        # Check file existence; one stat also provides the size below
+        try:
+            file_stat = file_path.stat()
+        except OSError:
+            file_stat = None
+
+        if file_stat is None:
             error = self.error_handler.create_error(
                 f"Output file not created: {file_path}",
                 ErrorSeverity.HIGH,
@@ -1236,7 +2252,7 @@ class PipelineValidator:
             result.passed_checks += 1
 
             # Check file size
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             if file_size < min_size:
                 error = self.error_handler.create_error(
                     f"Output file too small: {file_path} ({file_size} bytes)",
@@ -1254,10 +2270,15 @@ class PipelineValidator:
             else:
                 result.passed_checks += 1
 
-            # Check file readability
+            # Check file readability: the first bytes must read and start
+            # valid UTF-8 (a multi-byte character may be cut off at the end)
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    f.read(1)  # Try to read first character
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    head = os.read(fd, 4)
+                finally:
+                    os.close(fd)
+                codecs.getincrementaldecoder("utf-8")().decode(head)
                 result.passed_checks += 1
             except Exception as e:
                 error = self.error_handler.create_error(
@@ -1270,7 +2291,7 @@ class PipelineValidator:
                 )
                 result.add_error(error)
 
-        result.validation_time = time.time() - start_time
+        result.validation_time = time.perf_counter() - start_time
         return result
 
 
@@ -1278,17 +2299,28 @@ def create_pipeline_logger(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
     component: str = "kaspa_pipeline",
+    queue_size: int = 65536,
+    log_format: str = DEFAULT_LOG_FORMAT,
 ) -> KaspaPipelineLogger:
     """Create a configured pipeline logger."""
-    return KaspaPipelineLogger(log_level, log_file, component)
+    return KaspaPipelineLogger(log_level, log_file, component, queue_size, log_format)
 
 
 def create_error_handler(
     logger: Optional[KaspaPipelineLogger] = None,
     notification_config: Optional[NotificationConfig] = None,
+    heap_stats_every_n: int = 60,
+    max_error_history: int = 1000,
+    health_log_flush_ms: int = 100,
 ) -> KaspaPipelineErrorHandler:
     """Create a configured error handler."""
-    return KaspaPipelineErrorHandler(logger, notification_config)
+    return KaspaPipelineErrorHandler(
+        logger,
+        notification_config,
+        heap_stats_every_n,
+        max_error_history,
+        health_log_flush_ms,
+    )
 
 
 def create_validator(
@@ -1316,22 +2348,22 @@ def run_with_monitoring(
     Returns:
         Tuple of (result, error_details)
     """
-    handler = error_handler or KaspaPipelineErrorHandler()
+    handler = error_handler or _default_error_handler()
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Use the logger's timing context if available
         with handler.logger.time_operation(f"{component}.{func.__name__}"):
             result = func(**kwargs)
 
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         handler.update_component_health(component, True, execution_time)
 
         return result, None
 
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         error = handler.handle_exception(
             e,
             component,
@@ -1350,9 +2382,13 @@ def setup_monitoring_from_env() -> (
     # Get configuration from environment
     log_level = os.getenv("KASPA_LOG_LEVEL", "INFO")
     log_file = os.getenv("KASPA_LOG_FILE")
+    log_queue_size = int(os.getenv("KASPA_LOG_QUEUE_SIZE", "65536"))
+    log_format = os.getenv("KASPA_LOG_FORMAT", DEFAULT_LOG_FORMAT)
 
     # Create logger
-    logger = create_pipeline_logger(log_level, log_file)
+    logger = create_pipeline_logger(
+        log_level, log_file, queue_size=log_queue_size, log_format=log_format
+    )
 
     # Set up notification configuration
     notification_config = None
@@ -1371,6 +2407,9 @@ def setup_monitoring_from_env() -> (
                 else []
             ),
             webhook_url=os.getenv("KASPA_WEBHOOK_URL", ""),
+            queue_size=int(os.getenv("KASPA_NOTIFICATION_QUEUE_SIZE", "4096")),
+            webhook_batch=os.getenv("KASPA_WEBHOOK_BATCH", "true").lower() == "true",
+            webhook_flush_ms=int(os.getenv("KASPA_WEBHOOK_FLUSH_MS", "2000")),
         )
 
         # Add email channel if configured
@@ -1382,7 +2421,13 @@ def setup_monitoring_from_env() -> (
             notification_config.channels.append(NotificationChannel.WEBHOOK)
 
     # Create error handler
-    error_handler = create_error_handler(logger, notification_config)
+    error_handler = create_error_handler(
+        logger,
+        notification_config,
+        heap_stats_every_n=int(os.getenv("KASPA_HEAP_STATS_EVERY_N", "60")),
+        max_error_history=int(os.getenv("KASPA_MAX_ERROR_HISTORY", "1000")),
+        health_log_flush_ms=int(os.getenv("KASPA_HEALTH_LOG_FLUSH_MS", "100")),
+    )
 
     return logger, error_handler
 
@@ -1410,11 +2455,10 @@ if __name__ == "__main__":
     logger.log_validation_result(result)
 
     # Test health check
-    health_check = error_handler.run_health_check()
     print("\nHealth Check Results:")
-    print(json.dumps(health_check, indent=2))
+    sys.stdout.write(error_handler.run_health_check_json().decode("utf-8"))
 
     # Test comprehensive health report
     health_report = error_handler.get_health_report()
     print("\nFull Health Report:")
-    print(json.dumps(health_report, indent=2))
+    print(json.dumps(health_report, indent=2, default=dict))
@@ -16,34 +16,376 @@ Features:
 - Enhanced disk space monitoring
 """
 
+import gzip
 import json
 import logging
+import mmap
+import os
+import re
 import sys
+import tempfile
 from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Iterator, Tuple
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor
 
-# Import resource management
-from scripts.resource_manager import (
-    LargeDatasetManager,
-    ResourceMonitor,
-    check_resources,
-    process_with_resource_management,
-)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson
+
+    # The pure-Python backend is slower than loading the whole file, so
+    # stream only with a compiled one
+    if ijson.backend not in ("yajl2_c", "yajl2_cffi"):
+        ijson = None
+except ImportError:  # pragma: no cover - optional streaming parser
+    ijson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional SIMD parser
+    simdjson = None
 
 # Add the scripts directory to Python path for imports
 scripts_dir = Path(__file__).parent
 sys.path.insert(0, str(scripts_dir))
 
-from signal_enrichment import SignalEnrichmentService  # noqa: E402
+# Resource management (psutil) and signal enrichment are imported where first
+# used, so callers that only resolve paths or find existing output skip them
+if TYPE_CHECKING:
+    from scripts.resource_manager import LargeDatasetManager, ResourceMonitor
+    from signal_enrichment import SignalEnrichmentService
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _today() -> str:
+    """Return today's date as YYYY-MM-DD."""
+    return datetime.now().date().isoformat()
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _iter_json_chunks(data: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    Yield data as indented JSON in pieces, one per source under "sources".
+
+    The pieces join to exactly _dump_json_bytes(data), but only one source's
+    items are encoded at a time, so no buffer holds the whole document.
+    "sources" may also be an iterator of (name, items) pairs, which is
+    consumed as it is written; keys after it are encoded once it runs out.
+    """
+    if not data:
+        yield b"{}"
+        return
+
+    yield b"{"
+    for i, (key, value) in enumerate(data.items()):
+        yield (b",\n  " if i else b"\n  ") + _dump_json_bytes(str(key)) + b": "
+        if key == "sources" and isinstance(value, (dict, Iterator)):
+            yield from _iter_sources_chunks(
+                value.items() if isinstance(value, dict) else value
+            )
+        else:
+            yield _dump_json_bytes(value).replace(b"\n", b"\n  ")
+    yield b"\n}"
+
+
+def _iter_sources_chunks(sources: Iterable[Tuple[str, Any]]) -> Iterator[bytes]:
+    """Yield the "sources" object for _iter_json_chunks, one source at a time."""
+    empty = True
+    for name, items in sources:
+        yield (
+            (b"{\n    " if empty else b",\n    ")
+            + _dump_json_bytes(str(name))
+            + b": "
+            + _dump_json_bytes(items).replace(b"\n", b"\n    ")
+        )
+        empty = False
+        # Release this source before the next one is produced
+        del items
+    yield b"{}" if empty else b"\n  }"
+
+
+def _load_json_file(path: Path) -> Any:
+    """Load a JSON (or gzip-compressed .gz JSON) file, using orjson when installed."""
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json_atomic(output_path: Path, data: Dict[str, Any]) -> int:
+    """
+    Write data as JSON to output_path atomically and return the bytes written.
+
+    Data goes to a temporary file in the same directory, which is fsynced and
+    then renamed over output_path, so a crash never leaves a partial file for
+    the deduplication check to reuse. A ".gz" path is gzip-compressed at
+    level 1, which shrinks JSON several times at little CPU cost.
+    """
+    temp_fd, temp_path = tempfile.mkstemp(
+        suffix=".tmp", prefix=f".{output_path.name}.", dir=output_path.parent
+    )
+    try:
+        with open(temp_fd, "wb") as temp_file:
+            if output_path.suffix == ".gz":
+                with gzip.GzipFile(
+                    fileobj=temp_file, mode="wb", compresslevel=1
+                ) as gz_file:
+                    gz_file.writelines(_iter_json_chunks(data))
+            else:
+                temp_file.writelines(_iter_json_chunks(data))
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+            written_size = temp_file.tell()
+        os.replace(temp_path, output_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    return written_size
+
+
+# Files at least this large are parsed with simdjson when it is installed;
+# below it parser setup outweighs the speedup
+SIMDJSON_MIN_BYTES = 1 << 20
+
+
+def _simdjson_document(path: Path) -> Any:
+    """
+    Parse path with simdjson if it is installed and path is a large plain JSON
+    file, else return None.
+
+    The file is memory-mapped, so its bytes are never copied into a Python
+    object; simdjson keeps its own parsed copy, so the map can close at once.
+    """
+    if (
+        simdjson is None
+        or path.suffix == ".gz"
+        or path.stat().st_size < SIMDJSON_MIN_BYTES
+    ):
+        return None
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # A parser serves one document at a time and sources load in parallel
+        return simdjson.Parser().parse(mm)
+
+
+def _simdjson_value(value: Any) -> Any:
+    """Materialize a lazy simdjson object or array as plain dicts and lists."""
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _iter_json_items(path: Path, keys: Tuple[str, ...]) -> Iterator[Any]:
+    """
+    Yield the items of a JSON file's top-level list, or of the list under the
+    earliest of keys (in keys order) present in its top-level object.
+
+    With simdjson (large files) or ijson only one item is materialized at a
+    time; without either the whole file is loaded. Every parser picks the
+    same key, and yields nothing if that key does not hold a list.
+    """
+    doc = _simdjson_document(path)
+    if doc is not None:
+        if isinstance(doc, simdjson.Object):
+            doc = next((doc[key] for key in keys if key in doc), None)
+        if isinstance(doc, simdjson.Array):
+            for item in doc:
+                yield _simdjson_value(item)
+        return
+
+    if ijson is None:
+        data = _load_json_file(path)
+        if isinstance(data, dict):
+            data = next((data[key] for key in keys if key in data), None)
+        if isinstance(data, list):
+            yield from data
+        return
+
+    best = None
+    with open(path, "rb") as f:
+        events = ijson.parse(f, use_float=True)
+        for prefix, event, value in events:
+            if prefix == "" and event == "start_array":
+                yield from ijson.items(events, "item")
+                return
+            if prefix == "" and event == "map_key" and value in keys:
+                if value == keys[0]:
+                    # Nothing outranks it, so stream it straight away
+                    yield from ijson.items(events, f"{value}.item")
+                    return
+                if best is None or keys.index(value) < keys.index(best):
+                    best = value
+
+    if best is not None:
+        # The file had only lower-priority keys; read it again for the best one
+        with open(path, "rb") as f:
+            yield from ijson.items(f, f"{best}.item", use_float=True)
+
+
+def _iter_json_object(path: Path) -> Iterator[Tuple[str, Any]]:
+    """Yield (key, value) pairs of a JSON file's top-level object, streaming."""
+    doc = _simdjson_document(path)
+    if doc is not None:
+        if isinstance(doc, simdjson.Object):
+            # items() materializes each value as it is reached
+            yield from doc.items()
+        return
+
+    if ijson is None:
+        data = _load_json_file(path)
+        if isinstance(data, dict):
+            yield from data.items()
+        return
+
+    with open(path, "rb") as f:
+        yield from ijson.kvitems(f, "", use_float=True)
+
+
+# Ingest scripts write "status" among the first top-level keys, so an empty
+# day's file can be recognized from its first bytes without parsing it
+NO_NEW_CONTENT_HEAD_BYTES = 256
+_NO_NEW_CONTENT_RE = re.compile(rb'"status":\s*"no_new_content"')
+
+
+def _is_no_new_content_file(path: Path) -> bool:
+    """Whether path's head marks it as an ingest file with no new content."""
+    with open(path, "rb") as f:
+        head = f.read(NO_NEW_CONTENT_HEAD_BYTES)
+    return _NO_NEW_CONTENT_RE.search(head) is not None
+
+
+# Top-level keys that may hold a source file's items, besides "data" and the
+# source's own name
+SOURCE_CONTAINER_KEYS = {
+    "medium": ("articles",),
+    "telegram": ("messages",),
+    "forum": ("posts", "forum_posts"),
+}
+
+# GitHub activity type -> (title field, fallback title, content field)
+TITLE_CONTENT_MAP = {
+    "commits": ("message", "Unknown commit", "message"),
+    "pull_requests": ("title", "Unknown pull_request", "body"),
+    "issues": ("title", "Unknown issue", "body"),
+}
+
+
+def _container_keys(source_name: str) -> Tuple[str, ...]:
+    """Return the top-level keys checked, in order, for a source's item list."""
+    return ("data", source_name) + SOURCE_CONTAINER_KEYS.get(source_name, ())
+
+
+def _make_extractor(source_name: str) -> Callable[[Any], List[Dict]]:
+    """Build the function that pulls a source file's item list from its JSON."""
+    keys = _container_keys(source_name)
+    find_forum_posts = source_name == "forum"
+
+    def extract(data: Any) -> List[Dict]:
+        if isinstance(data, list):
+            # Direct list of items
+            return data
+        if not isinstance(data, dict):
+            # Unexpected format
+            return []
+
+        for key in keys:
+            if key in data:
+                return data[key]
+
+        if find_forum_posts and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Forum data keys found: %s", list(data.keys()))
+
+        # One pass over the values: forum data returns the first list of
+        # forum-like items; otherwise every list is kept for flattening
+        lists = []
+        for key, value in data.items():
+            if not isinstance(value, list):
+                continue
+            if (
+                find_forum_posts
+                and value
+                and isinstance(value[0], dict)
+                and ("post_id" in value[0] or "topic_id" in value[0])
+            ):
+                logger.info(f"Found forum posts in key '{key}': {len(value)} items")
+                return value
+            lists.append(value)
+
+        # FIX: Flatten a dict of lists (helps with briefing generation);
+        # empty if the dict has no expected keys or lists
+        return list(chain.from_iterable(lists))
+
+    return extract
+
+
+def _make_loader(source_name: str) -> Callable[[Path], List[Dict]]:
+    """Build the function that reads a source's dated file and returns its items."""
+    extract = _make_extractor(source_name)
+
+    def load(path: Path) -> List[Dict]:
+        return extract(_load_json_file(path))
+
+    return load
+
+
 class SourcesAggregator:
+    # Mapping of source directories to aggregated data keys
+    source_mappings = MappingProxyType(
+        {
+            "medium": "medium_articles",
+            "telegram": "telegram_messages",
+            "github": "github_activities",
+            "discord": "discord_messages",
+            "forum": "forum_posts",
+            "news": "news_articles",
+        }
+    )
+
+    # Date field name used by each source's items
+    date_field_mapping = MappingProxyType(
+        {
+            "medium": "published",
+            "telegram": "date",
+            "github": "created_at",
+            "discord": "date",
+            "forum": "created_at",
+            "news": "date",
+        }
+    )
+
     def __init__(
         self,
         sources_dir: str = "sources",
@@ -57,30 +399,51 @@ class SourcesAggregator:
         self.force = force
         self.work_dir = Path(work_dir)
 
-        # Initialize resource management
-        self.resource_manager = LargeDatasetManager(work_dir)
-        self.resource_monitor = ResourceMonitor()
+        # (file names, subdirectory names) per scanned directory, so checking
+        # for a date's file is a set lookup instead of a stat per source/date
+        self._dir_index: Dict[Path, Tuple[Set[str], List[str]]] = {}
 
-        # Mapping of source directories to aggregated data keys
-        self.source_mappings = {
-            "medium": "medium_articles",
-            "telegram": "telegram_messages",
-            "github": "github_activities",
-            "discord": "discord_messages",
-            "forum": "forum_posts",
-            "news": "news_articles",
+        # Source directory Paths, built once instead of on every load call
+        self._source_dirs = {
+            source_name: self.sources_dir / source_name
+            for source_name in self.source_mappings
         }
 
-        # Initialize signal enrichment service
-        self.signal_service = SignalEnrichmentService()
+        # Dated-file loader per source, specialized once instead of per file
+        self._loaders = {
+            source_name: _make_loader(source_name)
+            for source_name in self.source_mappings
+        }
 
         logger.info(f"SourcesAggregator initialized with force={force}")
         logger.info(f"Resource management enabled for work_dir: {work_dir}")
 
+    @cached_property
+    def resource_manager(self) -> "LargeDatasetManager":
+        """Large dataset manager for work_dir, created on first use."""
+        from scripts.resource_manager import LargeDatasetManager
+
+        return LargeDatasetManager(self.work_dir)
+
+    @cached_property
+    def resource_monitor(self) -> "ResourceMonitor":
+        """Resource monitor, created on first use."""
+        from scripts.resource_manager import ResourceMonitor
+
+        return ResourceMonitor()
+
+    @cached_property
+    def signal_service(self) -> "SignalEnrichmentService":
+        """Signal enrichment service, created (loading its config) on first use."""
+        from signal_enrichment import SignalEnrichmentService
+
+        return SignalEnrichmentService()
+
     def get_daily_file_path(self, date: str) -> Path:
         """Get the file path for aggregated data for a given date."""
         if date == "full_history":
-            return self.output_dir / "full_history_aggregated.json"
+            # Backfill output is large, so it is stored gzip-compressed
+            return self.output_dir / "full_history_aggregated.json.gz"
         else:
             return self.output_dir / f"{date}.json"
 
@@ -88,283 +451,185 @@ class SourcesAggregator:
         """Get the path to a period aggregated file."""
         return self.output_dir / f"{period_label}-{period_type}.json"
 
+    def _source_dir(self, source_name: str) -> Path:
+        """Return the Path of a source's directory."""
+        return self._source_dirs.get(source_name) or self.sources_dir / source_name
+
     def load_source_data(self, source_name: str, date: str) -> List[Dict]:
         """Load data from a specific source folder for a given date."""
-        source_folder = self.sources_dir / source_name
+        source_folder = self._source_dir(source_name)
 
         # For backfill mode, look for full_history.json files
         if date == "full_history":
-            history_file = source_folder / "full_history.json"
-            if history_file.exists():
+            if "full_history.json" in self._files_in(source_folder):
+                history_file = source_folder / "full_history.json"
                 try:
-                    with open(history_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    # Handle different data structures
-                    if isinstance(data, dict):
-                        if "data" in data:
-                            return data["data"]
-                        elif source_name in data:
-                            return data[source_name]
-                        elif "articles" in data and source_name == "medium":
-                            return data["articles"]
-                        elif "messages" in data and source_name == "telegram":
-                            return data["messages"]
-                        elif "posts" in data and source_name == "forum":
-                            return data["posts"]
-                        elif "forum_posts" in data and source_name == "forum":
-                            # FIX: Handle forum_posts key in backfill mode
-                            return data["forum_posts"]
-                        else:
-                            # If it's a dict but no expected keys, return empty
-                            return []
-                    elif isinstance(data, list):
-                        return data
-                    else:
-                        return []
+                    # Backfill files can be large, so items are streamed
+                    # rather than loading the whole document
+                    return list(
+                        _iter_json_items(history_file, _container_keys(source_name))
+                    )
                 except Exception as e:
-                    print(f"Warning: Could not read {history_file}: {e}")
+                    logger.warning(f"Could not read {history_file}: {e}")
                     return []
             else:
                 # No full_history.json file exists for this source
                 return []
 
-        # Regular dated file processing (existing logic)
-        date_file = source_folder / f"{date}.json"
-        if not date_file.exists():
+        # Regular dated file processing (existing logic); the file's Path is
+        # only built once the directory listing shows it exists
+        file_name = f"{date}.json"
+        if file_name not in self._files_in(source_folder):
             return []
+        date_file = source_folder / file_name
 
+        loader = self._loaders.get(source_name) or _make_loader(source_name)
         try:
-            with open(date_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Handle different data structures that various sources might have
-            if isinstance(data, dict):
-                # Check for common data container keys
-                if "data" in data:
-                    return data["data"]
-                elif source_name in data:
-                    return data[source_name]
-                elif "articles" in data and source_name == "medium":
-                    return data["articles"]
-                elif "messages" in data and source_name == "telegram":
-                    return data["messages"]
-                elif "posts" in data and source_name == "forum":
-                    return data["posts"]
-                elif "forum_posts" in data and source_name == "forum":
-                    # FIX: Handle alternative forum data structure
-                    return data["forum_posts"]
-                else:
-                    # FIX: Enhanced debugging for forum data structures
-                    if source_name == "forum":
-                        print(f"Debug: Forum data keys found: {list(data.keys())}")
-                        # Try to find any list of forum-like data
-                        for key, value in data.items():
-                            if isinstance(value, list) and len(value) > 0:
-                                first_item = value[0]
-                                if isinstance(first_item, dict) and (
-                                    "post_id" in first_item or "topic_id" in first_item
-                                ):
-                                    print(
-                                        f"Found forum posts in key '{key}': "
-                                        f"{len(value)} items"
-                                    )
-                                    return value
-
-                    # FIX: Return as list if it's a dict with data
-                    # (helps with briefing generation)
-                    if isinstance(data, dict) and any(
-                        isinstance(v, list) for v in data.values()
-                    ):
-                        # For sources like forum, convert dict values to flattened list
-                        all_items = []
-                        for key, value in data.items():
-                            if isinstance(value, list):
-                                all_items.extend(value)
-                        return all_items
-
-                    # If it's a dict but no expected keys, return empty
-                    return []
-            elif isinstance(data, list):
-                # Direct list of items
-                return data
-            else:
-                # Unexpected format
-                return []
-
+            return loader(date_file)
         except Exception as e:
-            print(f"Warning: Could not read {date_file}: {e}")
+            logger.warning(f"Could not read {date_file}: {e}")
             return []
 
     def load_telegram_data(self, date: str) -> List[Dict]:
         """Load Telegram data from all group directories for a given date."""
-        telegram_dir = self.sources_dir / "telegram"
+        telegram_dir = self._source_dir("telegram")
         all_messages = []
 
         if not telegram_dir.exists():
-            print("No Telegram directory found")
+            logger.info("No Telegram directory found")
             return []
 
         # Check for main telegram file first (new structure)
-        main_file = telegram_dir / f"{date}.json"
-        if main_file.exists():
+        file_name = f"{date}.json"
+        telegram_files, group_names = self._dir_listing(telegram_dir)
+        if file_name in telegram_files:
+            main_file = telegram_dir / file_name
             try:
-                with open(main_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                if isinstance(data, dict) and data.get("status") == "no_new_content":
-                    print(
-                        f"No Telegram data found for {date} "
-                        "(empty file with metadata)"
-                    )
-                    return []
-                elif isinstance(data, dict) and "messages" in data:
-                    messages = data.get("messages", [])
-                    msg_count = len(messages)
-                    print(f"Loaded {msg_count} Telegram messages from main")
+                messages = list(_iter_json_items(main_file, ("messages",)))
+                if messages:
+                    logger.info(f"Loaded {len(messages)} Telegram messages from main")
                     return messages
-                elif isinstance(data, list):
-                    print(f"Loaded {len(data)} Telegram messages from main")
-                    return data
+                # Empty or metadata-only file; fall back to group directories
             except Exception as e:
-                print(f"Error loading main Telegram file: {e}")
+                logger.error(f"Error loading main Telegram file: {e}")
 
         # Fallback: Check group subdirectories (legacy structure)
         group_count = 0
-        for group_dir in telegram_dir.iterdir():
-            if group_dir.is_dir():
-                daily_file = group_dir / f"{date}.json"
-                if daily_file.exists():
-                    try:
+        for group_name in group_names:
+            group_dir = telegram_dir / group_name
+            if file_name in self._files_in(group_dir):
+                daily_file = group_dir / file_name
+                try:
+                    if _is_no_new_content_file(daily_file):
+                        data = {"status": "no_new_content"}
+                    else:
                         with open(daily_file, "r", encoding="utf-8") as f:
                             data = json.load(f)
 
-                        # Handle new metadata structure or legacy structure
-                        if (
-                            isinstance(data, dict)
-                            and data.get("status") == "no_new_content"
-                        ):
-                            print(
-                                f"No new content found for "
-                                f"{group_dir.name} on {date} "
-                                f"(empty file with metadata)"
-                            )
-                            group_count += 1  # Still count as processed
-                        elif isinstance(data, dict) and "messages" in data:
-                            # New structure with metadata
-                            group_data = data.get("messages", [])
-                            all_messages.extend(group_data)
-                            group_count += 1
-                            group_msg_count = len(group_data)
-                            print(
-                                f"Loaded {group_msg_count} "
-                                f"messages from {group_dir.name}"
-                            )
-                        elif isinstance(data, list):
-                            # Legacy structure (list of messages)
-                            all_messages.extend(data)
-                            group_count += 1
-                            print(
-                                f"Loaded {len(data)} messages " f"from {group_dir.name}"
-                            )
-                        else:
-                            print(f"Unexpected data in {group_dir.name}")
+                    # Handle new metadata structure or legacy structure
+                    if (
+                        isinstance(data, dict)
+                        and data.get("status") == "no_new_content"
+                    ):
+                        # Per group and date, so only logged at DEBUG
+                        logger.debug(
+                            "No new content found for %s on %s "
+                            "(empty file with metadata)",
+                            group_name,
+                            date,
+                        )
+                        group_count += 1  # Still count as processed
+                    elif isinstance(data, dict) and "messages" in data:
+                        # New structure with metadata
+                        group_data = data.get("messages", [])
+                        all_messages.extend(group_data)
+                        group_count += 1
+                        logger.debug(
+                            "Loaded %d messages from %s", len(group_data), group_name
+                        )
+                    elif isinstance(data, list):
+                        # Legacy structure (list of messages)
+                        all_messages.extend(data)
+                        group_count += 1
+                        logger.debug(
+                            "Loaded %d messages from %s", len(data), group_name
+                        )
+                    else:
+                        logger.warning(f"Unexpected data in {group_dir.name}")
 
-                    except Exception as e:
-                        print(f"Error loading {group_dir.name} data: {e}")
+                except Exception as e:
+                    logger.error(f"Error loading {group_dir.name} data: {e}")
 
         if group_count == 0:
-            print(f"No Telegram data found for {date}")
+            logger.info(f"No Telegram data found for {date}")
         else:
-            total_msgs = len(all_messages)
-            print(
-                f"Loaded {total_msgs} total Telegram messages "
+            logger.info(
+                f"Loaded {len(all_messages)} total Telegram messages "
                 f"from {group_count} groups"
             )
 
         return all_messages
 
+    def _github_repo_activities(self, repo_name: str, repo_data: Any) -> List[Dict]:
+        """Flatten one repository's { activity_type: [items] } into activities."""
+        activities = []
+        if not isinstance(repo_data, dict):
+            return activities
+
+        for activity_type, items in repo_data.items():
+            if not isinstance(items, list):
+                continue
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+
+                # The parsed tree is ours, so items are annotated in place
+                # rather than copied
+                item["repo"] = repo_name
+                item["activity_type"] = activity_type
+
+                mapping = TITLE_CONTENT_MAP.get(activity_type)
+                if mapping is None:
+                    # Ensure content field exists for facts extraction
+                    item.setdefault("content", "")
+                else:
+                    title_field, default_title, content_field = mapping
+                    # FIX: Add proper title mapping for GitHub activities
+                    item["title"] = item.get(title_field, default_title)
+                    if "content" not in item:
+                        item["content"] = item.get(content_field, "")
+
+                activities.append(item)
+        return activities
+
     def load_github_activities(self, date: str) -> List[Dict]:
         """Load processed GitHub activity data for a given date."""
-        github_folder = Path(self.sources_dir) / "github"
+        github_folder = self._source_dir("github")
 
         # For backfill mode, look for full_history.json
         if date == "full_history":
+            if "full_history.json" not in self._files_in(github_folder):
+                return []
             history_file = github_folder / "full_history.json"
-            if history_file.exists():
-                try:
-                    with open(history_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    # Process GitHub history data structure
-                    if isinstance(data, dict):
-                        activities = []
-                        # GitHub full_history structure:
-                        # { repo_name: { activity_type: [items] } }
-                        for repo_name, repo_data in data.items():
-                            if isinstance(repo_data, dict):
-                                for activity_type, items in repo_data.items():
-                                    if isinstance(items, list):
-                                        for item in items:
-                                            if isinstance(item, dict):
-                                                # FIX: Add proper title mapping
-                                                # for GitHub activities
-                                                enriched_item = {
-                                                    **item,
-                                                    "repo": repo_name,
-                                                    "activity_type": activity_type,
-                                                }
-
-                                                # Map proper titles based on
-                                                # activity type
-                                                if activity_type == "commits":
-                                                    enriched_item["title"] = item.get(
-                                                        "message", "Unknown commit"
-                                                    )
-                                                elif activity_type in [
-                                                    "pull_requests",
-                                                    "issues",
-                                                ]:
-                                                    enriched_item["title"] = item.get(
-                                                        "title",
-                                                        f"Unknown {activity_type[:-1]}",
-                                                    )
-
-                                                # Ensure content field exists
-                                                # for facts extraction
-                                                if "content" not in enriched_item:
-                                                    if activity_type == "commits":
-                                                        enriched_item["content"] = (
-                                                            item.get("message", "")
-                                                        )
-                                                    elif (
-                                                        activity_type == "pull_requests"
-                                                    ):
-                                                        enriched_item["content"] = (
-                                                            item.get("body", "")
-                                                        )
-                                                    elif activity_type == "issues":
-                                                        enriched_item["content"] = (
-                                                            item.get("body", "")
-                                                        )
-                                                    else:
-                                                        enriched_item["content"] = ""
-
-                                                activities.append(enriched_item)
-                        return activities
-                    elif isinstance(data, list):
-                        return data
-                    return []
-                except Exception as e:
-                    print(f"Warning: Could not read GitHub history: {e}")
-                    return []
-            else:
+            try:
+                # GitHub full_history structure:
+                # { repo_name: { activity_type: [items] } }
+                # streamed one repository at a time
+                activities = []
+                for repo_name, repo_data in _iter_json_object(history_file):
+                    activities.extend(
+                        self._github_repo_activities(repo_name, repo_data)
+                    )
+                return activities
+            except Exception as e:
+                logger.warning(f"Could not read GitHub history: {e}")
                 return []
 
         # Regular dated file processing (existing logic)
-        date_file = github_folder / f"{date}.json"
-        if not date_file.exists():
+        file_name = f"{date}.json"
+        if file_name not in self._files_in(github_folder):
             return []
+        date_file = github_folder / file_name
 
         try:
             with open(date_file, "r", encoding="utf-8") as f:
@@ -374,61 +639,49 @@ class SourcesAggregator:
             if isinstance(data, dict):
                 # Process each repository's activities
                 for repo_name, repo_data in data.items():
-                    if isinstance(repo_data, dict):
-                        for activity_type, items in repo_data.items():
-                            if isinstance(items, list):
-                                for item in items:
-                                    if isinstance(item, dict):
-                                        # FIX: Add proper title mapping
-                                        # for GitHub activities
-                                        enriched_item = {
-                                            **item,
-                                            "repo": repo_name,
-                                            "activity_type": activity_type,
-                                        }
-
-                                        # Map proper titles based on activity type
-                                        if activity_type == "commits":
-                                            enriched_item["title"] = item.get(
-                                                "message", "Unknown commit"
-                                            )
-                                        elif activity_type in [
-                                            "pull_requests",
-                                            "issues",
-                                        ]:
-                                            enriched_item["title"] = item.get(
-                                                "title", f"Unknown {activity_type[:-1]}"
-                                            )
-
-                                        # Ensure content field exists
-                                        # for facts extraction
-                                        if "content" not in enriched_item:
-                                            if activity_type == "commits":
-                                                enriched_item["content"] = item.get(
-                                                    "message", ""
-                                                )
-                                            elif activity_type == "pull_requests":
-                                                enriched_item["content"] = item.get(
-                                                    "body", ""
-                                                )
-                                            elif activity_type == "issues":
-                                                enriched_item["content"] = item.get(
-                                                    "body", ""
-                                                )
-                                            else:
-                                                enriched_item["content"] = ""
-
-                                        activities.append(enriched_item)
+                    activities.extend(
+                        self._github_repo_activities(repo_name, repo_data)
+                    )
             return activities
 
         except Exception as e:
-            print(f"Warning: Could not read GitHub activities: {e}")
+            logger.warning(f"Could not read GitHub activities: {e}")
             return []
 
+    def clear_cache(self) -> None:
+        """Forget cached directory scans."""
+        self._dir_index.clear()
+
+    def _dir_listing(self, directory: Path) -> Tuple[Set[str], List[str]]:
+        """
+        Return directory's (file names, subdirectory names), scanned once.
+
+        A missing directory lists as empty. Files added after the first scan
+        are not seen until clear_cache().
+        """
+        listing = self._dir_index.get(directory)
+        if listing is None:
+            files, subdirs = set(), []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            files.add(entry.name)
+            except OSError:
+                pass
+            listing = self._dir_index[directory] = (files, subdirs)
+        return listing
+
+    def _files_in(self, directory: Path) -> Set[str]:
+        """Return the names of the files in directory, scanned once."""
+        return self._dir_listing(directory)[0]
+
     def aggregate_daily_sources(self, date: str = None) -> Dict[str, Any]:
         """Aggregate all sources for a given date into raw aggregated data."""
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = _today()
 
         if date == "full_history":
             print("\n🔄 Aggregating comprehensive historical data (backfill mode)")
@@ -443,8 +696,7 @@ class SourcesAggregator:
             existing_aggregated_path = self.get_daily_file_path(date)
             if existing_aggregated_path.exists():
                 try:
-                    with open(existing_aggregated_path, "r", encoding="utf-8") as f:
-                        existing_data = json.load(f)
+                    existing_data = _load_json_file(existing_aggregated_path)
 
                     # Add flag to indicate this was loaded from existing file
                     existing_data["_loaded_from_existing"] = True
@@ -476,49 +728,41 @@ class SourcesAggregator:
             },
         }
 
-        # Load data from each source and apply signal enrichment with scoring
-        for source_folder, aggregated_key in self.source_mappings.items():
-            source_data = self.load_source_data(source_folder, date)
-
-            # Apply signal enrichment and sorting with appropriate date fields
-            if source_data:
-                # Determine the date field based on source type
-                date_field = self._get_date_field_for_source(source_folder)
-
-                # Enrich items with signal metadata and scoring
-                enriched_data = self.signal_service.enrich_items(
-                    source_data, date_field=date_field
+        # Sources are independent files, so they are loaded concurrently; the
+        # signal service is read-only after init, so workers enrich too
+        # Create the (lazy) signal service here, not racing in the workers
+        self.signal_service
+        with ThreadPoolExecutor(max_workers=len(self.source_mappings) + 1) as executor:
+            source_futures = {
+                source_folder: executor.submit(
+                    self._load_enriched_source, source_folder, date
                 )
-                # Sort by signal priority using the new final_score
-                sorted_data = self.signal_service.sort_by_signal_priority(enriched_data)
-                aggregated_data["sources"][aggregated_key] = sorted_data
-            else:
-                aggregated_data["sources"][aggregated_key] = source_data
+                for source_folder in self.source_mappings
+            }
+            # GitHub activities are loaded separately (for facts extraction)
+            github_future = executor.submit(self._load_enriched_github, date)
+
+        # Collect in source_mappings order so the output layout is stable
+        sources = aggregated_data["sources"]
+        sources_processed = aggregated_data["metadata"]["sources_processed"]
+        total_items = 0
+        for source_folder, aggregated_key in self.source_mappings.items():
+            source_data = source_futures[source_folder].result()
+            sources[aggregated_key] = source_data
 
-            if source_data:
-                aggregated_data["metadata"]["total_items"] += len(source_data)
-                aggregated_data["metadata"]["sources_processed"].append(
-                    f"{source_folder}: {len(source_data)} items"
-                )
+            n = len(source_data)
+            if n:
+                total_items += n
+                sources_processed.append(f"{source_folder}: {n} items")
 
-        # Load GitHub activities separately (for facts extraction) and apply
-        # signal enrichment with scoring
-        github_activities = self.load_github_activities(date)
-        if github_activities:
-            # Apply signal enrichment to GitHub activities with appropriate date field
-            enriched_github_activities = self.signal_service.enrich_items(
-                github_activities, date_field="date"
-            )
-            # Sort GitHub activities by signal priority using final_score
-            sorted_github_activities = self.signal_service.sort_by_signal_priority(
-                enriched_github_activities
-            )
-            aggregated_data["sources"]["github_activities"] = sorted_github_activities
+        github_activities = github_future.result()
+        n = len(github_activities)
+        if n:
+            sources["github_activities"] = github_activities
+            total_items += n
+            sources_processed.append(f"github_activities: {n} items")
 
-            aggregated_data["metadata"]["total_items"] += len(github_activities)
-            aggregated_data["metadata"]["sources_processed"].append(
-                f"github_activities: {len(github_activities)} items"
-            )
+        aggregated_data["metadata"]["total_items"] = total_items
 
         # Add empty structures for other data types
         aggregated_data["sources"]["onchain_data"] = {}
@@ -567,31 +811,38 @@ class SourcesAggregator:
 
         return aggregated_data
 
+    def _enrich_and_sort(self, items: List[Dict], date_field: str) -> List[Dict]:
+        """Apply signal enrichment with scoring, then sort by signal priority."""
+        if not items:
+            return items
+        # Items were just parsed for this run, so enrich them without copying
+        return self.signal_service.enrich_and_sort(
+            items, date_field=date_field, in_place=True
+        )
+
+    def _load_enriched_source(self, source_folder: str, date: str) -> List[Dict]:
+        """Load one source's items for date, enriched and sorted."""
+        return self._enrich_and_sort(
+            self.load_source_data(source_folder, date),
+            self._get_date_field_for_source(source_folder),
+        )
+
+    def _load_enriched_github(self, date: str) -> List[Dict]:
+        """Load GitHub activities for date, enriched and sorted."""
+        return self._enrich_and_sort(self.load_github_activities(date), "date")
+
     def _get_date_field_for_source(self, source_folder: str) -> str:
         """Get the appropriate date field name for a given source type."""
-        date_field_mapping = {
-            "medium": "published",
-            "telegram": "date",
-            "github": "created_at",
-            "discord": "date",
-            "forum": "created_at",
-            "news": "date",
-        }
-        return date_field_mapping.get(source_folder, "date")
+        return self.date_field_mapping.get(source_folder, "date")
 
     def save_aggregated_data(self, data: Dict[str, Any], date: str = None) -> Path:
         """Save the aggregated data to file."""
         if date is None:
-            date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
+            date = data.get("date") or _today()
 
-        # For backfill mode, save to a special backfill file
-        if date == "full_history":
-            output_path = self.output_dir / "full_history_aggregated.json"
-        else:
-            output_path = self.get_daily_file_path(date)
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Backfill mode saves to a special (compressed) backfill file
+        output_path = self.get_daily_file_path(date)
+        _write_json_atomic(output_path, data)
 
         return output_path
 
@@ -606,7 +857,15 @@ class SourcesAggregator:
             Success message or error description
         """
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = _today()
+
+        # Check if output already exists
+        output_path = self.get_daily_file_path(date)
+        if output_path.exists() and not self.force:
+            logger.info(f"Aggregated data already exists for {date} at {output_path}")
+            return f"Already exists: {output_path}"
+
+        from scripts.resource_manager import check_resources
 
         # Check resources before starting
         resource_report = check_resources(self.work_dir)
@@ -616,15 +875,12 @@ class SourcesAggregator:
             f"{resource_report['disk']['message']}"
         )
 
-        # Check if output already exists
-        output_path = self.get_daily_file_path(date)
-        if output_path.exists() and not self.force:
-            logger.info(f"Aggregated data already exists for {date} at {output_path}")
-            return f"Already exists: {output_path}"
-
         try:
-            # Process aggregation with resource management
-            aggregated_data = self._run_single_date_aggregation_with_resources(date)
+            # Process aggregation with resource management; sources are loaded
+            # as they are written, so only one is held in memory at a time
+            aggregated_data = self._run_single_date_aggregation_with_resources(
+                date, stream=True
+            )
 
             # Save with atomic write and resource checking
             self._save_aggregated_data_safely(aggregated_data, output_path)
@@ -653,8 +909,17 @@ class SourcesAggregator:
                 logger.error(f"Recovery failed for {date}: {recovery_error}")
                 return f"Failed: {str(e)} (Recovery also failed: {recovery_error})"
 
-    def _run_single_date_aggregation_with_resources(self, date: str) -> Dict[str, Any]:
-        """Run single date aggregation with comprehensive resource management."""
+    def _run_single_date_aggregation_with_resources(
+        self, date: str, stream: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run single date aggregation with comprehensive resource management.
+
+        With stream, "sources" is left as an iterator of (key, items) pairs
+        that loads each source as it is consumed; the metadata is filled in
+        once the iterator is exhausted. Writing it with _write_json_atomic
+        then holds one source in memory at a time instead of all of them.
+        """
         logger.info(f"Aggregating data for {date} with resource management")
 
         # Initialize aggregated data structure
@@ -669,107 +934,127 @@ class SourcesAggregator:
             },
         }
 
-        # Initialize source containers
-        for source_name, aggregated_key in self.source_mappings.items():
-            aggregated_data["sources"][aggregated_key] = []
+        sources = self._iter_sources_with_resources(date, aggregated_data["metadata"])
+        aggregated_data["sources"] = sources if stream else dict(sources)
+        return aggregated_data
 
-        # Add containers for special sources
-        aggregated_data["sources"]["github_activities"] = []
-        aggregated_data["sources"]["onchain_data"] = {}
-        aggregated_data["sources"]["documentation"] = []
+    def _load_source_with_resources(
+        self, source_name: str, date: str
+    ) -> Tuple[Any, Optional[int]]:
+        """
+        Load one source for the aggregated file, checking resources first.
 
-        total_items = 0
-        sources_processed = []
+        Returns the value to store and its item count, or ([], None) when the
+        source has no data for the date.
+        """
+        # Check resources before processing each source
+        resource_report = self.resource_monitor.get_resource_report(self.work_dir)
 
-        # Process each source with resource monitoring
-        for source_name, aggregated_key in self.source_mappings.items():
-            try:
-                # Check resources before processing each source
-                resource_report = self.resource_monitor.get_resource_report(
-                    self.work_dir
+        if not resource_report["overall_safe"]:
+            logger.warning(
+                f"Resource warning before processing {source_name}: "
+                f"{resource_report['memory']['message']}"
+            )
+
+            # Trigger garbage collection
+            freed = self.resource_monitor.trigger_gc()
+            if freed > 0:
+                logger.info(
+                    f"Freed {freed / (1024**3):.2f}GB before "
+                    f"processing {source_name}"
                 )
 
-                if not resource_report["overall_safe"]:
-                    logger.warning(
-                        f"Resource warning before processing {source_name}: "
-                        f"{resource_report['memory']['message']}"
-                    )
+        # Load source data with resource management
+        if source_name == "github":
+            source_data = self.load_github_activities(date)
+        else:
+            source_data = self.load_source_data(source_name, date)
 
-                    # Trigger garbage collection
-                    freed = self.resource_monitor.trigger_gc()
-                    if freed > 0:
-                        logger.info(
-                            f"Freed {freed / (1024**3):.2f}GB before "
-                            f"processing {source_name}"
-                        )
+        if not source_data:
+            return [], None
 
-                # Load source data with resource management
-                if source_name == "github":
-                    source_data = self.load_github_activities(date)
-                else:
-                    source_data = self.load_source_data(source_name, date)
+        # Process source data in chunks if it's large
+        if isinstance(source_data, dict) and any(
+            isinstance(v, list) and len(v) > 1000 for v in source_data.values()
+        ):
+            logger.info(
+                f"Large dataset detected in {source_name}, using chunked processing"
+            )
+            processed_data = self._process_large_source_data(
+                source_data, source_name, date
+            )
+        else:
+            processed_data = source_data
+
+        # Handle different data structures
+        if isinstance(processed_data, list):
+            return processed_data, len(processed_data)
+        if isinstance(processed_data, dict):
+            # Look for list data in the structure
+            if "data" in processed_data and isinstance(processed_data["data"], list):
+                return processed_data["data"], len(processed_data["data"])
+            if "items" in processed_data and isinstance(processed_data["items"], list):
+                return processed_data["items"], len(processed_data["items"])
+            # Store the whole structure
+            return processed_data, 1
+        return [processed_data], 1
+
+    def _iter_sources_with_resources(
+        self, date: str, metadata: Dict[str, Any]
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (aggregated key, data) for every source, loading each in turn.
 
-                if source_data:
-                    # Process source data in chunks if it's large
-                    if isinstance(source_data, dict) and any(
-                        isinstance(v, list) and len(v) > 1000
-                        for v in source_data.values()
-                    ):
-                        logger.info(
-                            f"Large dataset detected in {source_name}, "
-                            f"using chunked processing"
-                        )
-                        processed_data = self._process_large_source_data(
-                            source_data, source_name, date
-                        )
-                    else:
-                        processed_data = source_data
-
-                    # Handle different data structures
-                    if isinstance(processed_data, list):
-                        aggregated_data["sources"][aggregated_key] = processed_data
-                        item_count = len(processed_data)
-                    elif isinstance(processed_data, dict):
-                        # Look for list data in the structure
-                        if "data" in processed_data and isinstance(
-                            processed_data["data"], list
-                        ):
-                            aggregated_data["sources"][aggregated_key] = processed_data[
-                                "data"
-                            ]
-                            item_count = len(processed_data["data"])
-                        elif "items" in processed_data and isinstance(
-                            processed_data["items"], list
-                        ):
-                            aggregated_data["sources"][aggregated_key] = processed_data[
-                                "items"
-                            ]
-                            item_count = len(processed_data["items"])
-                        else:
-                            # Store the whole structure
-                            aggregated_data["sources"][aggregated_key] = processed_data
-                            item_count = 1
+        Keys come in source_mappings order followed by the special sources,
+        with an empty list for sources without data. The next source is read
+        on a worker thread while the current one is being written, so at most
+        two sources are held at once. metadata's counters and resource usage
+        are set after the last pair.
+        """
+        total_items = 0
+        sources_processed = []
+        sources = list(self.source_mappings.items())
+
+        # Process each source with resource monitoring, one source ahead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            if sources:
+                pending = executor.submit(
+                    self._load_source_with_resources, sources[0][0], date
+                )
+            for index, (source_name, aggregated_key) in enumerate(sources):
+                future, pending = pending, None
+                source_value = []
+                try:
+                    source_value, item_count = future.result()
+                    if item_count is None:
+                        logger.info(f"No data found for {source_name} on {date}")
                     else:
-                        aggregated_data["sources"][aggregated_key] = [processed_data]
-                        item_count = 1
+                        total_items += item_count
+                        sources_processed.append(f"{source_name}: {item_count} items")
+                        logger.info(f"Processed {source_name}: {item_count} items")
+                except Exception as e:
+                    logger.error(f"Error processing {source_name} for {date}: {e}")
+                    sources_processed.append(f"{source_name}: ERROR - {str(e)[:100]}")
 
-                    total_items += item_count
-                    sources_processed.append(f"{source_name}: {item_count} items")
-                    logger.info(f"Processed {source_name}: {item_count} items")
+                if index + 1 < len(sources):
+                    pending = executor.submit(
+                        self._load_source_with_resources, sources[index + 1][0], date
+                    )
 
-                else:
-                    logger.info(f"No data found for {source_name} on {date}")
+                yield aggregated_key, source_value
+                # Drop the previous source before loading the one after next
+                future = source_value = None
 
-            except Exception as e:
-                logger.error(f"Error processing {source_name} for {date}: {e}")
-                sources_processed.append(f"{source_name}: ERROR - {str(e)[:100]}")
-                continue
+        # Add containers for special sources
+        yield "onchain_data", {}
+        yield "documentation", []
 
         # Update metadata with resource usage
         final_resource_report = self.resource_monitor.get_resource_report(self.work_dir)
-        aggregated_data["metadata"]["total_items"] = total_items
-        aggregated_data["metadata"]["sources_processed"] = sources_processed
-        aggregated_data["metadata"]["resource_usage"] = {
+        metadata["total_items"] = total_items
+        metadata["sources_processed"] = sources_processed
+        metadata["resource_usage"] = {
             "peak_memory_gb": final_resource_report["memory"]["peak_gb"],
             "memory_status": final_resource_report["memory"]["level"],
             "disk_status": final_resource_report["disk"]["level"],
@@ -781,8 +1066,6 @@ class SourcesAggregator:
             f"from {len(sources_processed)} sources"
         )
 
-        return aggregated_data
-
     def _process_large_source_data(
         self, source_data: Dict[str, Any], source_name: str, date: str
     ) -> Dict[str, Any]:
@@ -808,6 +1091,10 @@ class SourcesAggregator:
                     f"{source_name}.{largest_key} in chunks"
                 )
 
+                from scripts.resource_manager import (
+                    process_with_resource_management,
+                )
+
                 # Process the large list in chunks
                 processed_items = process_with_resource_management(
                     largest_list,
@@ -897,9 +1184,6 @@ class SourcesAggregator:
         self, data: Dict[str, Any], output_path: Path
     ) -> None:
         """Save aggregated data with atomic write and resource checking."""
-        import tempfile
-        import shutil
-
         # Check disk space before saving
         resource_report = self.resource_monitor.get_resource_report(self.work_dir)
 
@@ -908,57 +1192,13 @@ class SourcesAggregator:
                 f"Insufficient disk space: {resource_report['disk']['message']}"
             )
 
-        # Estimate output size
-        data_json = json.dumps(data, indent=2, ensure_ascii=False)
-        estimated_size = len(data_json.encode("utf-8"))
-
+        logger.info(f"Saving aggregated data to {output_path}")
+        written_size = _write_json_atomic(output_path, data)
         logger.info(
-            f"Saving aggregated data ({estimated_size / (1024**3):.3f}GB) "
-            f"to {output_path}"
+            f"Successfully saved aggregated data "
+            f"({written_size / (1024**3):.3f}GB) to {output_path}"
         )
 
-        # Use temporary file for atomic write
-        temp_fd = None
-        temp_path = None
-
-        try:
-            temp_fd, temp_path = tempfile.mkstemp(
-                suffix=".tmp",
-                prefix=f"aggregate_{data['date']}_",
-                dir=output_path.parent,
-                text=True,
-            )
-
-            # Write to temporary file
-            with open(temp_fd, "w", encoding="utf-8", closefd=True) as temp_file:
-                temp_file.write(data_json)
-                temp_file.flush()
-
-            # Atomic move
-            shutil.move(temp_path, output_path)
-            temp_path = None  # Prevent cleanup since file was moved
-
-            logger.info(f"Successfully saved aggregated data to {output_path}")
-
-        except Exception as e:
-            # Cleanup on error
-            if temp_path and Path(temp_path).exists():
-                try:
-                    Path(temp_path).unlink()
-                except Exception:
-                    pass
-            raise e
-
-        finally:
-            # Close temp file descriptor if it wasn't closed
-            if temp_fd is not None:
-                try:
-                    import os
-
-                    os.close(temp_fd)
-                except Exception:
-                    pass
-
     def generate_date_range(self, start_date: str, end_date: str) -> Iterator[str]:
         """Generate a range of dates between start_date and end_date (inclusive)."""
         start = datetime.strptime(start_date, "%Y-%m-%d")
@@ -966,7 +1206,7 @@ class SourcesAggregator:
 
         current = start
         while current <= end:
-            yield current.strftime("%Y-%m-%d")
+            yield current.date().isoformat()
             current += timedelta(days=1)
 
     def get_period_chunks(
@@ -991,8 +1231,8 @@ class SourcesAggregator:
 
                 # Only include if the week overlaps with our date range
                 if current <= end and actual_end >= start:
-                    period_start = max(current, start).strftime("%Y-%m-%d")
-                    period_end = actual_end.strftime("%Y-%m-%d")
+                    period_start = max(current, start).date().isoformat()
+                    period_end = actual_end.date().isoformat()
                     week_label = f"{current.strftime('%Y-W%U')}"
                     chunks.append((period_start, period_end, week_label))
 
@@ -1011,8 +1251,8 @@ class SourcesAggregator:
 
                 # Only include if the month overlaps with our date range
                 if current <= end and actual_end >= start:
-                    period_start = max(current, start).strftime("%Y-%m-%d")
-                    period_end = actual_end.strftime("%Y-%m-%d")
+                    period_start = max(current, start).date().isoformat()
+                    period_end = actual_end.date().isoformat()
                     month_label = current.strftime("%Y-%m")
                     chunks.append((period_start, period_end, month_label))
 
@@ -1067,6 +1307,9 @@ class SourcesAggregator:
         dates_processed = []
         files_found = 0
         files_missing = 0
+        sources = combined_data["sources"]
+        total_items = 0
+        sources_processed = combined_data["metadata"]["sources_processed"]
 
         for date in self.generate_date_range(start_date, end_date):
             print(f"  Processing date: {date}")
@@ -1075,8 +1318,7 @@ class SourcesAggregator:
             daily_file = self.get_daily_file_path(date)
             if daily_file.exists():
                 try:
-                    with open(daily_file, "r", encoding="utf-8") as f:
-                        daily_data = json.load(f)
+                    daily_data = _load_json_file(daily_file)
 
                     files_found += 1
                     dates_processed.append(date)
@@ -1084,49 +1326,31 @@ class SourcesAggregator:
                     # Merge sources data
                     if "sources" in daily_data:
                         for source_key, source_data in daily_data["sources"].items():
-                            if source_key in combined_data["sources"]:
-                                if isinstance(source_data, list):
-                                    combined_data["sources"][source_key].extend(
-                                        source_data
-                                    )
-                                elif (
-                                    isinstance(source_data, dict)
-                                    and source_key == "onchain_data"
-                                ):
-                                    # For onchain_data, merge dict keys
-                                    for key, value in source_data.items():
-                                        if (
-                                            key
-                                            not in combined_data["sources"][source_key]
-                                        ):
-                                            combined_data["sources"][source_key][
-                                                key
-                                            ] = value
-                                        else:
-                                            # If it's a list, extend it
-                                            if isinstance(
-                                                combined_data["sources"][source_key][
-                                                    key
-                                                ],
-                                                list,
-                                            ):
-                                                combined_data["sources"][source_key][
-                                                    key
-                                                ].extend(value)
+                            combined = sources.get(source_key)
+                            if combined is None:
+                                continue
+                            if isinstance(source_data, list):
+                                combined.extend(source_data)
+                            elif (
+                                isinstance(source_data, dict)
+                                and source_key == "onchain_data"
+                            ):
+                                # For onchain_data, merge dict keys
+                                for key, value in source_data.items():
+                                    if key not in combined:
+                                        combined[key] = value
+                                    elif isinstance(combined[key], list):
+                                        # If it's a list, extend it
+                                        combined[key].extend(value)
 
                     # Add to metadata
-                    if "metadata" in daily_data:
-                        daily_meta = daily_data["metadata"]
-                        if "total_items" in daily_meta:
-                            combined_data["metadata"]["total_items"] += daily_meta[
-                                "total_items"
-                            ]
-
-                        if "sources_processed" in daily_meta:
-                            for source_info in daily_meta["sources_processed"]:
-                                combined_data["metadata"]["sources_processed"].append(
-                                    f"{date}: {source_info}"
-                                )
+                    daily_meta = daily_data.get("metadata")
+                    if daily_meta:
+                        total_items += daily_meta.get("total_items", 0)
+                        sources_processed.extend(
+                            f"{date}: {source_info}"
+                            for source_info in daily_meta.get("sources_processed", ())
+                        )
 
                 except Exception as e:
                     print(f"    Warning: Could not process {daily_file}: {e}")
@@ -1136,6 +1360,7 @@ class SourcesAggregator:
                 files_missing += 1
 
         # Update metadata
+        combined_data["metadata"]["total_items"] = total_items
         combined_data["metadata"]["days_processed"] = len(dates_processed)
         combined_data["metadata"]["files_found"] = files_found
         combined_data["metadata"]["files_missing"] = files_missing
@@ -1153,13 +1378,11 @@ class SourcesAggregator:
                     )
                     if source_name:
                         date_field = self._get_date_field_for_source(source_name)
-                        enriched_data = self.signal_service.enrich_items(
-                            source_data, date_field=date_field
-                        )
-                        sorted_data = self.signal_service.sort_by_signal_priority(
-                            enriched_data
+                        combined_data["sources"][source_key] = (
+                            self.signal_service.enrich_and_sort(
+                                source_data, date_field=date_field, in_place=True
+                            )
                         )
-                        combined_data["sources"][source_key] = sorted_data
 
             # Analyze signal distribution for the period
             signal_analysis = self.signal_service.analyze_signal_distribution(
@@ -1176,8 +1399,7 @@ class SourcesAggregator:
         filename = f"{period_label}-{period_type}.json"
         output_path = self.output_dir / filename
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _write_json_atomic(output_path, data)
 
         return output_path
 
@@ -1252,7 +1474,7 @@ class SourcesAggregator:
         )
 
 
-def main():
+def main(argv=None):
     """CLI entry point."""
     import argparse
 
@@ -1290,7 +1512,7 @@ def main():
         help="Period type for aggregation (daily, weekly, monthly). Default: monthly",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate arguments
     if args.start_date or args.end_date:
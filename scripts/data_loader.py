@@ -5,11 +5,12 @@ This module provides robust loading and validation capabilities for the three
 primary data sources: aggregated data, briefings, and facts.
 """
 
+import gzip
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import IO, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 import re
 
@@ -17,6 +18,21 @@ import re
 logger = logging.getLogger(__name__)
 
 
+def full_history_aggregated_path(aggregated_dir: Path) -> Path:
+    """Path of the backfill aggregated file in aggregated_dir."""
+    path = aggregated_dir / "full_history_aggregated.json.gz"
+    if not path.exists():
+        # Written uncompressed before backfill output was gzipped
+        path = aggregated_dir / "full_history_aggregated.json"
+    return path
+
+
+def open_json_file(path: Path) -> IO[str]:
+    """Open a JSON file for reading as text, decompressing it if it ends in .gz."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    return opener(path, "rt", encoding="utf-8")
+
+
 @dataclass
 class ValidationError:
     """Represents a data validation error."""
@@ -174,7 +190,7 @@ class JSONDataLoader:
         """Load and validate aggregated data."""
         # Handle both regular dates and backfill mode
         if date == "full_history":
-            file_path = self.aggregated_dir / f"{date}_aggregated.json"
+            file_path = full_history_aggregated_path(self.aggregated_dir)
         else:
             file_path = self.aggregated_dir / f"{date}.json"
 
@@ -226,7 +242,7 @@ class JSONDataLoader:
 
         # Try to load JSON
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with open_json_file(file_path) as f:
                 data = json.load(f)
             result.loaded_data = data
             logger.debug(f"Successfully loaded {source_name} data from {file_path}")
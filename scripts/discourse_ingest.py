@@ -1174,8 +1174,15 @@ def process_forum(
     return all_posts
 
 
-def save_forum_data(all_posts, date=None, full_history=False, output_path=None):
-    """Save forum posts data to dated JSON files grouped by creation date"""
+def save_forum_data(
+    all_posts, date=None, full_history=False, output_path=None, run_date=None
+):
+    """
+    Save forum posts data to dated JSON files grouped by creation date.
+
+    Posts without a parseable creation date go to the run_date file
+    (YYYY-MM-DD, default today in UTC).
+    """
     if full_history:
         date_str = "full_history"
         if output_path:
@@ -1316,7 +1323,7 @@ def save_forum_data(all_posts, date=None, full_history=False, output_path=None):
 
         # Handle posts with unknown dates - save them to today's file
         if posts_with_unknown_date:
-            today_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            today_date = run_date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
             if today_date not in posts_by_date:
                 posts_by_date[today_date] = []
             posts_by_date[today_date].extend(posts_with_unknown_date)
@@ -1410,12 +1417,17 @@ def save_forum_data(all_posts, date=None, full_history=False, output_path=None):
         return True
 
 
-def main():
+def main(argv=None):
     """Main entry point for discourse ingestion"""
     parser = argparse.ArgumentParser(description="Ingest Discourse forum data")
     parser.add_argument(
         "--date", help="Date for output file (YYYY-MM-DD), defaults to today"
     )
+    parser.add_argument(
+        "--run-date",
+        help="Pipeline run date (YYYY-MM-DD) for posts without a creation date, "
+        "defaults to today",
+    )
     parser.add_argument(
         "--full-history",
         action="store_true",
@@ -1445,7 +1457,7 @@ def main():
         help="Custom output file path (optional). Uses default location if not set",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     print("🏛️ Starting Discourse Forum Ingestion")
     print("=" * 50)
@@ -1539,7 +1551,7 @@ def main():
 
         # Save results
         success = save_forum_data(
-            final_posts, args.date, args.full_history, args.output
+            final_posts, args.date, args.full_history, args.output, args.run_date
         )
         if success:
             save_state(state)
@@ -396,9 +396,9 @@ def retry_on_failure(
 
             for attempt in range(max_retries + 1):
                 try:
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     result = func(*args, **kwargs)
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
 
                     # Update health metrics on success
                     error_handler.update_component_health(
@@ -408,7 +408,7 @@ def retry_on_failure(
                     return result
 
                 except exceptions as e:
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
 
                     # Create error details
                     error = error_handler.handle_exception(
@@ -456,7 +456,7 @@ class PipelineValidator:
         self, data_dir: Path, component: str = "data_loader"
     ) -> ValidationResult:
         """Validate data directory structure."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = ValidationResult(is_valid=True, component=component)
 
         required_subdirs = ["aggregated", "briefings", "facts"]
@@ -482,7 +482,7 @@ class PipelineValidator:
                 )
                 result.add_error(error)
 
-        result.validation_time = time.time() - start_time
+        result.validation_time = time.perf_counter() - start_time
         return result
 
     def validate_json_structure(
@@ -492,7 +492,7 @@ class PipelineValidator:
         component: str = "data_validator",
     ) -> ValidationResult:
         """Validate JSON data structure."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = ValidationResult(is_valid=True, component=component)
 
         for field_name in required_fields:
@@ -509,14 +509,14 @@ class PipelineValidator:
                 )
                 result.add_error(error)
 
-        result.validation_time = time.time() - start_time
+        result.validation_time = time.perf_counter() - start_time
         return result
 
     def validate_output_file(
         self, file_path: Path, component: str = "output_validator"
     ) -> ValidationResult:
         """Validate output file was created successfully."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = ValidationResult(is_valid=True, component=component)
 
         if not file_path.exists():
@@ -540,7 +540,7 @@ class PipelineValidator:
                 )
                 result.add_error(error)
 
-        result.validation_time = time.time() - start_time
+        result.validation_time = time.perf_counter() - start_time
         return result
 
 
@@ -584,15 +584,15 @@ def run_with_error_handling(
     handler = error_handler or RAGErrorHandler()
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(**kwargs)
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
 
         handler.update_component_health(component, True, execution_time)
         return result, None
 
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         error = handler.handle_exception(e, component)
         handler.update_component_health(component, False, execution_time, error)
 
@@ -7,12 +7,37 @@ key technical facts, insights, and important developments from ALL sources.
 """
 
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Set
+from scripts.data_loader import full_history_aggregated_path, open_json_file
 from scripts.llm_interface import LLMInterface
 from scripts.prompt_loader import prompt_loader
 
+# Items per LLM request for short items (GitHub activities, chat messages);
+# the LLM_BATCH_SIZE_ENV environment variable overrides it
+LLM_BATCH_SIZE_ENV = "KASPA_LLM_BATCH_SIZE"
+DEFAULT_LLM_BATCH_SIZE = 16
+
+# Forum posts are long, so fewer fit in one request's context
+FORUM_BATCH_SIZE = 5
+
+
+def get_llm_batch_size() -> int:
+    """Read the LLM batch size from the environment, falling back to the default."""
+    value = os.getenv(LLM_BATCH_SIZE_ENV)
+    if value is None:
+        return DEFAULT_LLM_BATCH_SIZE
+    try:
+        return max(1, int(value))
+    except ValueError:
+        print(
+            f"⚠️  Warning: Ignoring invalid {LLM_BATCH_SIZE_ENV}={value!r}; "
+            f"using {DEFAULT_LLM_BATCH_SIZE}"
+        )
+        return DEFAULT_LLM_BATCH_SIZE
+
 
 class FactsExtractor:
     def _get_activity_date(self, activity: Dict) -> str:
@@ -61,6 +86,7 @@ class FactsExtractor:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.force = force
         self.period_summary = period_summary
+        self.batch_size = get_llm_batch_size()
 
         # Initialize LLM interface
         self.llm = LLMInterface()
@@ -69,7 +95,7 @@ class FactsExtractor:
         """Load the raw aggregated data for a given date or period."""
         # Handle both regular dates and backfill mode
         if date == "full_history":
-            input_path = self.input_dir / f"{date}_aggregated.json"
+            input_path = full_history_aggregated_path(self.input_dir)
         elif self.period_summary:
             # For period summary mode, look for period-based files
             # Try different patterns: YYYY-MM-monthly.json, YYYY-MM-DD-weekly.json, etc.
@@ -100,7 +126,7 @@ class FactsExtractor:
                 f"No aggregated data found for {date} at {input_path}"
             )
 
-        with open(input_path, "r", encoding="utf-8") as f:
+        with open_json_file(input_path) as f:
             return json.load(f)
 
     def load_processed_source_urls(self, days_back: int = 7) -> Set[str]:
@@ -366,6 +392,45 @@ ecosystem, or technology."""
                 all_facts.extend(individual_facts)
             return all_facts
 
+    def extract_facts_in_batches(
+        self,
+        valid_items: List[Dict[str, Any]],
+        source_type: str,
+        batch_size: int,
+        noun: str,
+    ) -> List[Dict[str, Any]]:
+        """Extract facts from items batch_size at a time, one LLM call per batch."""
+        print(f"📦 Processing {len(valid_items)} valid {noun} in batches...")
+
+        all_facts = []
+        total_batches = (len(valid_items) + batch_size - 1) // batch_size
+
+        for i in range(0, len(valid_items), batch_size):
+            batch = valid_items[i : i + batch_size]
+            batch_num = (i // batch_size) + 1
+
+            print(
+                f"  📦 Processing batch {batch_num}/{total_batches} "
+                f"({len(batch)} {noun})..."
+            )
+
+            # Prepare batch items for processing
+            batch_items = [
+                {"source_info": item["source_info"], "content": item["content"]}
+                for item in batch
+            ]
+
+            # Process batch
+            batch_facts = self.extract_facts_from_batch(batch_items, source_type)
+            all_facts.extend(batch_facts)
+
+            if batch_facts:
+                print(f"    ✅ Extracted {len(batch_facts)} facts from batch")
+            else:
+                print("    ℹ️  No facts extracted from batch")
+
+        return all_facts
+
     def extract_medium_facts(
         self, articles: List[Dict], processed_urls: Set[str]
     ) -> List[Dict[str, Any]]:
@@ -451,37 +516,9 @@ ecosystem, or technology."""
         if skipped_count > 0:
             print(f"⏭️  Skipped {skipped_count} duplicate GitHub activities")
 
-        print(f"📦 Processing {len(valid_activities)} valid activities in batches...")
-
-        # Process in batches of 10 for GitHub activities (they tend to be shorter)
-        BATCH_SIZE = 10
-        all_facts = []
-
-        for i in range(0, len(valid_activities), BATCH_SIZE):
-            batch = valid_activities[i : i + BATCH_SIZE]
-            batch_num = (i // BATCH_SIZE) + 1
-            total_batches = (len(valid_activities) + BATCH_SIZE - 1) // BATCH_SIZE
-
-            print(
-                f"  📦 Processing batch {batch_num}/{total_batches} "
-                f"({len(batch)} activities)..."
-            )
-
-            # Prepare batch items for processing
-            batch_items = []
-            for item in batch:
-                batch_items.append(
-                    {"source_info": item["source_info"], "content": item["content"]}
-                )
-
-            # Process batch
-            batch_facts = self.extract_facts_from_batch(batch_items, "github_activity")
-            all_facts.extend(batch_facts)
-
-            if batch_facts:
-                print(f"    ✅ Extracted {len(batch_facts)} facts from batch")
-            else:
-                print("    ℹ️  No facts extracted from batch")
+        all_facts = self.extract_facts_in_batches(
+            valid_activities, "github_activity", self.batch_size, "activities"
+        )
 
         print(f"🐙 GitHub processing complete: {len(all_facts)} total facts extracted")
         return all_facts
@@ -489,19 +526,17 @@ ecosystem, or technology."""
     def extract_telegram_facts(
         self, messages: List[Dict], processed_urls: Set[str]
     ) -> List[Dict[str, Any]]:
-        """Extract key facts from Telegram messages."""
+        """Extract key facts from Telegram messages using efficient batching."""
         if not messages:
             return []
 
         print(f"🔍 Extracting facts from {len(messages)} Telegram messages...")
 
-        all_facts = []
+        # Filter out duplicates first
+        valid_messages = []
         skipped_count = 0
 
-        for i, message in enumerate(messages, 1):
-            sender_name = message.get("sender_name", "unknown")
-            print(f"  {i}/{len(messages)} - Message from {sender_name}...")
-
+        for message in messages:
             source_info = {
                 "type": "telegram_message",
                 "title": f"Telegram Message - {message.get('sender_name', 'Unknown')}",
@@ -512,41 +547,35 @@ ecosystem, or technology."""
 
             # Check for duplicates
             if self.is_duplicate_source(source_info, processed_urls):
-                print("    ⏭️  Skipping - already processed this URL")
                 skipped_count += 1
                 continue
 
-            facts = self.extract_facts_from_content(
-                message.get("content", ""), source_info
+            valid_messages.append(
+                {"source_info": source_info, "content": message.get("content", "")}
             )
-            all_facts.extend(facts)
-
-            if facts:
-                print(f"    ✅ Extracted {len(facts)} facts")
-            else:
-                print("    ℹ️  No facts extracted")
 
         if skipped_count > 0:
             print(f"⏭️  Skipped {skipped_count} duplicate Telegram messages")
 
-        return all_facts
+        # Chat messages are short, so many share one LLM request
+        return self.extract_facts_in_batches(
+            valid_messages, "telegram_message", self.batch_size, "messages"
+        )
 
     def extract_discord_facts(
         self, messages: List[Dict], processed_urls: Set[str]
     ) -> List[Dict[str, Any]]:
-        """Extract key facts from Discord messages."""
+        """Extract key facts from Discord messages using efficient batching."""
         if not messages:
             return []
 
         print(f"🔍 Extracting facts from {len(messages)} Discord messages...")
 
-        all_facts = []
+        # Filter out duplicates first
+        valid_messages = []
         skipped_count = 0
 
-        for i, message in enumerate(messages, 1):
-            author_name = message.get("author", "unknown")
-            print(f"  {i}/{len(messages)} - Message from {author_name}...")
-
+        for message in messages:
             source_info = {
                 "type": "discord_message",
                 "title": f"Discord Message - {message.get('author', 'Unknown')}",
@@ -557,24 +586,20 @@ ecosystem, or technology."""
 
             # Check for duplicates
             if self.is_duplicate_source(source_info, processed_urls):
-                print("    ⏭️  Skipping - already processed this URL")
                 skipped_count += 1
                 continue
 
-            facts = self.extract_facts_from_content(
-                message.get("content", ""), source_info
+            valid_messages.append(
+                {"source_info": source_info, "content": message.get("content", "")}
             )
-            all_facts.extend(facts)
-
-            if facts:
-                print(f"    ✅ Extracted {len(facts)} facts")
-            else:
-                print("    ℹ️  No facts extracted")
 
         if skipped_count > 0:
             print(f"⏭️  Skipped {skipped_count} duplicate Discord messages")
 
-        return all_facts
+        # Chat messages are short, so many share one LLM request
+        return self.extract_facts_in_batches(
+            valid_messages, "discord_message", self.batch_size, "messages"
+        )
 
     def extract_forum_facts(
         self, posts: List[Dict], processed_urls: Set[str]
@@ -617,37 +642,9 @@ ecosystem, or technology."""
         if skipped_count > 0:
             print(f"⏭️  Skipped {skipped_count} duplicate forum posts")
 
-        print(f"📦 Processing {len(valid_posts)} valid posts in batches...")
-
-        # Process in batches of 5 to balance efficiency with context limits
-        BATCH_SIZE = 5
-        all_facts = []
-
-        for i in range(0, len(valid_posts), BATCH_SIZE):
-            batch = valid_posts[i : i + BATCH_SIZE]
-            batch_num = (i // BATCH_SIZE) + 1
-            total_batches = (len(valid_posts) + BATCH_SIZE - 1) // BATCH_SIZE
-
-            print(
-                f"  📦 Processing batch {batch_num}/{total_batches} "
-                f"({len(batch)} posts)..."
-            )
-
-            # Prepare batch items for processing
-            batch_items = []
-            for item in batch:
-                batch_items.append(
-                    {"source_info": item["source_info"], "content": item["content"]}
-                )
-
-            # Process batch
-            batch_facts = self.extract_facts_from_batch(batch_items, "forum_post")
-            all_facts.extend(batch_facts)
-
-            if batch_facts:
-                print(f"    ✅ Extracted {len(batch_facts)} facts from batch")
-            else:
-                print("    ℹ️  No facts extracted from batch")
+        all_facts = self.extract_facts_in_batches(
+            valid_posts, "forum_post", FORUM_BATCH_SIZE, "posts"
+        )
 
         print(f"🏛️ Forum processing complete: {len(all_facts)} total facts extracted")
         return all_facts
@@ -1069,7 +1066,7 @@ ecosystem, or technology."""
             return error_msg
 
 
-def main():
+def main(argv=None):
     """CLI entry point."""
     import argparse
 
@@ -1093,7 +1090,7 @@ def main():
         "(weekly, monthly, historical) instead of daily data",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     extractor = FactsExtractor(force=args.force, period_summary=args.period_summary)
     result = extractor.run_facts_extraction(args.date)
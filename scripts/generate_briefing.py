@@ -10,6 +10,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
+from scripts.data_loader import full_history_aggregated_path, open_json_file
 from scripts.llm_interface import LLMInterface
 from scripts.prompt_loader import prompt_loader
 
@@ -35,7 +36,7 @@ class BriefingGenerator:
         """Load the raw aggregated data for a given date or period."""
         # Handle both regular dates and backfill mode
         if date == "full_history":
-            input_path = self.input_dir / f"{date}_aggregated.json"
+            input_path = full_history_aggregated_path(self.input_dir)
         elif self.period_summary:
             # For period summary mode, look for period-based files
             # Try different patterns: YYYY-MM-monthly.json, YYYY-MM-DD-weekly.json, etc.
@@ -66,7 +67,7 @@ class BriefingGenerator:
                 f"No aggregated data found for {date} at {input_path}"
             )
 
-        with open(input_path, "r", encoding="utf-8") as f:
+        with open_json_file(input_path) as f:
             return json.load(f)
 
     def extract_period_metadata(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -982,7 +983,7 @@ class BriefingGenerator:
         return summary
 
 
-def main():
+def main(argv=None):
     """CLI entry point."""
     import argparse
 
@@ -1006,7 +1007,7 @@ def main():
         "instead of daily briefing",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     generator = BriefingGenerator(force=args.force, period_summary=args.period_summary)
     result = generator.run_briefing_generation(args.date)
@@ -949,7 +949,7 @@ def generate_rag_document(
         return False, error.message
 
 
-def main():
+def main(argv=None):
     """Main entry point for the RAG document generation script."""
     parser = argparse.ArgumentParser(
         description="Generate RAG-optimized documents from daily JSON data",
@@ -1010,7 +1010,7 @@ Examples:
         "instead of daily data",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate arguments
     if not validate_date_format(args.date):
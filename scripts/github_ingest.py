@@ -24,6 +24,9 @@ GITHUB_TOKEN = os.getenv("GH_TOKEN")
 CONFIG_PATH = Path("config/sources.config.json")
 OUTPUT_DIR = Path("sources/github")
 
+# Start time of the last complete fetch; run_pipeline passes it back as --since
+MANIFEST_PATH = OUTPUT_DIR / ".manifest.json"
+
 # 🔧 FIX: Configurable API limits - these can be overridden in sources.config.json
 DEFAULT_MAX_COMMITS = 100
 DEFAULT_MAX_PULL_REQUESTS = 250  # Increased from 100
@@ -82,10 +85,34 @@ def authenticate_github():
         return None
 
 
+def get_since_date(days_back, since=None):
+    """Start of the fetch window: days_back ago, or since if that is later."""
+    since_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+    if since is not None and since > since_date:
+        return since
+    return since_date
+
+
+def save_manifest(fetch_started_at):
+    """Record that everything created before fetch_started_at has been fetched."""
+    manifest = {"since": fetch_started_at.isoformat()}
+    try:
+        MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    except OSError as e:
+        print(f"⚠️  Warning: Could not write {MANIFEST_PATH}: {e}")
+
+
 def fetch_recent_commits(repo, days_back=7, max_commits=DEFAULT_MAX_COMMITS):
-    """Fetch recent commits from a repository"""
+    """
+    Fetch recent commits from a repository, or None if the API call failed.
+
+    Always covers the whole days_back window: GitHub filters commits by commit
+    date, so a branch merged after the last fetch can bring in older commits.
+    """
     try:
-        since_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        since_date = get_since_date(days_back)
         commits = repo.get_commits(since=since_date)
 
         commit_data = []
@@ -125,15 +152,19 @@ def fetch_recent_commits(repo, days_back=7, max_commits=DEFAULT_MAX_COMMITS):
 
     except GithubException as e:
         print(f"   ⚠️ Error fetching commits: {e}")
-        return []
+        return None
 
 
 def fetch_recent_pull_requests(
-    repo, days_back=30, max_pull_requests=DEFAULT_MAX_PULL_REQUESTS
+    repo, days_back=30, max_pull_requests=DEFAULT_MAX_PULL_REQUESTS, since=None
 ):
-    """Fetch recent pull requests from a repository using creation date filtering"""
+    """
+    Fetch recent pull requests from a repository using creation date filtering.
+
+    Returns None if the API call failed.
+    """
     try:
-        since_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        since_date = get_since_date(days_back, since)
 
         print(f"   🔀 Fetching PRs created since {since_date.strftime('%Y-%m-%d')}...")
 
@@ -212,13 +243,17 @@ def fetch_recent_pull_requests(
 
     except GithubException as e:
         print(f"   ⚠️ Error fetching pull requests: {e}")
-        return []
+        return None
 
 
-def fetch_recent_issues(repo, days_back=30, max_issues=DEFAULT_MAX_ISSUES):
-    """Fetch recent issues from a repository using creation date filtering"""
+def fetch_recent_issues(repo, days_back=30, max_issues=DEFAULT_MAX_ISSUES, since=None):
+    """
+    Fetch recent issues from a repository using creation date filtering.
+
+    Returns None if the API call failed.
+    """
     try:
-        since_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+        since_date = get_since_date(days_back, since)
 
         print(
             f"   📋 Fetching issues created since {since_date.strftime('%Y-%m-%d')}..."
@@ -304,11 +339,18 @@ def fetch_recent_issues(repo, days_back=30, max_issues=DEFAULT_MAX_ISSUES):
 
     except GithubException as e:
         print(f"   ⚠️ Error fetching issues: {e}")
-        return []
+        return None
 
 
-def fetch_repository_data(github_client, repo_config, days_back=7):
-    """Fetch all data for a single repository"""
+def fetch_repository_data(github_client, repo_config, days_back=7, since=None):
+    """
+    Fetch all data for a single repository.
+
+    Pull requests and issues created before since (if given) are skipped
+    even inside the days_back window, because an earlier run already fetched
+    them. The names of any fetches that failed are listed in
+    metadata["failed_fetches"].
+    """
     owner = repo_config["owner"]
     repo_name = repo_config["repo"]
     repo_full_name = f"{owner}/{repo_name}"
@@ -333,10 +375,23 @@ def fetch_repository_data(github_client, repo_config, days_back=7):
             repo,
             days_back,
             repo_config.get("max_pull_requests", DEFAULT_MAX_PULL_REQUESTS),
+            since,
         )
         issues = fetch_recent_issues(
-            repo, days_back, repo_config.get("max_issues", DEFAULT_MAX_ISSUES)
+            repo, days_back, repo_config.get("max_issues", DEFAULT_MAX_ISSUES), since
         )
+        failed_fetches = [
+            name
+            for name, items in (
+                ("commits", commits),
+                ("pull_requests", pull_requests),
+                ("issues", issues),
+            )
+            if items is None
+        ]
+        commits = commits or []
+        pull_requests = pull_requests or []
+        issues = issues or []
 
         # Aggregate repository data
         repo_data = {
@@ -359,6 +414,7 @@ def fetch_repository_data(github_client, repo_config, days_back=7):
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
                 "days_back": days_back,
                 "total_items": len(commits) + len(pull_requests) + len(issues),
+                "failed_fetches": failed_fetches,
             },
         }
 
@@ -888,7 +944,7 @@ def save_github_data(all_repo_data, date=None, full_history=False, output_path=N
             print("📄 No GitHub data files created")
 
 
-def main():
+def main(argv=None):
     """Main ingestion function"""
     parser = argparse.ArgumentParser(
         description="Ingest GitHub repository data",
@@ -916,6 +972,12 @@ regular operations, full-history for comprehensive backfill operations.
         type=str,
         help="Specific date to use for output file (YYYY-MM-DD format)",
     )
+    parser.add_argument(
+        "--run-date",
+        type=datetime.fromisoformat,
+        help="Pipeline run date (YYYY-MM-DD) used for the daily output file "
+        "(default: today, UTC)",
+    )
     parser.add_argument(
         "--full-history",
         action="store_true",
@@ -936,8 +998,24 @@ regular operations, full-history for comprehensive backfill operations.
         type=str,
         help="Custom output file path (optional). Uses default location if not set",
     )
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Only fetch PRs and issues created after this ISO timestamp, e.g. "
+        "the 'since' value of sources/github/.manifest.json (ignored with "
+        "--force). Commits always cover the --days-back window",
+    )
+
+    args = parser.parse_args(argv)
 
-    args = parser.parse_args()
+    # Items created while this run fetches are picked up by the next run
+    fetch_started_at = datetime.now(timezone.utc)
+
+    since = None
+    if args.since and not args.force:
+        since = args.since
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
 
     # 🔧 FIX: Auto-set days_back for backfill mode if not explicitly specified
     if args.full_history and args.days_back == 7:  # Default value
@@ -949,7 +1027,8 @@ regular operations, full-history for comprehensive backfill operations.
 
     # Set date for non-full-history mode
     if not args.full_history:
-        args.date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        run_date = args.run_date or datetime.now(timezone.utc)
+        args.date = run_date.strftime("%Y-%m-%d")
 
     print("🚀 Starting GitHub repository ingestion...")
 
@@ -961,6 +1040,11 @@ regular operations, full-history for comprehensive backfill operations.
     else:
         print("📰 Daily sync mode: Standard GitHub repository processing")
         print(f"   📅 Fetching data from the last {args.days_back} days")
+    if since is not None:
+        print(
+            f"   ⏩ Skipping PRs and issues created before last fetch at "
+            f"{since.isoformat()}"
+        )
 
     # Get existing data for cross-file deduplication (unless force flag is used)
     existing_data = {}
@@ -987,12 +1071,21 @@ regular operations, full-history for comprehensive backfill operations.
 
     for repo_config in repo_configs:
         repo_name = f"{repo_config['owner']}/{repo_config['repo']}"
-        repo_data = fetch_repository_data(github_client, repo_config, args.days_back)
+        repo_data = fetch_repository_data(
+            github_client, repo_config, args.days_back, since
+        )
         all_repo_data[repo_name] = repo_data
 
         # Small delay to be respectful to the API
         time.sleep(0.5)
 
+    # Only a fetch where every API call succeeded, saved to the default
+    # location, may advance the manifest; otherwise --since would skip items
+    advance_manifest = args.output is None and all(
+        repo_data is not None and not repo_data["metadata"]["failed_fetches"]
+        for repo_data in all_repo_data.values()
+    )
+
     # Filter out existing data (unless force flag is used)
     if not args.force:
         filtered_data = filter_new_github_data(all_repo_data, existing_data)
@@ -1026,6 +1119,8 @@ regular operations, full-history for comprehensive backfill operations.
 
             # Save empty file with metadata for consistency
             save_github_data({}, args.date, args.full_history, args.output)
+            if advance_manifest:
+                save_manifest(fetch_started_at)
 
             import sys
 
@@ -1038,6 +1133,8 @@ regular operations, full-history for comprehensive backfill operations.
 
     # Save all data
     save_github_data(final_data, args.date, args.full_history, args.output)
+    if advance_manifest:
+        save_manifest(fetch_started_at)
 
     # Optional validation step
     if args.validate:
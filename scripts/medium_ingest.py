@@ -8,10 +8,12 @@ Follows the three-stage pipeline: Ingest → Aggregate → AI Process
 
 import os
 import json
-import feedparser
+import hashlib
 import argparse
 import requests
-from datetime import datetime, timedelta
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
@@ -31,6 +33,20 @@ if not RSS_URLS_STR:
 
 RSS_URLS = [url.strip() for url in RSS_URLS_STR.split(",") if url.strip()]
 
+# Persisted index of article URL digests (one per line), so daily runs can
+# deduplicate without parsing every sources/medium/*.json file
+ARTICLE_URL_INDEX = Path("sources/medium/.article_urls")
+
+# HTTP validators (ETag / Last-Modified) of each feed's last full download,
+# keyed by feed URL, so unchanged feeds can be skipped with a conditional GET
+RSS_CACHE_FILE = Path("sources/medium/.rss_cache.json")
+
+# Namespaces used by Medium's RSS 2.0 feeds
+RSS_NAMESPACES = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "content": "http://purl.org/rss/1.0/modules/content/",
+}
+
 
 def clean_html_content(html_content):
     """
@@ -70,46 +86,91 @@ def clean_html_content(html_content):
             return html_content  # Return original if all cleaning fails
 
 
+def article_url_digest(link):
+    """Return the digest of an article link as stored in the URL index."""
+    return hashlib.blake2b(link.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _url_index_is_current(json_files):
+    """Check that no Medium data file was written after the URL index."""
+    try:
+        index_mtime = ARTICLE_URL_INDEX.stat().st_mtime
+    except OSError:
+        return False
+    return all(path.stat().st_mtime <= index_mtime for path in json_files)
+
+
+def _append_to_url_index(digests):
+    """Append digests to the URL index and mark it as up to date."""
+    with open(ARTICLE_URL_INDEX, "a", encoding="utf-8") as f:
+        f.writelines(f"{digest}\n" for digest in digests)
+    os.utime(ARTICLE_URL_INDEX)
+
+
 def get_existing_article_links():
     """
-    Fast deduplication: Load all existing article links from all medium files.
-    Returns a set of links for O(1) lookup performance.
+    Fast deduplication: Load digests of all existing article links.
+    Uses the persisted URL index when it is current, otherwise rebuilds it from
+    all medium files. Returns a set of digests for O(1) lookup performance,
+    and the article lists parsed from each file while rebuilding (empty when
+    the index was used), for save_raw_medium_data to merge into.
     """
     existing_links = set()
+    loaded_files = {}
     sources_dir = Path("sources/medium")
 
     if not sources_dir.exists():
-        return existing_links
+        return existing_links, loaded_files
 
     # Get all JSON files in the medium directory
     json_files = list(sources_dir.glob("*.json"))
 
     if not json_files:
-        return existing_links
+        return existing_links, loaded_files
+
+    if _url_index_is_current(json_files):
+        with open(ARTICLE_URL_INDEX, "r", encoding="utf-8") as f:
+            existing_links = set(f.read().split())
+        print(
+            f"📚 Loaded {len(existing_links)} existing article links "
+            f"from {ARTICLE_URL_INDEX}"
+        )
+        return existing_links, loaded_files
 
     print(f"🔍 Checking for existing articles across {len(json_files)} files...")
 
     total_existing = 0
+    index_complete = True
     for file_path in json_files:
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 articles = json.load(f)
                 if isinstance(articles, list):
+                    loaded_files[file_path] = articles
                     for article in articles:
                         if isinstance(article, dict) and "link" in article:
-                            existing_links.add(article["link"])
+                            existing_links.add(article_url_digest(article["link"]))
                             total_existing += 1
         except (json.JSONDecodeError, IOError) as e:
             print(f"⚠️  Warning: Could not read {file_path}: {e}")
+            index_complete = False
             continue
 
+    # Only persist an index that covers every file, so it can be trusted later
+    if index_complete:
+        try:
+            with open(ARTICLE_URL_INDEX, "w", encoding="utf-8") as f:
+                f.writelines(f"{digest}\n" for digest in sorted(existing_links))
+        except IOError as e:
+            print(f"⚠️  Warning: Could not write {ARTICLE_URL_INDEX}: {e}")
+
     print(f"📚 Found {total_existing} existing articles for deduplication check")
-    return existing_links
+    return existing_links, loaded_files
 
 
 def filter_new_articles(all_articles, existing_links):
     """
-    Filter out articles that already exist in our database.
+    Filter out articles whose link digest is already in existing_links.
     Returns only genuinely new articles.
     """
     if not existing_links:
@@ -117,7 +178,8 @@ def filter_new_articles(all_articles, existing_links):
 
     new_articles = []
     for article in all_articles:
-        if article.get("link") not in existing_links:
+        link = article.get("link")
+        if link is None or article_url_digest(link) not in existing_links:
             new_articles.append(article)
 
     return new_articles
@@ -259,7 +321,7 @@ def scrape_individual_article(article_url):
                         parsed_date = datetime.fromisoformat(
                             datetime_attr.replace("Z", "+00:00")
                         )
-                        pub_date = parsed_date.strftime("%Y-%m-%d")
+                        pub_date = parsed_date.date().isoformat()
                         break
                     except (ValueError, TypeError):
                         pass
@@ -272,7 +334,7 @@ def scrape_individual_article(article_url):
                         for fmt in ["%b %d, %Y", "%B %d, %Y", "%Y-%m-%d"]:
                             try:
                                 parsed_date = datetime.strptime(date_text, fmt)
-                                pub_date = parsed_date.strftime("%Y-%m-%d")
+                                pub_date = parsed_date.date().isoformat()
                                 break
                             except ValueError:
                                 continue
@@ -306,12 +368,101 @@ def scrape_individual_article(article_url):
         return None
 
 
-def fetch_articles_from_feed(rss_url, full_history=False, days_back=None):
-    """Fetch articles from a single Medium RSS feed."""
+def load_rss_cache():
+    """Load the per-feed HTTP validators saved by earlier runs."""
+    try:
+        with open(RSS_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_rss_validators(feed_headers):
+    """
+    Record the ETag / Last-Modified of downloaded feeds for the next run.
+
+    feed_headers maps each feed URL to its response headers. Call this only
+    once the feeds' articles are saved: a run that fails earlier must not
+    leave validators behind, or the next run gets a 304 and skips them.
+    """
+    if not feed_headers:
+        return
+
+    cache = load_rss_cache()
+    for rss_url, headers in feed_headers.items():
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            # Nothing to revalidate with; drop any stale entry
+            cache.pop(rss_url, None)
+        else:
+            cache[rss_url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "date": headers.get("Date"),
+            }
+
+    try:
+        RSS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(RSS_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except IOError as e:
+        print(f"⚠️  Warning: Could not write {RSS_CACHE_FILE}: {e}")
+
+
+def parse_rss_items(xml_content):
+    """Parse the <item> elements of an RSS 2.0 feed into plain dicts."""
+    root = ET.fromstring(xml_content)
+    items = []
+    for item in root.iter("item"):
+        # Medium puts the full post in content:encoded and omits description
+        summary = item.findtext("description") or item.findtext(
+            "content:encoded", "", RSS_NAMESPACES
+        )
+        items.append(
+            {
+                "title": item.findtext("title", "").strip(),
+                "link": item.findtext("link", "").strip(),
+                "published": item.findtext("pubDate"),
+                "author": item.findtext("dc:creator", "", RSS_NAMESPACES).strip()
+                or "Unknown",
+                "summary": summary,
+            }
+        )
+    return items
+
+
+def fetch_articles_from_feed(
+    rss_url, full_history=False, days_back=None, conditional=False
+):
+    """
+    Fetch articles from a single Medium RSS feed.
+
+    With conditional=True the request revalidates against the feed's saved
+    ETag / Last-Modified, and an unchanged feed (304) yields no articles.
+
+    Returns (articles, headers). headers are the response headers to pass to
+    save_rss_validators once the articles are saved; they are empty for a 304
+    and None if the feed could not be fetched.
+    """
     print(f"📡 Fetching from: {rss_url}")
 
+    headers = {"Accept-Encoding": "gzip, deflate"}
+    if conditional:
+        validators = load_rss_cache().get(rss_url) or {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
     try:
-        feed = feedparser.parse(rss_url)
+        response = requests.get(rss_url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            print(f"✨ Feed not modified since last run: {rss_url}")
+            return [], {}
+        response.raise_for_status()
+        entries = parse_rss_items(response.content)
         articles = []
 
         # Calculate cutoff date if days_back is specified
@@ -324,52 +475,44 @@ def fetch_articles_from_feed(rss_url, full_history=False, days_back=None):
 
         # Fetch all available entries from the RSS feed
         # RSS feeds are naturally limited, so we process all entries they provide
-        entries_to_process = feed.entries
+        entries_to_process = entries
 
         if not entries_to_process:
             print(f"⚠️  No articles found in feed: {rss_url}")
-            return []
+            return [], response.headers
+
+        # All articles from this fetch share one ingestion timestamp
+        ingested_at = datetime.now().isoformat()
 
         filtered_count = 0
         for entry in entries_to_process:
-            # Extract publication date with multiple format fallbacks
+            # Extract publication date (RFC 2822, e.g. "Mon, 01 Jan 2024 12:00:00 GMT")
             pub_date = "Unknown"
             pub_datetime = None
-            if hasattr(entry, "published"):
+            if entry["published"]:
                 try:
-                    pub_datetime = datetime.strptime(
-                        entry.published, "%a, %d %b %Y %H:%M:%S %Z"
-                    )
-                    pub_date = pub_datetime.strftime("%Y-%m-%d")
-                except ValueError:
-                    try:
-                        pub_datetime = datetime.strptime(
-                            entry.published, "%a, %d %b %Y %H:%M:%S %z"
-                        )
-                        pub_date = pub_datetime.strftime("%Y-%m-%d")
-                    except ValueError:
-                        pub_date = "Unknown"
+                    pub_datetime = parsedate_to_datetime(entry["published"])
+                    pub_date = pub_datetime.date().isoformat()
+                except (TypeError, ValueError):
+                    pub_datetime = None
 
-            # Apply date filtering if specified
+            # Apply date filtering if specified (cutoff_date is naive)
             if cutoff_date is not None and pub_datetime is not None:
-                if pub_datetime < cutoff_date:
+                if pub_datetime.replace(tzinfo=None) < cutoff_date:
                     filtered_count += 1
                     continue
 
-            # Extract author
-            author = getattr(entry, "author", "Unknown")
-
             # Clean HTML from RSS summary to get readable text
-            clean_summary = clean_html_content(entry.summary)
+            clean_summary = clean_html_content(entry["summary"])
 
             article = {
-                "title": entry.title,
-                "link": entry.link,
+                "title": entry["title"],
+                "link": entry["link"],
                 "summary": clean_summary,  # Full article content from RSS
                 # (HTML cleaned)
-                "author": author,
+                "author": entry["author"],
                 "published": pub_date,
-                "ingested_at": datetime.now().isoformat(),
+                "ingested_at": ingested_at,
                 "source_type": "medium_rss",
                 "rss_url": rss_url,
             }
@@ -381,17 +524,26 @@ def fetch_articles_from_feed(rss_url, full_history=False, days_back=None):
             print(
                 f"📅 Filtered out {filtered_count} articles older than {days_back} days"
             )
-        return articles
+        return articles, response.headers
 
     except Exception as e:
         print(f"❌ Error fetching from {rss_url}: {e}")
-        return []
+        return [], None
 
 
-def save_raw_medium_data(articles, full_history=False, output_path=None):
+def save_raw_medium_data(
+    articles, full_history=False, output_path=None, run_date=None, loaded_files=None
+):
     """
     Save raw Medium articles to sources/medium/ directory grouped by publication date.
+
+    Articles without a usable publication date go to the run_date file
+    (YYYY-MM-DD, default today). loaded_files maps file paths to article lists
+    already parsed by get_existing_article_links in this run.
     """
+    if loaded_files is None:
+        loaded_files = {}
+
     if full_history:
         date_str = "full_history"
         if output_path:
@@ -432,7 +584,7 @@ def save_raw_medium_data(articles, full_history=False, output_path=None):
 
         # Handle articles with unknown dates - save them to today's file
         if articles_with_unknown_date:
-            today_date = datetime.now().strftime("%Y-%m-%d")
+            today_date = run_date or date.today().isoformat()
             if today_date not in articles_by_date:
                 articles_by_date[today_date] = []
             articles_by_date[today_date].extend(articles_with_unknown_date)
@@ -463,17 +615,25 @@ def save_raw_medium_data(articles, full_history=False, output_path=None):
             sources_dir = Path("sources/medium")
             sources_dir.mkdir(parents=True, exist_ok=True)
 
+            # Keep the URL index in step with the files only if it was current
+            index_current = _url_index_is_current(list(sources_dir.glob("*.json")))
+            saved_digests = []
+
             for date_str, date_articles in articles_by_date.items():
                 output_path = sources_dir / f"{date_str}.json"
 
-                # Load existing data if file exists
-                existing_articles = []
-                if output_path.exists():
+                # Load existing data if file exists (parsed once already when
+                # deduplication ran)
+                existing_articles = loaded_files.get(output_path)
+                if existing_articles is None and output_path.exists():
                     try:
                         with open(output_path, "r", encoding="utf-8") as f:
                             existing_articles = json.load(f)
                     except (json.JSONDecodeError, IOError):
                         existing_articles = []
+                if not isinstance(existing_articles, list):
+                    # Missing file, or a no-new-content metadata file
+                    existing_articles = []
 
                 # Combine with new articles, avoiding duplicates based on link
                 existing_links = {article.get("link") for article in existing_articles}
@@ -503,6 +663,14 @@ def save_raw_medium_data(articles, full_history=False, output_path=None):
 
                 saved_files.append(output_path)
                 total_articles += len(new_articles)
+                saved_digests.extend(
+                    article_url_digest(article["link"])
+                    for article in new_articles
+                    if article.get("link") is not None
+                )
+
+            if index_current:
+                _append_to_url_index(saved_digests)
 
         print(
             f"📊 Total new articles saved: {total_articles} "
@@ -511,7 +679,7 @@ def save_raw_medium_data(articles, full_history=False, output_path=None):
         return saved_files
 
 
-def main():
+def main(argv=None):
     """Main function to run Medium article ingestion from multiple feeds."""
     parser = argparse.ArgumentParser(
         description="Fetch articles from Medium RSS feeds.",
@@ -566,7 +734,13 @@ regular operations, full-history for comprehensive backfill operations.
         type=str,
         help="Custom output file path (optional). Uses default location if not set",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--run-date",
+        type=date.fromisoformat,
+        help="Pipeline run date (YYYY-MM-DD) used for dated files. Defaults to today",
+    )
+    args = parser.parse_args(argv)
+    run_date = (args.run_date or date.today()).isoformat()
 
     print("🔄 Starting Medium article ingestion...")
 
@@ -586,21 +760,41 @@ regular operations, full-history for comprehensive backfill operations.
 
     # Get existing articles for deduplication (unless force flag is used)
     existing_links = set()
+    loaded_files = {}
     if not args.force:
-        existing_links = get_existing_article_links()
+        existing_links, loaded_files = get_existing_article_links()
 
     all_articles = []
     successful_feeds = 0
     successful_manual = 0
 
+    # Only a plain daily sync may skip unchanged feeds; the other modes need
+    # the full feed even if it has not changed since the last run
+    conditional = not (
+        args.force or args.full_history or args.days_back is not None or args.output
+    )
+
+    # Validators of the downloaded feeds, saved only after their articles are
+    feed_headers = {}
+    unchanged_feeds = 0
+
     # Process RSS feeds
     for url in RSS_URLS:
-        articles = fetch_articles_from_feed(
-            url, full_history=args.full_history, days_back=args.days_back
+        articles, headers = fetch_articles_from_feed(
+            url,
+            full_history=args.full_history,
+            days_back=args.days_back,
+            conditional=conditional,
         )
-        if articles:
-            all_articles.extend(articles)
-            successful_feeds += 1
+        if headers is None:
+            continue
+        # An unchanged feed (304) is a successful fetch with nothing new
+        successful_feeds += 1
+        all_articles.extend(articles)
+        if headers:
+            feed_headers[url] = headers
+        else:
+            unchanged_feeds += 1
 
     # Process manual URLs if provided
     if args.manual_urls:
@@ -652,7 +846,12 @@ regular operations, full-history for comprehensive backfill operations.
                 )
 
     if not all_articles:
-        if args.manual_urls:
+        if unchanged_feeds and unchanged_feeds == successful_feeds:
+            print(
+                f"✨ All {unchanged_feeds} fetched feeds unchanged since last run "
+                "- no new articles."
+            )
+        elif args.manual_urls:
             print("⚠️ No articles found from RSS feeds or manual URLs.")
         else:
             print("⚠️ No articles found across all RSS feeds.")
@@ -663,8 +862,9 @@ regular operations, full-history for comprehensive backfill operations.
         from datetime import datetime, timezone
         from pathlib import Path
 
+        today = run_date
         empty_data_with_metadata = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": today,
             "generated_at": datetime.now(timezone.utc).isoformat(),
             "source": "medium",
             "status": "no_new_content",
@@ -673,6 +873,7 @@ regular operations, full-history for comprehensive backfill operations.
                 "total_articles_fetched": 0,
                 "feeds_processed": len(RSS_URLS),
                 "successful_feeds": successful_feeds,
+                "unchanged_feeds": unchanged_feeds,
                 "processing_mode": (
                     "full_history" if args.full_history else "daily_sync"
                 ),
@@ -683,12 +884,17 @@ regular operations, full-history for comprehensive backfill operations.
         # Save the empty data file directly
         sources_dir = Path("sources/medium")
         sources_dir.mkdir(parents=True, exist_ok=True)
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        output_path = sources_dir / f"{date_str}.json"
+        output_path = sources_dir / f"{today}.json"
+        index_current = _url_index_is_current(list(sources_dir.glob("*.json")))
 
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(empty_data_with_metadata, f, indent=2, ensure_ascii=False)
 
+        # A metadata-only file adds no links, so the URL index stays valid
+        if index_current:
+            _append_to_url_index([])
+        save_rss_validators(feed_headers)
+
         print(f"📁 Saved no-content metadata file to: {output_path}")
         sys.exit(2)  # Exit code 2 indicates "no new content"
 
@@ -719,9 +925,11 @@ regular operations, full-history for comprehensive backfill operations.
             print("ℹ️  Use --force flag to bypass deduplication if needed.")
 
             # Create empty file with metadata to maintain consistency
+            now = datetime.now()
+            today = run_date
             empty_data_with_metadata = {
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "generated_at": datetime.now().isoformat(),
+                "date": today,
+                "generated_at": now.isoformat(),
                 "source": "medium",
                 "status": "no_new_content",
                 "articles": [],
@@ -743,15 +951,21 @@ regular operations, full-history for comprehensive backfill operations.
             if args.full_history:
                 date_str = "full_history"
             else:
-                date_str = datetime.now().strftime("%Y-%m-%d")
+                date_str = today
 
             sources_dir = Path("sources/medium")
             sources_dir.mkdir(parents=True, exist_ok=True)
             output_path = sources_dir / f"{date_str}.json"
+            index_current = _url_index_is_current(list(sources_dir.glob("*.json")))
 
             with open(output_path, "w", encoding="utf-8") as f:
                 json.dump(empty_data_with_metadata, f, indent=2, ensure_ascii=False)
 
+            # A metadata-only file adds no links, so the URL index stays valid
+            if index_current:
+                _append_to_url_index([])
+            save_rss_validators(feed_headers)
+
             print(f"📁 Saved empty data file to: {output_path}")
             import sys
 
@@ -804,8 +1018,13 @@ regular operations, full-history for comprehensive backfill operations.
 
     # Save the articles
     output_paths = save_raw_medium_data(
-        final_articles, full_history=args.full_history, output_path=args.output
+        final_articles,
+        full_history=args.full_history,
+        output_path=args.output,
+        run_date=run_date,
+        loaded_files=loaded_files,
     )
+    save_rss_validators(feed_headers)
 
     print("\n🎉 Medium ingestion complete!")
     if isinstance(output_paths, list):
@@ -478,11 +478,15 @@ class LargeDatasetManager:
                     if isinstance(sample, list):
                         total_items = len(sample)
                     elif isinstance(sample, dict) and "sources" in sample:
-                        total_items = sum(
-                            len(v)
-                            for v in sample["sources"].values()
-                            if isinstance(v, list)
-                        )
+                        # Aggregated files keep a running count in their
+                        # metadata; only recount files written without one
+                        total_items = sample.get("metadata", {}).get("total_items")
+                        if not isinstance(total_items, int):
+                            total_items = sum(
+                                len(v)
+                                for v in sample["sources"].values()
+                                if isinstance(v, list)
+                            )
                     else:
                         total_items = 1
             except Exception:
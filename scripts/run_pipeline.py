@@ -22,13 +22,26 @@ Features:
 """
 
 import argparse
+import asyncio
+import hashlib
+import importlib
+import inspect
+import json
 import logging
+import os
+import shlex
+import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Add the project root to Python path - must be done before importing local modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -52,6 +65,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Ingestion stages, whose exit code 2 means "no new content"
+INGESTION_MODULES = (
+    "scripts.medium_ingest",
+    "scripts.telegram_ingest",
+    "scripts.github_ingest",
+    "scripts.discourse_ingest",
+)
+
+# Raw sources read by aggregation, and the daily aggregated output directory
+# where each <date>.json gets a <date>.hash sidecar of the sources it was built from
+SOURCES_DIR = Path("sources")
+AGGREGATED_DIR = Path("data/aggregated")
+
+# AI outputs that RAG document generation reads
+BRIEFINGS_DIR = Path("data/briefings")
+FACTS_DIR = Path("data/facts")
+
+# Steps that succeeded, keyed by stage and arguments, so a re-run can resume;
+# entries older than CHECKPOINT_MAX_AGE are dropped when the file is loaded
+CHECKPOINT_PATH = Path("state/pipeline.json")
+CHECKPOINT_MAX_AGE = timedelta(days=30)
+
+# sources/ subdirectory written by each ingestion stage
+INGESTION_SOURCE_DIRS = {
+    "scripts.medium_ingest": "medium",
+    "scripts.telegram_ingest": "telegram",
+    "scripts.github_ingest": "github",
+    "scripts.discourse_ingest": "forum",
+}
+
+# Stage name logged for each ingestion command
+INGESTION_DESCRIPTIONS = {
+    "scripts.medium_ingest": "Medium Articles Ingestion",
+    "scripts.telegram_ingest": "Telegram Group Ingestion",
+    "scripts.github_ingest": "GitHub Repository Ingestion",
+    "scripts.discourse_ingest": "Discourse Forum Ingestion",
+}
+
+# Trailing output lines of a streamed command kept for its error report
+OUTPUT_TAIL_LINES = 40
+
+# Commands started by _stream_command that are still running; each leads its
+# own process group so aborting reaps its children too
+_LIVE_PROCESSES = set()
+_LIVE_PROCESSES_LOCK = threading.Lock()
+
+# Set once a required command fails or the runner is interrupted; commands
+# not yet started are then cancelled
+_ABORT = threading.Event()
+
 # Initialize global monitoring system
 LOGGER = None
 ERROR_HANDLER = None
@@ -202,8 +265,254 @@ def get_date_range(start_date: str, end_date: str) -> List[str]:
     return dates
 
 
+def paths_fingerprint(*roots: Path) -> str:
+    """
+    Fingerprint the files under the given directories from paths, mtimes and sizes.
+
+    Hidden files (ingestion bookkeeping such as URL indexes) are skipped, so
+    only data files that pipeline stages read affect the result.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for root_dir in roots:
+        for root, dirs, files in os.walk(root_dir):
+            dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+            for name in sorted(files):
+                if name.startswith("."):
+                    continue
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                digest.update(
+                    f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode("utf-8")
+                )
+    return digest.hexdigest()
+
+
+def sources_fingerprint(sources_dir: Path = SOURCES_DIR) -> str:
+    """Fingerprint the raw source files that aggregation reads."""
+    return paths_fingerprint(sources_dir)
+
+
+@dataclass
+class Checkpoint:
+    """Durable record of pipeline steps that succeeded, and on which inputs."""
+
+    path: Path = CHECKPOINT_PATH
+    steps: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def load(cls, path: Path = CHECKPOINT_PATH) -> "Checkpoint":
+        """Load the checkpoint at path, dropping entries older than the max age."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                steps = json.load(f)
+        except (OSError, ValueError):
+            steps = {}
+        if not isinstance(steps, dict):
+            steps = {}
+
+        cutoff = (datetime.now() - CHECKPOINT_MAX_AGE).isoformat()
+        fresh = {
+            step: entry
+            for step, entry in steps.items()
+            if isinstance(entry, dict) and entry.get("ts", "") >= cutoff
+        }
+        return cls(path=path, steps=fresh)
+
+    def done(self, step: str, input_hash: str) -> bool:
+        """Check whether step already succeeded on the same inputs."""
+        with self._lock:
+            entry = self.steps.get(step)
+        return (
+            entry is not None
+            and entry.get("status") == "success"
+            and entry.get("hash") == input_hash
+        )
+
+    def record(self, step: str, input_hash: str) -> None:
+        """Record a successful step and persist the checkpoint."""
+        with self._lock:
+            self.steps[step] = {
+                "status": "success",
+                "hash": input_hash,
+                "ts": datetime.now().isoformat(),
+            }
+            self._save()
+
+    def clear(self) -> None:
+        """Forget every recorded step."""
+        with self._lock:
+            self.steps.clear()
+            self._save()
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.steps, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write pipeline checkpoint {self.path}: {e}")
+
+
+def ingestion_since_args(source_name: str) -> List[str]:
+    """
+    Build `--since` arguments from a source's ingestion manifest.
+
+    Ingesters that support incremental fetching record the start of their last
+    complete fetch in sources/<name>/.manifest.json; sources without a
+    manifest get no extra arguments.
+    """
+    try:
+        with open(SOURCES_DIR / source_name / ".manifest.json", encoding="utf-8") as f:
+            since = json.load(f).get("since")
+    except (OSError, ValueError, AttributeError):
+        return []
+    return ["--since", since] if since else []
+
+
+def aggregation_is_current(date: str, fingerprint: str) -> bool:
+    """Check that the aggregate for date exists and was built from these sources."""
+    if not (AGGREGATED_DIR / f"{date}.json").exists():
+        return False
+    try:
+        return (AGGREGATED_DIR / f"{date}.hash").read_text().strip() == fingerprint
+    except OSError:
+        return False
+
+
+def record_aggregation_fingerprint(date: str, fingerprint: str) -> None:
+    """Store the sources fingerprint next to the aggregate for date."""
+    try:
+        (AGGREGATED_DIR / f"{date}.hash").write_text(f"{fingerprint}\n")
+    except OSError as e:
+        logger.warning(f"Could not record aggregation fingerprint for {date}: {e}")
+
+
+def python_module_command(module_name: str, *args: str) -> List[str]:
+    """Build the argv for running a module with this interpreter, like `python -m`."""
+    return [sys.executable, "-m", module_name, *args]
+
+
+def _stream_command(command: List[str], timeout: int) -> Tuple[int, str]:
+    """
+    Run a command, echoing its interleaved stdout/stderr as lines arrive.
+
+    Args:
+        command: Command argv to execute (no shell is involved)
+        timeout: Command timeout in seconds
+
+    Returns:
+        Tuple of (return code, last OUTPUT_TAIL_LINES lines of output)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+    """
+    # Our own fds are non-inheritable (PEP 446), so close_fds=False skips
+    # closing every descriptor in the child without leaking any. The command
+    # gets its own session, so signals reach it only through _signal_commands
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        close_fds=False,
+        start_new_session=True,
+    )
+    with _LIVE_PROCESSES_LOCK:
+        _LIVE_PROCESSES.add(process)
+
+    # Reading the pipe blocks, so a timer kills the command on timeout
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        _signal_process_group(process, signal.SIGKILL)
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    try:
+        for line in process.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+        return_code = process.wait()
+    finally:
+        timer.cancel()
+        process.stdout.close()
+        with _LIVE_PROCESSES_LOCK:
+            _LIVE_PROCESSES.discard(process)
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    return return_code, "".join(tail)
+
+
+def _signal_process_group(process: subprocess.Popen, sig: int) -> None:
+    """Send sig to the process group led by process, if it is still running."""
+    try:
+        os.killpg(process.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass  # Already exited
+
+
+def _signal_commands(sig: int = signal.SIGTERM) -> None:
+    """Cancel pending commands and send sig to every running command's group."""
+    _ABORT.set()
+    with _LIVE_PROCESSES_LOCK:
+        processes = list(_LIVE_PROCESSES)
+    for process in processes:
+        _signal_process_group(process, sig)
+
+
+def _reset_abort() -> None:
+    """Start a run with no cancellation left over from an earlier one."""
+    _ABORT.clear()
+
+
+def _forward_signal(signum, frame) -> None:
+    """Terminate running commands, then stop the runner as the signal would."""
+    _signal_commands(signal.SIGTERM)
+    if signum == signal.SIGINT:
+        raise KeyboardInterrupt
+    sys.exit(128 + signum)
+
+
+def install_signal_forwarding() -> None:
+    """
+    Forward SIGINT/SIGTERM to running commands before the runner exits.
+
+    Commands run in their own sessions, so Ctrl+C at the terminal would
+    otherwise leave them running. Must be called from the main thread.
+    """
+    signal.signal(signal.SIGINT, _forward_signal)
+    signal.signal(signal.SIGTERM, _forward_signal)
+
+
+def _log_stage_end(
+    description: str,
+    status: str,
+    execution_time: float,
+    return_code: Optional[int] = None,
+) -> None:
+    """Log the stage_end record for a command, at ERROR level unless it passed."""
+    ok = status in ("success", "no_new_content")
+    LOGGER.log_stage_event(
+        "stage_end",
+        description,
+        level=logging.INFO if ok else logging.ERROR,
+        status=status,
+        return_code=return_code,
+        duration=round(execution_time, 3),
+    )
+
+
 def run_command(
-    command: str,
+    command: List[str],
     description: str,
     component: str = "pipeline_runner",
     required: bool = True,
@@ -213,7 +522,7 @@ def run_command(
     Run a command with comprehensive monitoring and error handling.
 
     Args:
-        command: Command to execute
+        command: Command argv to execute (see python_module_command)
         description: Human-readable description of the command
         component: Component name for monitoring
         required: Whether this command is required for pipeline success
@@ -225,9 +534,16 @@ def run_command(
     if not LOGGER or not ERROR_HANDLER:
         initialize_monitoring()
 
-    print(f"\n{'='*60}")
-    print(f"🔄 {description}")
-    print(f"{'='*60}")
+    # Shell-quoted form of the argv, for logs and error reports
+    command_line = shlex.join(command)
+
+    # A required command already failed, so this one would be wasted work
+    if _ABORT.is_set():
+        LOGGER.log_stage_event("stage_end", description, status="cancelled")
+        return False, "cancelled"
+
+    # One record per stage event; KASPA_LOG_FORMAT=json makes them JSON lines
+    LOGGER.log_stage_event("stage_start", description, command=command_line)
 
     start_time = time.time()
 
@@ -235,70 +551,39 @@ def run_command(
         with LOGGER.time_operation(
             f"{component}.{description.replace(' ', '_').lower()}"
         ):
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=Path.cwd(),
-                timeout=timeout,
-            )
+            # Output is streamed to the console as it arrives
+            return_code, output_tail = _stream_command(command, timeout)
 
         execution_time = time.time() - start_time
 
-        # Log command output
-        if result.stdout:
-            print(result.stdout)
-            LOGGER.logger.debug(f"Command stdout: {result.stdout[:500]}...")
-
-        if result.stderr:
-            print(f"⚠️  stderr: {result.stderr}")
-            LOGGER.logger.warning(f"Command stderr: {result.stderr[:500]}...")
-
         # Determine success and status
-        if result.returncode == 0:
-            print(f"✅ {description} completed successfully in {execution_time:.2f}s")
+        if return_code != 0 and _ABORT.is_set():
+            # Terminated because another required command failed
+            _log_stage_end(description, "cancelled", execution_time, return_code)
+            return False, "cancelled"
 
+        elif return_code == 0:
             # Update health metrics on success
             ERROR_HANDLER.update_component_health(
                 component, True, execution_time, items_processed=1
             )
 
-            LOGGER.logger.info(
-                f"Command succeeded: {description} (exit code: {result.returncode}, "
-                f"time: {execution_time:.2f}s)"
-            )
+            _log_stage_end(description, "success", execution_time, return_code)
             return True, "success"
 
-        elif result.returncode == 2 and any(
-            ingest_cmd in command
-            for ingest_cmd in [
-                "medium_ingest",
-                "telegram_ingest",
-                "github_ingest",
-                "discourse_ingest",
-            ]
-        ):
-            print(
-                f"ℹ️  {description} found no new content - "
-                "skipping downstream processing"
-            )
-
-            # This is still considered a success
+        elif return_code == 2 and any(arg in INGESTION_MODULES for arg in command):
+            # This is still considered a success; downstream processing is skipped
             ERROR_HANDLER.update_component_health(
                 component, True, execution_time, items_processed=0
             )
 
-            LOGGER.logger.info(
-                f"Command completed with no new content: {description} "
-                f"(exit code: {result.returncode}, time: {execution_time:.2f}s)"
-            )
+            _log_stage_end(description, "no_new_content", execution_time, return_code)
             return True, "no_new_content"
 
         else:
             # Command failed
-            error_message = f"{description} failed with return code {result.returncode}"
-            print(f"❌ {error_message}")
+            error_message = f"{description} failed with return code {return_code}"
+            _log_stage_end(description, "failed", execution_time, return_code)
 
             # Create detailed error information
             error = ERROR_HANDLER.create_error(
@@ -307,13 +592,14 @@ def run_command(
                 category=ErrorCategory.PIPELINE_EXECUTION,
                 component=component,
                 context={
-                    "command": command,
-                    "return_code": result.returncode,
+                    "command": command_line,
+                    "return_code": return_code,
                     "execution_time": execution_time,
-                    "stdout": result.stdout[:1000] if result.stdout else None,
-                    "stderr": result.stderr[:1000] if result.stderr else None,
+                    "output_tail": output_tail or None,
                 },
-                recovery_action=f"Check command syntax and dependencies for: {command}",
+                recovery_action=(
+                    f"Check command syntax and dependencies for: {command_line}"
+                ),
                 user_impact=(
                     "Pipeline step failed" if required else "Optional step failed"
                 ),
@@ -324,12 +610,15 @@ def run_command(
                 component, False, execution_time, error
             )
 
+            # Fail fast: stop sibling commands instead of letting them finish
+            if required:
+                _signal_commands(signal.SIGTERM)
             return False, "failed"
 
     except subprocess.TimeoutExpired:
         execution_time = time.time() - start_time
         error_message = f"{description} timed out after {timeout} seconds"
-        print(f"⏰ {error_message}")
+        _log_stage_end(description, "timeout", execution_time)
 
         # Create timeout error
         error = ERROR_HANDLER.create_error(
@@ -338,7 +627,7 @@ def run_command(
             category=ErrorCategory.PIPELINE_EXECUTION,
             component=component,
             context={
-                "command": command,
+                "command": command_line,
                 "timeout": timeout,
                 "execution_time": execution_time,
             },
@@ -347,12 +636,14 @@ def run_command(
         )
 
         ERROR_HANDLER.update_component_health(component, False, execution_time, error)
+        if required:
+            _signal_commands(signal.SIGTERM)
         return False, "timeout"
 
     except Exception as e:
         execution_time = time.time() - start_time
         error_message = f"Error running {description}: {str(e)}"
-        print(f"❌ {error_message}")
+        _log_stage_end(description, "error", execution_time)
 
         # Handle unexpected exceptions
         error = ERROR_HANDLER.handle_exception(
@@ -361,7 +652,7 @@ def run_command(
             severity=ErrorSeverity.HIGH,
             category=ErrorCategory.PIPELINE_EXECUTION,
             context={
-                "command": command,
+                "command": command_line,
                 "description": description,
                 "execution_time": execution_time,
             },
@@ -370,6 +661,8 @@ def run_command(
         )
 
         ERROR_HANDLER.update_component_health(component, False, execution_time, error)
+        if required:
+            _signal_commands(signal.SIGTERM)
         return False, "error"
 
 
@@ -388,6 +681,7 @@ def run_full_pipeline(
     This function orchestrates all pipeline stages with monitoring, error handling,
     and resource management for large temporal chunks.
     """
+    _reset_abort()
 
     # Determine processing mode based on arguments
     if processing_mode is None:
@@ -418,14 +712,19 @@ def run_full_pipeline(
 
     pipeline_start_time = time.time()
 
+    # Every stage files its output under this date, even if the run crosses
+    # midnight
+    run_started = datetime.now()
+    run_date = run_started.strftime("%Y-%m-%d")
+
     try:
         # Determine date range
         if processing_mode == "daily":
             if days_back is None:
-                start_date = end_date = datetime.now().strftime("%Y-%m-%d")
+                start_date = end_date = run_date
             else:
-                end_date = datetime.now().strftime("%Y-%m-%d")
-                start_date = (datetime.now() - timedelta(days=days_back)).strftime(
+                end_date = run_date
+                start_date = (run_started - timedelta(days=days_back)).strftime(
                     "%Y-%m-%d"
                 )
         elif processing_mode == "period":
@@ -456,50 +755,76 @@ def run_full_pipeline(
             # Add some buffer to ensure we capture all data
             ingestion_days_back = max(ingestion_days_back, 7)
 
-        force_flag = " --force" if force else ""
-        days_back_flag = f" --days-back {ingestion_days_back}"
+        force_args = ["--force"] if force else []
+        days_back_args = ["--days-back", str(ingestion_days_back)]
+
+        # Steps that succeeded on unchanged inputs are skipped when resuming;
+        # --force starts from a clean checkpoint
+        checkpoint = Checkpoint.load()
+        if force:
+            checkpoint.clear()
 
-        # Build telegram command separately since it doesn't accept --days-back
-        telegram_cmd = f"python -m scripts.telegram_ingest{force_flag}"
+        run_date_args = ["--run-date", run_date]
+
+        # Build telegram arguments separately since it doesn't accept --days-back
+        telegram_args = list(force_args)
         if backfill or processing_mode == "period":
-            telegram_cmd = (
-                f"python -m scripts.telegram_ingest --full-history{force_flag}"
-            )
+            telegram_args = ["--full-history", *force_args]
 
         # Run ingestion with resource monitoring
-        ingestion_commands = [
-            f"python -m scripts.medium_ingest{days_back_flag}{force_flag}",
-            telegram_cmd,
-            f"python -m scripts.github_ingest{days_back_flag}{force_flag}",
-            f"python -m scripts.discourse_ingest{days_back_flag}{force_flag}",
+        ingestion_stages = [
+            ("scripts.medium_ingest", days_back_args + force_args + run_date_args),
+            ("scripts.telegram_ingest", telegram_args + run_date_args),
+            ("scripts.github_ingest", days_back_args + force_args + run_date_args),
+            ("scripts.discourse_ingest", days_back_args + force_args + run_date_args),
         ]
 
-        for cmd in ingestion_commands:
-            try:
-                # Check resources before each ingestion command
-                resource_report = resource_monitor.get_resource_report(".")
-                if not resource_report["memory"]["is_safe"]:
-                    logger.warning(
-                        f"Memory warning before {cmd}: "
-                        f"{resource_report['memory']['message']}"
-                    )
+        # Incremental sources only fetch what arrived since their last run;
+        # --force asks for the whole window again
+        if not force:
+            ingestion_stages = [
+                (
+                    module_name,
+                    stage_args
+                    + ingestion_since_args(INGESTION_SOURCE_DIRS[module_name]),
+                )
+                for module_name, stage_args in ingestion_stages
+            ]
 
-                    # Try garbage collection before proceeding
-                    freed = resource_monitor.trigger_gc()
-                    if freed > 0:
-                        logger.info(
-                            f"Freed {freed / (1024**3):.2f}GB through "
-                            f"garbage collection"
-                        )
+        # Check resources once before the ingestion stages start
+        resource_report = resource_monitor.get_resource_report(".")
+        if not resource_report["memory"]["is_safe"]:
+            logger.warning(
+                f"Memory warning before ingestion: "
+                f"{resource_report['memory']['message']}"
+            )
 
-                # Execute with retry mechanism
-                retry_operation(_run_command_safely, cmd, timeout=1200)
-                logger.info(f"Ingestion completed: {cmd}")
+            # Try garbage collection before proceeding
+            freed = resource_monitor.trigger_gc()
+            if freed > 0:
+                logger.info(
+                    f"Freed {freed / (1024**3):.2f}GB through garbage collection"
+                )
 
-            except Exception as e:
-                logger.error(f"Ingestion failed for {cmd}: {e}")
-                # Continue with other ingestion commands
-                continue
+        # Sources are independent network crawls, so they run concurrently
+        # and Stage 1 takes as long as the slowest source. They are never
+        # checkpointed: each run must fetch what was posted since the last
+        # one, and the ingesters resume incrementally on their own. Each runs
+        # as a child process, so an interrupt or abort can terminate it
+        ingestion_nodes = [
+            Node(
+                module_name,
+                partial(_run_ingestion_command, module_name, stage_args),
+                # Other ingestion stages keep running if one fails
+                required=False,
+            )
+            for module_name, stage_args in ingestion_stages
+        ]
+        for module_name, error in run_dag(ingestion_nodes).items():
+            if error is None:
+                logger.info(f"Ingestion completed: {module_name}")
+            else:
+                logger.error(f"Ingestion failed for {module_name}: {error}")
 
         # Check resources after ingestion
         post_ingestion_report = resource_monitor.get_resource_report(".")
@@ -510,18 +835,28 @@ def run_full_pipeline(
         # Step 2: Aggregate sources with resource management
         logger.info("=== STEP 2: Source Aggregation with Resource Management ===")
 
+        # Sources do not change during aggregation, so fingerprint them once
+        fingerprint = sources_fingerprint()
+
         if processing_mode == "daily":
             # Daily aggregation
-            agg_cmd = f"python -m scripts.aggregate_sources --date {end_date}"
-            if force:
-                agg_cmd += " --force"
+            agg_args = ["--date", end_date, *force_args]
 
-            try:
-                retry_operation(_run_command_safely, agg_cmd, timeout=1800)
-                logger.info("Daily aggregation completed successfully")
-            except Exception as e:
-                logger.error(f"Daily aggregation failed: {e}")
-                raise
+            if not force and aggregation_is_current(end_date, fingerprint):
+                logger.info(
+                    f"Sources unchanged since {end_date} was aggregated; "
+                    "skipping daily aggregation (cache hit)"
+                )
+            else:
+                try:
+                    retry_operation(
+                        _run_stage_in_process, "scripts.aggregate_sources", agg_args
+                    )
+                    record_aggregation_fingerprint(end_date, fingerprint)
+                    logger.info("Daily aggregation completed successfully")
+                except Exception as e:
+                    logger.error(f"Daily aggregation failed: {e}")
+                    raise
 
         elif processing_mode == "period":
             # Period-based aggregation with chunked processing
@@ -572,27 +907,39 @@ def run_full_pipeline(
 
                     # Process daily aggregations for the chunk
                     for date in get_date_range(chunk_start, chunk_end):
-                        agg_cmd = f"python -m scripts.aggregate_sources --date {date}"
-                        if force:
-                            agg_cmd += " --force"
+                        if not force and aggregation_is_current(date, fingerprint):
+                            continue  # unchanged since last aggregated
+
+                        agg_args = ["--date", date, *force_args]
 
                         try:
-                            retry_operation(_run_command_safely, agg_cmd, timeout=900)
+                            retry_operation(
+                                _run_stage_in_process,
+                                "scripts.aggregate_sources",
+                                agg_args,
+                            )
+                            record_aggregation_fingerprint(date, fingerprint)
                         except Exception as e:
                             logger.warning(f"Daily aggregation failed for {date}: {e}")
                             # Continue with other dates in the chunk
                             continue
 
                     # Aggregate the period data
-                    period_agg_cmd = (
-                        f"python -m scripts.aggregate_sources "
-                        f"--start-date {chunk_start} "
-                        f"--end-date {chunk_end} --period {period}"
+                    period_agg_args = [
+                        "--start-date",
+                        chunk_start,
+                        "--end-date",
+                        chunk_end,
+                        "--period",
+                        period,
+                        *force_args,
+                    ]
+
+                    retry_operation(
+                        _run_stage_in_process,
+                        "scripts.aggregate_sources",
+                        period_agg_args,
                     )
-                    if force:
-                        period_agg_cmd += " --force"
-
-                    retry_operation(_run_command_safely, period_agg_cmd, timeout=1800)
                     successful_chunks += 1
                     logger.info(f"Chunk {period_label} completed successfully")
 
@@ -618,45 +965,42 @@ def run_full_pipeline(
         # Step 3: AI Processing with resource management
         logger.info("=== STEP 3: AI Processing with Resource Management ===")
 
+        # Briefings and facts are built from the aggregated data
+        ai_inputs = (paths_fingerprint(AGGREGATED_DIR),)
+
         if processing_mode == "daily":
             # Daily mode - process single date
-            briefing_cmd = f"python -m scripts.generate_briefing --date {end_date}"
-            facts_cmd = f"python -m scripts.extract_facts --date {end_date}"
+            briefing_args = ["--date", end_date, *force_args]
+            facts_args = ["--date", end_date, *force_args]
+
+            # Check resources before AI processing
+            resource_report = resource_monitor.get_resource_report(".")
+            if not resource_report["memory"]["is_safe"]:
+                logger.warning(
+                    f"Memory warning before AI processing: "
+                    f"{resource_report['memory']['message']}"
+                )
 
-            if force:
-                briefing_cmd += " --force"
-                facts_cmd += " --force"
+                # Free memory before AI processing
+                freed = resource_monitor.trigger_gc()
+                if freed > 0:
+                    logger.info(f"Freed {freed / (1024**3):.2f}GB before AI processing")
 
-            # Generate briefings with memory monitoring
-            try:
-                # Check resources before AI processing
-                resource_report = resource_monitor.get_resource_report(".")
-                if not resource_report["memory"]["is_safe"]:
-                    logger.warning(
-                        f"Memory warning before AI processing: "
-                        f"{resource_report['memory']['message']}"
-                    )
-
-                    # Free memory before AI processing
-                    freed = resource_monitor.trigger_gc()
-                    if freed > 0:
-                        logger.info(
-                            f"Freed {freed / (1024**3):.2f}GB before AI processing"
-                        )
+            # Briefing and facts read the same aggregated file independently,
+            # so their LLM round-trips overlap
+            briefing_error, facts_error = _run_ai_stages_concurrently(
+                briefing_args, facts_args, checkpoint, ai_inputs
+            )
 
-                retry_operation(_run_command_safely, briefing_cmd, timeout=3600)
+            if briefing_error is None:
                 logger.info("Briefing generation completed")
-            except Exception as e:
-                logger.error(f"Briefing generation failed: {e}")
-                # Continue with other steps
+            else:
+                logger.error(f"Briefing generation failed: {briefing_error}")
 
-            # Generate facts with memory monitoring
-            try:
-                retry_operation(_run_command_safely, facts_cmd, timeout=3600)
+            if facts_error is None:
                 logger.info("Facts extraction completed")
-            except Exception as e:
-                logger.error(f"Facts extraction failed: {e}")
-                # Continue with other steps
+            else:
+                logger.error(f"Facts extraction failed: {facts_error}")
 
         else:
             # Period mode - process each monthly period individually
@@ -668,53 +1012,55 @@ def run_full_pipeline(
             for chunk_start, chunk_end, period_label in period_chunks:
                 logger.info(f"Processing AI tasks for period: {period_label}")
 
-                # Generate briefing for this period
-                briefing_cmd = (
-                    f"python -m scripts.generate_briefing --date {period_label} "
-                    "--period-summary"
-                )
-                if force:
-                    briefing_cmd += " --force"
+                briefing_args = [
+                    "--date",
+                    period_label,
+                    "--period-summary",
+                    *force_args,
+                ]
+                facts_args = ["--date", period_label, "--period-summary", *force_args]
 
-                try:
-                    # Check resources before AI processing
-                    resource_report = resource_monitor.get_resource_report(".")
-                    if not resource_report["memory"]["is_safe"]:
-                        logger.warning(
-                            f"Memory warning before AI processing for {period_label}: "
-                            f"{resource_report['memory']['message']}"
+                # Check resources before AI processing
+                resource_report = resource_monitor.get_resource_report(".")
+                if not resource_report["memory"]["is_safe"]:
+                    logger.warning(
+                        f"Memory warning before AI processing for {period_label}: "
+                        f"{resource_report['memory']['message']}"
+                    )
+
+                    # Free memory before AI processing
+                    freed = resource_monitor.trigger_gc()
+                    if freed > 0:
+                        logger.info(
+                            f"Freed {freed / (1024**3):.2f}GB before AI processing"
                         )
 
-                        # Free memory before AI processing
-                        freed = resource_monitor.trigger_gc()
-                        if freed > 0:
-                            logger.info(
-                                f"Freed {freed / (1024**3):.2f}GB before AI processing"
-                            )
+                # Generate briefing and facts for this period concurrently
+                briefing_error, facts_error = _run_ai_stages_concurrently(
+                    briefing_args, facts_args, checkpoint, ai_inputs
+                )
 
-                    retry_operation(_run_command_safely, briefing_cmd, timeout=3600)
+                if briefing_error is None:
                     logger.info(f"Briefing generation completed for {period_label}")
-                except Exception as e:
-                    logger.error(f"Briefing generation failed for {period_label}: {e}")
-                    failed_ai_chunks.append((period_label, f"briefing: {str(e)}"))
-                    # Continue with facts extraction for this period
-
-                # Generate facts for this period
-                facts_cmd = (
-                    f"python -m scripts.extract_facts --date {period_label} "
-                    "--period-summary"
-                )
-                if force:
-                    facts_cmd += " --force"
+                else:
+                    logger.error(
+                        f"Briefing generation failed for {period_label}: "
+                        f"{briefing_error}"
+                    )
+                    failed_ai_chunks.append(
+                        (period_label, f"briefing: {str(briefing_error)}")
+                    )
 
-                try:
-                    retry_operation(_run_command_safely, facts_cmd, timeout=3600)
+                if facts_error is None:
                     logger.info(f"Facts extraction completed for {period_label}")
                     successful_ai_chunks += 1
-                except Exception as e:
-                    logger.error(f"Facts extraction failed for {period_label}: {e}")
-                    failed_ai_chunks.append((period_label, f"facts: {str(e)}"))
-                    # Continue with next period
+                else:
+                    logger.error(
+                        f"Facts extraction failed for {period_label}: {facts_error}"
+                    )
+                    failed_ai_chunks.append(
+                        (period_label, f"facts: {str(facts_error)}")
+                    )
 
             logger.info(
                 f"Period AI processing completed: "
@@ -726,14 +1072,17 @@ def run_full_pipeline(
         # Step 4: RAG Document Generation with resource management
         logger.info("=== STEP 4: RAG Document Generation with Resource Management ===")
 
+        # RAG documents combine the aggregated data with briefings and facts
+        rag_inputs = (paths_fingerprint(AGGREGATED_DIR, BRIEFINGS_DIR, FACTS_DIR),)
+
         if processing_mode == "daily":
             # Daily mode
-            rag_cmd = f"python -m scripts.generate_rag_document --date {end_date}"
-            if force:
-                rag_cmd += " --force"
+            rag_args = ["--date", end_date, *force_args]
 
             try:
-                retry_operation(_run_command_safely, rag_cmd, timeout=3600)
+                _run_stage_checkpointed(
+                    checkpoint, "scripts.generate_rag_document", rag_args, rag_inputs
+                )
                 logger.info("RAG document generation completed")
             except Exception as e:
                 logger.error(f"RAG document generation failed: {e}")
@@ -750,15 +1099,21 @@ def run_full_pipeline(
                 logger.info(f"Generating RAG document for period: {period_label}")
 
                 # Generate RAG document for this period
-                rag_cmd = (
-                    f"python -m scripts.generate_rag_document --date {period_label} "
-                    "--split-output --period-summary"
-                )
-                if force:
-                    rag_cmd += " --force"
+                rag_args = [
+                    "--date",
+                    period_label,
+                    "--split-output",
+                    "--period-summary",
+                    *force_args,
+                ]
 
                 try:
-                    retry_operation(_run_command_safely, rag_cmd, timeout=3600)
+                    _run_stage_checkpointed(
+                        checkpoint,
+                        "scripts.generate_rag_document",
+                        rag_args,
+                        rag_inputs,
+                    )
                     logger.info(f"RAG document generation completed for {period_label}")
                     successful_rag_chunks += 1
                 except Exception as e:
@@ -823,68 +1178,221 @@ def run_full_pipeline(
         raise
 
 
-def _run_command_safely(command, timeout=300):
+def _run_stage_in_process(module_name: str, argv: List[str]) -> int:
     """
-    Run a command with resource monitoring and timeout.
+    Run a pipeline stage's main() in this interpreter.
+
+    Stages share the runner's interpreter and import cache instead of each
+    starting a new Python process. Async entry points are run to completion.
 
     Args:
-        command: Command string to execute
-        timeout: Maximum execution time in seconds
+        module_name: Dotted name of the stage module (e.g. "scripts.medium_ingest")
+        argv: Command-line arguments passed to the stage's main()
 
     Returns:
-        subprocess.CompletedProcess result
+        Stage exit code (0, or 2 for an ingestion stage with no new content)
 
     Raises:
-        Exception: If command fails or times out
+        Exception: If the stage exits with a failure code
     """
-    logger.info(f"Executing: {command}")
+    logger.info(f"Executing in-process: {module_name} {' '.join(argv)}")
 
     try:
-        result = subprocess.run(
-            command.split(), capture_output=True, text=True, timeout=timeout
-        )
-
-        if result.stdout:
-            logger.debug(f"Command output: {result.stdout}")
-
-        # Handle success cases
-        if result.returncode == 0:
-            return result
-        elif result.returncode == 2 and any(
-            ingest_cmd in command
-            for ingest_cmd in [
-                "medium_ingest",
-                "telegram_ingest",
-                "github_ingest",
-                "discourse_ingest",
-            ]
-        ):
-            # Exit code 2 means "no new content" for ingestion scripts
-            # - this is acceptable
-            logger.info(f"Command completed with no new content: {command}")
-            return result
+        result = importlib.import_module(module_name).main(argv)
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+        exit_code = result if isinstance(result, int) else 0
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
         else:
-            # Command failed with unexpected exit code
-            logger.error(
-                f"Command failed with exit code {result.returncode}: {command}"
-            )
-            if result.stderr:
-                logger.error(f"Error output: {result.stderr}")
-            raise Exception(
-                f"Command failed: {command} " f"(exit code {result.returncode})"
-            )
+            # sys.exit("message") prints the message and exits with 1
+            logger.error(f"{module_name}: {e.code}")
+            exit_code = 1
+
+    # Handle success cases
+    if exit_code == 0:
+        return exit_code
+    elif exit_code == 2 and module_name in INGESTION_MODULES:
+        # Exit code 2 means "no new content" for ingestion scripts
+        # - this is acceptable
+        logger.info(f"Stage completed with no new content: {module_name}")
+        return exit_code
+    else:
+        # Stage failed with unexpected exit code
+        logger.error(f"Stage failed with exit code {exit_code}: {module_name}")
+        raise Exception(f"Stage failed: {module_name} (exit code {exit_code})")
 
-    except subprocess.TimeoutExpired:
-        logger.error(f"Command timed out after {timeout}s: {command}")
-        raise Exception(f"Command timeout: {command}")
 
-    except Exception as e:
-        logger.error(f"Unexpected error running command: {command} - {e}")
+def _run_ingestion_command(module_name: str, argv: List[str]) -> None:
+    """
+    Run an ingestion stage as a child process through run_command.
+
+    Raises:
+        RuntimeError: If the stage failed, timed out or was cancelled
+    """
+    success, status = run_command(
+        python_module_command(module_name, *argv),
+        INGESTION_DESCRIPTIONS[module_name],
+        required=False,
+    )
+    if not success:
+        raise RuntimeError(f"{module_name} {status}")
+
+
+def _run_stage_checkpointed(
+    checkpoint: Checkpoint, module_name: str, argv: List[str], inputs: Tuple[str, ...]
+) -> None:
+    """
+    Run a stage in-process with retries, unless it already succeeded.
+
+    The step is identified by module and arguments; inputs are fingerprints or
+    other values the stage's result depends on. A step recorded as successful
+    with the same inputs is skipped.
+    """
+    step = shlex.join([module_name, *argv])
+    input_hash = hashlib.blake2b(
+        "\0".join(inputs).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+    if checkpoint.done(step, input_hash):
+        logger.info(f"Skipping {step}: already completed on the same inputs")
+        return
+
+    retry_operation(_run_stage_in_process, module_name, argv)
+    checkpoint.record(step, input_hash)
+
+
+@dataclass
+class Node:
+    """A pipeline step for run_dag: what to run and which steps it waits for."""
+
+    name: str
+    run: Callable[[], Any]
+    deps: Tuple[str, ...] = ()
+    # When False, a failure is reported but dependents still run
+    required: bool = True
+
+
+def run_dag(
+    nodes: List[Node], max_workers: Optional[int] = None
+) -> Dict[str, Optional[BaseException]]:
+    """
+    Run nodes as soon as their dependencies finish, independent ones concurrently.
+
+    Wall time is bounded by the longest dependency chain rather than the sum
+    of all steps. A node whose required dependency failed is not run.
+
+    Args:
+        nodes: Steps to run; deps name other nodes in the list
+        max_workers: Thread limit (default: one per node)
+
+    Returns:
+        Mapping of node name to None on success, or the exception that failed
+        (or skipped) it, in completion order
+
+    Raises:
+        ValueError: If a dependency is unknown or the dependencies form a cycle
+    """
+    by_name = {node.name: node for node in nodes}
+    unknown = {dep for node in nodes for dep in node.deps} - by_name.keys()
+    if unknown:
+        raise ValueError(f"Unknown dependencies: {', '.join(sorted(unknown))}")
+
+    results: Dict[str, Optional[BaseException]] = {}
+    pending = list(nodes)
+    running = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(nodes) or 1)
+    try:
+        while pending or running:
+            # Skipping a node can make its own dependents ready, so repeat
+            # until no pending node is ready
+            ready = [n for n in pending if all(dep in results for dep in n.deps)]
+            while ready:
+                for node in ready:
+                    pending.remove(node)
+                    failed = [
+                        dep
+                        for dep in node.deps
+                        if results[dep] is not None and by_name[dep].required
+                    ]
+                    if failed:
+                        results[node.name] = RuntimeError(
+                            f"{node.name} skipped: {failed[0]} failed"
+                        )
+                    else:
+                        running[executor.submit(node.run)] = node.name
+                ready = [n for n in pending if all(dep in results for dep in n.deps)]
+
+            if not running:
+                if pending:
+                    names = ", ".join(node.name for node in pending)
+                    raise ValueError(f"Dependency cycle among: {names}")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.exception()
+    except BaseException:
+        # On an interrupt, don't wait for running nodes or start queued ones
+        executor.shutdown(wait=False, cancel_futures=True)
         raise
+    executor.shutdown()
+
+    return results
+
+
+def _run_ai_stages_concurrently(
+    briefing_args: List[str],
+    facts_args: List[str],
+    checkpoint: Checkpoint,
+    inputs: Tuple[str, ...],
+) -> Tuple[Optional[Exception], Optional[Exception]]:
+    """
+    Run briefing generation and facts extraction in parallel, each with retries.
+
+    Args:
+        briefing_args: Arguments for scripts.generate_briefing
+        facts_args: Arguments for scripts.extract_facts
+        checkpoint: Checkpoint used to skip stages that already succeeded
+        inputs: Fingerprints of the data both stages read
+
+    Returns:
+        Tuple of (briefing error, facts error); None where the stage succeeded
+    """
+    results = run_dag(
+        [
+            Node(
+                "scripts.generate_briefing",
+                partial(
+                    _run_stage_checkpointed,
+                    checkpoint,
+                    "scripts.generate_briefing",
+                    briefing_args,
+                    inputs,
+                ),
+            ),
+            Node(
+                "scripts.extract_facts",
+                partial(
+                    _run_stage_checkpointed,
+                    checkpoint,
+                    "scripts.extract_facts",
+                    facts_args,
+                    inputs,
+                ),
+            ),
+        ]
+    )
+    return results["scripts.generate_briefing"], results["scripts.extract_facts"]
 
 
 def run_ingestion_only(backfill=False, force=False, days_back=None):
     """Run only the data ingestion steps."""
+    _reset_abort()
     if backfill:
         print("\n🔄 Running ingestion-only pipeline - BACKFILL MODE")
         # Calculate days_back for comprehensive backfill
@@ -902,41 +1410,82 @@ def run_ingestion_only(backfill=False, force=False, days_back=None):
         print("\n🔄 Running ingestion-only pipeline")
         ingestion_days_back = days_back if days_back is not None else 7
 
-    force_flag = " --force" if force else ""
-    days_back_flag = f" --days-back {ingestion_days_back}"
+    force_args = ["--force"] if force else []
+    days_back_args = ["--days-back", str(ingestion_days_back)]
+
+    # All sources file undated items under the same day
+    run_date_args = ["--run-date", datetime.now().strftime("%Y-%m-%d")]
 
     print(f"📅 Using ingestion date range: {ingestion_days_back} days back")
 
+    # Incremental sources only fetch what arrived since their last run;
+    # --force asks for the whole window again
+    since_args = {
+        module_name: [] if force else ingestion_since_args(source_name)
+        for module_name, source_name in INGESTION_SOURCE_DIRS.items()
+    }
+
     steps = [
         (
-            (f"python -m scripts.medium_ingest" f"{force_flag}{days_back_flag}"),
-            "Medium Articles Ingestion",
+            python_module_command(
+                "scripts.medium_ingest",
+                *force_args,
+                *days_back_args,
+                *since_args["scripts.medium_ingest"],
+                *run_date_args,
+            ),
+            INGESTION_DESCRIPTIONS["scripts.medium_ingest"],
         ),
         (
-            f"python -m scripts.telegram_ingest{force_flag}",
-            "Telegram Group Ingestion",
+            python_module_command(
+                "scripts.telegram_ingest",
+                *force_args,
+                *since_args["scripts.telegram_ingest"],
+                *run_date_args,
+            ),
+            INGESTION_DESCRIPTIONS["scripts.telegram_ingest"],
         ),
         (
-            (f"python -m scripts.github_ingest" f"{force_flag}{days_back_flag}"),
-            "GitHub Repository Ingestion",
+            python_module_command(
+                "scripts.github_ingest",
+                *force_args,
+                *days_back_args,
+                *since_args["scripts.github_ingest"],
+                *run_date_args,
+            ),
+            INGESTION_DESCRIPTIONS["scripts.github_ingest"],
         ),
         (
-            (f"python -m scripts.discourse_ingest" f"{force_flag}{days_back_flag}"),
-            "Discourse Forum Ingestion",
+            python_module_command(
+                "scripts.discourse_ingest",
+                *force_args,
+                *days_back_args,
+                *since_args["scripts.discourse_ingest"],
+                *run_date_args,
+            ),
+            INGESTION_DESCRIPTIONS["scripts.discourse_ingest"],
         ),
     ]
 
-    success_count = 0
-    for command, description in steps:
-        success, _ = run_command(command, description)
-        if success:
-            success_count += 1
+    if not LOGGER or not ERROR_HANDLER:
+        initialize_monitoring()
+
+    # Sources have no ordering dependency, so every ingestion command runs at
+    # once, as run_full_pipeline does in-process; like there, one failed
+    # source does not stop the others
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        results = list(
+            executor.map(lambda step: run_command(*step, required=False), steps)
+        )
+
+    success_count = sum(1 for success, _ in results if success)
 
     return success_count > 0
 
 
 def run_aggregation_only(force=False, backfill=False, days_back=None, period="monthly"):
     """Run only the period-based aggregation step."""
+    _reset_abort()
     # Determine processing mode and date range
     if days_back is not None:
         start_date, end_date = get_backfill_date_range(days_back)
@@ -949,19 +1498,37 @@ def run_aggregation_only(force=False, backfill=False, days_back=None, period="mo
         start_date, end_date = today, today
         print("\n🔄 Running aggregation-only pipeline - DAILY MODE")
 
-    force_flag = " --force" if force else ""
+    force_args = ["--force"] if force else []
 
     if start_date == end_date:
         # Daily mode
+        fingerprint = sources_fingerprint()
+        if not force and aggregation_is_current(start_date, fingerprint):
+            print(
+                f"\n✅ Sources unchanged since {start_date} was aggregated - "
+                "skipping aggregation (cache hit)"
+            )
+            return True
+
         success, _ = run_command(
-            f"python -m scripts.aggregate_sources --date {start_date}{force_flag}",
+            python_module_command(
+                "scripts.aggregate_sources", "--date", start_date, *force_args
+            ),
             f"Raw Sources Aggregation for {start_date}",
         )
+        if success:
+            record_aggregation_fingerprint(start_date, fingerprint)
     else:
         # Period-based mode
-        command = (
-            f"python -m scripts.aggregate_sources --start-date {start_date} "
-            f"--end-date {end_date} --period {period}{force_flag}"
+        command = python_module_command(
+            "scripts.aggregate_sources",
+            "--start-date",
+            start_date,
+            "--end-date",
+            end_date,
+            "--period",
+            period,
+            *force_args,
         )
         success, _ = run_command(
             command,
@@ -975,6 +1542,7 @@ def run_ai_processing_only(
     force=False, backfill=False, days_back=None, period="monthly"
 ):
     """Run only the period-based AI processing steps."""
+    _reset_abort()
     # Determine processing mode and date range
     if days_back is not None:
         start_date, end_date = get_backfill_date_range(days_back)
@@ -987,22 +1555,20 @@ def run_ai_processing_only(
         start_date, end_date = today, today
         print("\n🔄 Running AI processing pipeline - DAILY MODE")
 
-    force_flag = " --force" if force else ""
+    force_args = ["--force"] if force else []
 
     if start_date == end_date:
         # Daily mode
         steps = [
             (
-                (
-                    f"python -m scripts.generate_briefing --date {start_date}"
-                    f"{force_flag}"
+                python_module_command(
+                    "scripts.generate_briefing", "--date", start_date, *force_args
                 ),
                 f"Daily Briefing Generation for {start_date}",
             ),
             (
-                (
-                    f"python -m scripts.extract_facts --date {start_date}"
-                    f"{force_flag}"
+                python_module_command(
+                    "scripts.extract_facts", "--date", start_date, *force_args
                 ),
                 f"Daily Facts Extraction for {start_date}",
             ),
@@ -1016,27 +1582,40 @@ def run_ai_processing_only(
             steps.extend(
                 [
                     (
-                        (
-                            f"python -m scripts.generate_briefing "
-                            f"--date {period_label} --period-summary{force_flag}"
+                        python_module_command(
+                            "scripts.generate_briefing",
+                            "--date",
+                            period_label,
+                            "--period-summary",
+                            *force_args,
                         ),
                         f"Period Briefing Generation for {period_label}",
                     ),
                     (
-                        (
-                            f"python -m scripts.extract_facts "
-                            f"--date {period_label} --period-summary{force_flag}"
+                        python_module_command(
+                            "scripts.extract_facts",
+                            "--date",
+                            period_label,
+                            "--period-summary",
+                            *force_args,
                         ),
                         f"Period Facts Extraction for {period_label}",
                     ),
                 ]
             )
 
-    success_count = 0
-    for command, description in steps:
-        success, _ = run_command(command, description)
-        if success:
-            success_count += 1
+    if not LOGGER or not ERROR_HANDLER:
+        initialize_monitoring()
+
+    # Briefing and facts steps are independent LLM-bound jobs; two workers
+    # overlap each briefing with its facts extraction. A failed period must
+    # not cancel the others, so no step aborts the run
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            executor.map(lambda step: run_command(*step, required=False), steps)
+        )
+
+    success_count = sum(1 for success, _ in results if success)
 
     return success_count > 0
 
@@ -1045,6 +1624,7 @@ def run_rag_generation_only(
     force=False, date=None, backfill=False, days_back=None, period="monthly"
 ):
     """Run only the period-based RAG document generation steps."""
+    _reset_abort()
     # Determine processing mode and date range
     if date:
         # Use provided date
@@ -1063,14 +1643,20 @@ def run_rag_generation_only(
         start_date, end_date = today, today
         print("\n🔄 Running RAG document generation pipeline - DAILY MODE")
 
-    force_flag = " --force" if force else ""
+    force_args = ["--force"] if force else []
 
     if start_date == end_date:
         # Daily/single date mode
         steps = [
             (
-                f"python -m scripts.generate_rag_document --date {start_date} "
-                f"--organization prioritized{force_flag}",
+                python_module_command(
+                    "scripts.generate_rag_document",
+                    "--date",
+                    start_date,
+                    "--organization",
+                    "prioritized",
+                    *force_args,
+                ),
                 f"Prioritized RAG Document Generation for {start_date}",
             ),
         ]
@@ -1082,10 +1668,14 @@ def run_rag_generation_only(
         for period_start, period_end, period_label in period_chunks:
             steps.append(
                 (
-                    (
-                        f"python -m scripts.generate_rag_document "
-                        f"--date {period_label} --organization prioritized"
-                        f"{force_flag} --split-output"
+                    python_module_command(
+                        "scripts.generate_rag_document",
+                        "--date",
+                        period_label,
+                        "--organization",
+                        "prioritized",
+                        *force_args,
+                        "--split-output",
                     ),
                     (
                         f"Prioritized RAG Document Generation for {period_label} "
@@ -1094,9 +1684,10 @@ def run_rag_generation_only(
                 )
             )
 
+    # Each period is independent, so a failure must not cancel the rest
     success_count = 0
     for command, description in steps:
-        success, _ = run_command(command, description)
+        success, _ = run_command(command, description, required=False)
         if success:
             success_count += 1
 
@@ -1179,6 +1770,8 @@ def main():
 
     args = parser.parse_args()
 
+    install_signal_forwarding()
+
     if args.mode == "ingest":
         success = run_ingestion_only(
             backfill=args.backfill,
@@ -201,7 +201,11 @@ class SignalEnrichmentService:
         return max(0.0, min(1.0, final_score))
 
     def enrich_item(
-        self, item: Dict, author_field: str = "author", date_field: str = "date"
+        self,
+        item: Dict,
+        author_field: str = "author",
+        date_field: str = "date",
+        in_place: bool = False,
     ) -> Dict:
         """
         Enrich a data item with high-signal contributor metadata and scoring.
@@ -210,9 +214,11 @@ class SignalEnrichmentService:
             item: The data item to enrich
             author_field: The field name containing the author information
             date_field: The field name containing the publication date
+            in_place: Add the signal to item itself instead of a copy, for
+                callers that own freshly loaded items
 
         Returns:
-            The enriched item (original item is not modified)
+            The enriched item (original item is not modified unless in_place)
         """
         if not self.contributors:
             return item
@@ -222,7 +228,7 @@ class SignalEnrichmentService:
             return item
 
         # Create a copy to avoid modifying the original item
-        enriched_item = item.copy()
+        enriched_item = item if in_place else item.copy()
 
         # Get author weight
         author_weight = self.get_author_weight(author)
@@ -283,23 +289,19 @@ class SignalEnrichmentService:
 
         return [self.enrich_item(item, author_field, date_field) for item in items]
 
-    def sort_by_signal_priority(self, items: List[Dict]) -> List[Dict]:
+    def _signal_priority_key(self):
         """
-        Sort items by signal priority using final_score when available,
-        falling back to role-based priority.
-
-        Args:
-            items: List of items to sort
+        Build the sort key used for signal priority (lower sorts first).
 
-        Returns:
-            Sorted list of items (highest scores first)
+        Whether scoring is enabled is checked once here rather than per item.
         """
+        scoring_enabled = self.is_scoring_enabled()
 
         def signal_priority(item):
             signal = item.get("signal", {})
 
             # If scoring is enabled and final_score is available, use it
-            if self.is_scoring_enabled() and "final_score" in signal:
+            if scoring_enabled and "final_score" in signal:
                 # Return negative score for descending order (highest first)
                 return -signal["final_score"]
 
@@ -314,7 +316,52 @@ class SignalEnrichmentService:
             else:
                 return 3
 
-        return sorted(items, key=signal_priority)
+        return signal_priority
+
+    def sort_by_signal_priority(self, items: List[Dict]) -> List[Dict]:
+        """
+        Sort items by signal priority using final_score when available,
+        falling back to role-based priority.
+
+        Args:
+            items: List of items to sort
+
+        Returns:
+            Sorted list of items (highest scores first)
+        """
+        return sorted(items, key=self._signal_priority_key())
+
+    def enrich_and_sort(
+        self,
+        items: List[Dict],
+        author_field: str = "author",
+        date_field: str = "date",
+        in_place: bool = False,
+    ) -> List[Dict]:
+        """
+        Enrich items and sort them by signal priority in a single pass.
+
+        Equivalent to sort_by_signal_priority(enrich_items(...)), but the
+        enriched list is sorted in place instead of being copied again.
+
+        Args:
+            items: List of data items to enrich
+            author_field: The field name containing the author information
+            date_field: The field name containing the publication date
+            in_place: Enrich the item dicts themselves rather than copies
+
+        Returns:
+            New list of enriched items (highest scores first)
+        """
+        if self.contributors:
+            result = [
+                self.enrich_item(item, author_field, date_field, in_place)
+                for item in items
+            ]
+        else:
+            result = list(items)
+        result.sort(key=self._signal_priority_key())
+        return result
 
     def sort_by_final_score(self, items: List[Dict]) -> List[Dict]:
         """
@@ -3,7 +3,7 @@ import os
 import json
 import asyncio
 import argparse
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from dotenv import load_dotenv
 from telethon.sync import TelegramClient
@@ -307,7 +307,7 @@ async def fetch_group_messages(client, group, last_id):
 
 
 def save_raw_telegram_data(
-    messages, force_save=False, full_history=False, output_path=None
+    messages, force_save=False, full_history=False, output_path=None, run_date=None
 ):
     """Save raw Telegram messages to group-specific daily files grouped by message date.
 
@@ -316,7 +316,11 @@ def save_raw_telegram_data(
         force_save: If True, save empty file with metadata even when no messages
         full_history: If True, save to full_history.json instead of dated file
         output_path: Optional custom output file path
+        run_date: Date (YYYY-MM-DD) for status files and undated messages;
+            defaults to today
     """
+    run_date = run_date or date.today().isoformat()
+
     if full_history:
         date_str = "full_history"
 
@@ -448,7 +452,7 @@ def save_raw_telegram_data(
 
             # Save empty file with metadata
             empty_data_with_metadata = {
-                "date": datetime.now().strftime("%Y-%m-%d"),
+                "date": run_date,
                 "generated_at": datetime.now().isoformat(),
                 "source": "telegram",
                 "status": "no_new_content",
@@ -461,7 +465,7 @@ def save_raw_telegram_data(
                 },
             }
 
-            output_path = sources_dir / f"{datetime.now().strftime('%Y-%m-%d')}.json"
+            output_path = sources_dir / f"{run_date}.json"
             with open(output_path, "w", encoding="utf-8") as f:
                 json.dump(empty_data_with_metadata, f, indent=2, ensure_ascii=False)
 
@@ -502,7 +506,7 @@ def save_raw_telegram_data(
 
         # Handle messages with unknown dates - save them to today's file
         if messages_with_unknown_date:
-            today_date = datetime.now().strftime("%Y-%m-%d")
+            today_date = run_date
             for group_name, unknown_messages in messages_with_unknown_date.items():
                 if group_name not in messages_by_group_and_date:
                     messages_by_group_and_date[group_name] = {}
@@ -570,7 +574,7 @@ def save_raw_telegram_data(
         return saved_files
 
 
-async def main():
+async def main(argv=None):
     """Main async function to run Telegram message ingestion."""
     import sys
 
@@ -590,7 +594,13 @@ async def main():
         type=str,
         help="Custom output file path (optional). Uses default location if not set",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--run-date",
+        type=date.fromisoformat,
+        help="Pipeline run date (YYYY-MM-DD) used for dated files. Defaults to today",
+    )
+    args = parser.parse_args(argv)
+    run_date = (args.run_date or date.today()).isoformat()
 
     print("🔄 Starting Telegram message ingestion...")
     messages = await fetch_messages(full_history=args.full_history)
@@ -598,7 +608,11 @@ async def main():
     if messages is None:  # This means we skipped due to missing credentials/config
         # Still save empty file with metadata for consistency
         save_raw_telegram_data(
-            [], force_save=True, full_history=args.full_history, output_path=args.output
+            [],
+            force_save=True,
+            full_history=args.full_history,
+            output_path=args.output,
+            run_date=run_date,
         )
         print("\n🎉 Telegram ingestion complete!")
         sys.exit(2)  # Exit code 2 indicates "no new content" like Medium
@@ -626,6 +640,7 @@ async def main():
                     force_save=True,
                     full_history=args.full_history,
                     output_path=args.output,
+                    run_date=run_date,
                 )
                 print("\n🎉 Telegram ingestion complete!")
                 sys.exit(2)  # Exit code 2 indicates "no new content"
@@ -636,7 +651,10 @@ async def main():
             final_messages = messages
 
         save_raw_telegram_data(
-            final_messages, full_history=args.full_history, output_path=args.output
+            final_messages,
+            full_history=args.full_history,
+            output_path=args.output,
+            run_date=run_date,
         )
 
         if not args.force and len(messages) > len(final_messages):
@@ -650,7 +668,11 @@ async def main():
     else:
         # No messages found, but save empty file with metadata
         save_raw_telegram_data(
-            [], force_save=True, full_history=args.full_history, output_path=args.output
+            [],
+            force_save=True,
+            full_history=args.full_history,
+            output_path=args.output,
+            run_date=run_date,
         )
         print("\n🎉 Telegram ingestion complete!")
         sys.exit(2)  # No messages found, exit code 2 for "no new content"